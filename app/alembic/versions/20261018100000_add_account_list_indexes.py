@@ -0,0 +1,55 @@
+"""add account list indexes
+
+Revision ID: 8c1d2e4f6a10
+Revises: 3f43b8fa0610
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "8c1d2e4f6a10"
+down_revision: Union[str, Sequence[str], None] = "3f43b8fa0610"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the account table writable while the indexes build.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_account_disabled_id",
+            "account",
+            ["id"],
+            postgresql_where=sa.text("deleted_at IS NULL AND disabled_at IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_account_created_at_id",
+            "account",
+            ["created_at", "id"],
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_account_created_at_id",
+            table_name="account",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_account_disabled_id",
+            table_name="account",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
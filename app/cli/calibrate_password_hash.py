@@ -0,0 +1,41 @@
+import argparse
+
+from app.core.config import config
+from app.core.crypto import measure_hash_seconds
+
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+
+
+def suggest_rounds(
+    target_ms: float, samples: int
+) -> tuple[int, list[tuple[int, float]]]:
+    measurements = []
+    suggested = MIN_ROUNDS
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        duration_ms = measure_hash_seconds(rounds, samples) * 1000
+        measurements.append((rounds, duration_ms))
+        if duration_ms > target_ms:
+            break
+        suggested = rounds
+    return suggested, measurements
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure bcrypt cost on this machine and suggest "
+        "PASSWORD_HASH_ROUNDS for a target hash latency.",
+    )
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args()
+
+    suggested, measurements = suggest_rounds(args.target_ms, args.samples)
+    for rounds, duration_ms in measurements:
+        print(f"rounds={rounds:<3} median={duration_ms:8.1f} ms")
+    print(f"current PASSWORD_HASH_ROUNDS={config.PASSWORD_HASH_ROUNDS}")
+    print(f"suggested PASSWORD_HASH_ROUNDS={suggested} (target {args.target_ms:g} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import argparse
+import csv
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator, TextIO
+
+from pydantic import ValidationError
+from pydantic_core import to_json
+
+from app.core.database import SessionLocal
+from app.handler.dto.accounts import PostAccountRequest
+from app.usecase.accounts.create import CreateAccountInput
+from app.usecase.accounts.import_accounts import (
+    ImportAccountResult,
+    ImportAccountsUsecase,
+)
+
+COLUMNS = ("login_id", "email", "password", "first_name", "last_name")
+
+
+def read_rows(stream: TextIO) -> Iterator[tuple[int, dict[str, str | None]]]:
+    reader = csv.DictReader(stream)
+    if reader.fieldnames:
+        # Files are opened as utf-8-sig, but stdin may still carry the BOM.
+        reader.fieldnames[0] = reader.fieldnames[0].removeprefix("\ufeff")
+    for row in reader:
+        # Empty cells mean "not provided", as an omitted JSON field would.
+        yield reader.line_num, {key: row.get(key) or None for key in COLUMNS}
+
+
+def parse_row(row: dict[str, str | None]) -> CreateAccountInput | str:
+    try:
+        request = PostAccountRequest.model_validate(row)
+    except ValidationError as exc:
+        # Field names only: the rejected input may be a password.
+        fields = sorted(
+            {str(error["loc"][0]) for error in exc.errors() if error["loc"]}
+        )
+        return f"VALIDATION_ERROR: {', '.join(fields)}"
+    return CreateAccountInput(
+        login_id=request.login_id,
+        email=request.email,
+        password=request.password,
+        first_name=request.first_name,
+        last_name=request.last_name,
+    )
+
+
+def import_batch(
+    usecase: ImportAccountsUsecase,
+    rows: list[tuple[int, dict[str, str | None]]],
+) -> Iterator[tuple[int, ImportAccountResult]]:
+    parsed = [(line, parse_row(row)) for line, row in rows]
+    valid = [(line, input) for line, input in parsed if not isinstance(input, str)]
+    results = usecase.execute([input for _, input in valid]) if valid else []
+    outcomes = dict(zip((line for line, _ in valid), results))
+    for line, input in parsed:
+        if isinstance(input, str):
+            yield line, ImportAccountResult("invalid", error=input)
+        else:
+            yield line, outcomes[line]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Create accounts from a CSV file with the columns "
+        f"{', '.join(COLUMNS)}. Writes one JSON result per row to stdout.",
+    )
+    parser.add_argument("path", help="CSV file, or - for stdin")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="password hashing threads; bcrypt releases the GIL",
+    )
+    args = parser.parse_args()
+
+    stream = (
+        sys.stdin
+        if args.path == "-"
+        else open(args.path, newline="", encoding="utf-8-sig")
+    )
+    totals: Counter[str] = Counter()
+    with (
+        stream,
+        ThreadPoolExecutor(args.workers, "import-hasher") as executor,
+        SessionLocal() as db,
+    ):
+        usecase = ImportAccountsUsecase(db, executor)
+        rows = read_rows(stream)
+        while batch := list(islice(rows, args.batch_size)):
+            for line, result in import_batch(usecase, batch):
+                totals[result.status] += 1
+                report = {"line": line, **vars(result)}
+                sys.stdout.write(to_json(report).decode() + "\n")
+            sys.stdout.flush()
+
+    summary = " ".join(f"{status}={totals[status]}" for status in sorted(totals))
+    print(summary or "no rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
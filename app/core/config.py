@@ -15,6 +15,14 @@ class Config(BaseSettings):
     # === アプリ環境設定 ===
     APP_ENV: Literal["dev", "production", "test"] = "dev"
     LOG_LEVEL: str = "INFO"
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_QUEUE_FULL_POLICY: Literal["drop", "block"] = "drop"
+    LOG_MAX_FIELD_LENGTH: int = 2048
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+    ACCESS_LOG_PATH_SAMPLE_RATES: Annotated[dict[str, float], NoDecode] = {
+        "/health": 0.0
+    }
+    ACCESS_LOG_SLOW_MS: int = 1000
     ENABLE_SIGNUP: bool = True
     AUTH_LOGIN_ID_MODE: Literal["email", "login_id"] = "email"
     FRONTEND_ORIGINS: Annotated[list[str], NoDecode] = [
@@ -26,13 +34,51 @@ class Config(BaseSettings):
     DATABASE_URL: str = (
         "postgresql+psycopg://postgres:postgres@db:5432/project_db?sslmode=disable"
     )
+    DATABASE_MODE: Literal["sync", "async"] = "sync"
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_POOL_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT_SECONDS: float = 30.0
+    DATABASE_POOL_RECYCLE_SECONDS: int = -1
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_POOL_USE_LIFO: bool = False
+    DATABASE_REPLICA_URLS: Annotated[list[str], NoDecode] = []
+    DATABASE_PRIMARY_PIN_SECONDS: int = 5
 
     # === 認証関連設定 ===
+    ACCESS_TOKEN_ALGORITHM: Literal["HS256", "EdDSA", "ES256"] = "HS256"
     ACCESS_TOKEN_SECRET: str = "dev-only-access-token-secret-at-least-32-bytes"
+    ACCESS_TOKEN_PRIVATE_KEY: str | None = None
+    ACCESS_TOKEN_KEY_ID: str | None = None
+    ACCESS_TOKEN_PREVIOUS_PUBLIC_KEY: str | None = None
+    ACCESS_TOKEN_PREVIOUS_KEY_ID: str | None = None
     ACCESS_TOKEN_EXPIRES_SECONDS: int = 900
+    ACCESS_TOKEN_MEMO_SIZE: int = 10000
     REFRESH_TOKEN_SECRET: str = "dev-only-refresh-token-secret-at-least-32-bytes"
     REFRESH_TOKEN_EXPIRES_SECONDS: int = 2592000
     REFRESH_TOKEN_REMEMBER_ME_EXPIRES_SECONDS: int = 2592000
+    ACCOUNT_AUTH_STATE_CACHE_SIZE: int = 10000
+    ACCOUNT_AUTH_STATE_CACHE_TTL_SECONDS: float = 5.0
+
+    # === 変更イベント ===
+    CHANGE_EVENTS_ENABLED: bool = True
+    CHANGE_EVENTS_CHANNEL: str = "app_change_events"
+
+    # === レスポンス圧縮 ===
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # === 監視 ===
+    METRICS_TOKEN: str | None = None
+    METRICS_MULTIPROC_DIR: str | None = None
+    METRICS_FLUSH_SECONDS: float = 5.0
+
+    # === パスワードハッシュ ===
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 16
+    PASSWORD_HASH_ROUNDS: int = 12
 
     # === パスワード再設定 ===
     PASSWORD_RESET_URL_BASE: str = "http://localhost:3000/reset-password"
@@ -47,35 +93,157 @@ class Config(BaseSettings):
     SMTP_USERNAME: str | None = None
     SMTP_PASSWORD: str | None = None
     SMTP_USE_TLS: bool = True
+    SMTP_TIMEOUT_SECONDS: float = 30.0
+    MAIL_OUTBOX_DISPATCH_ENABLED: bool = True
+    MAIL_OUTBOX_SECRET: str = "dev-only-mail-outbox-secret-at-least-32-bytes"
+    MAIL_OUTBOX_POLL_SECONDS: float = 5.0
+    MAIL_OUTBOX_BATCH_SIZE: int = 50
+    MAIL_OUTBOX_MAX_ATTEMPTS: int = 8
+    MAIL_OUTBOX_RETRY_BASE_SECONDS: float = 30.0
+    MAIL_OUTBOX_RETRY_MAX_SECONDS: float = 3600.0
 
-    @field_validator("APP_ENV", "AUTH_LOGIN_ID_MODE", "MAIL_PROVIDER", mode="before")
+    @field_validator(
+        "APP_ENV",
+        "AUTH_LOGIN_ID_MODE",
+        "DATABASE_MODE",
+        "LOG_QUEUE_FULL_POLICY",
+        "MAIL_PROVIDER",
+        "PASSWORD_HASH_EXECUTOR",
+        mode="before",
+    )
     @classmethod
     def normalize_choices(cls, value: str) -> str:
         return value.strip().lower() if isinstance(value, str) else value
 
-    @field_validator("FRONTEND_ORIGINS", mode="before")
+    @field_validator("FRONTEND_ORIGINS", "DATABASE_REPLICA_URLS", mode="before")
     @classmethod
-    def parse_frontend_origins(cls, value: str | list[str]) -> list[str]:
+    def parse_comma_separated(cls, value: str | list[str]) -> list[str]:
         if isinstance(value, str):
-            return [origin.strip() for origin in value.split(",") if origin.strip()]
-        return [origin.strip() for origin in value if origin.strip()]
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return [item.strip() for item in value if item.strip()]
 
-    @field_validator("SMTP_HOST", "SMTP_USERNAME", "SMTP_PASSWORD", mode="before")
+    @field_validator("ACCESS_LOG_PATH_SAMPLE_RATES", mode="before")
+    @classmethod
+    def parse_path_rates(cls, value: str | dict[str, float]) -> dict[str, float]:
+        # "/health=0,/api/accounts=0.1"
+        if not isinstance(value, str):
+            return value
+        rates = {}
+        for item in value.split(","):
+            if not item.strip():
+                continue
+            path, separator, rate = item.partition("=")
+            if not separator:
+                raise ValueError(f"expected path=rate, got {item.strip()!r}")
+            rates[path.strip()] = float(rate)
+        return rates
+
+    @field_validator(
+        "SMTP_HOST",
+        "SMTP_USERNAME",
+        "SMTP_PASSWORD",
+        "ACCESS_TOKEN_PRIVATE_KEY",
+        "ACCESS_TOKEN_KEY_ID",
+        "ACCESS_TOKEN_PREVIOUS_PUBLIC_KEY",
+        "ACCESS_TOKEN_PREVIOUS_KEY_ID",
+        "METRICS_TOKEN",
+        "METRICS_MULTIPROC_DIR",
+        mode="before",
+    )
     @classmethod
     def empty_string_to_none(cls, value: str | None) -> str | None:
         if isinstance(value, str) and not value.strip():
             return None
         return value
 
+    @field_validator(
+        "ACCESS_TOKEN_PRIVATE_KEY",
+        "ACCESS_TOKEN_PREVIOUS_PUBLIC_KEY",
+        mode="after",
+    )
+    @classmethod
+    def unescape_pem_newlines(cls, value: str | None) -> str | None:
+        # Single-line environment variables may carry PEM keys with "\n" escapes.
+        return value.replace("\\n", "\n") if value else value
+
     @model_validator(mode="after")
     def validate_production_settings(self):
         if self.APP_ENV == "production":
-            self._validate_production_secret("ACCESS_TOKEN_SECRET")
+            if self.ACCESS_TOKEN_ALGORITHM == "HS256":
+                self._validate_production_secret("ACCESS_TOKEN_SECRET")
             self._validate_production_secret("REFRESH_TOKEN_SECRET")
+            self._validate_production_secret("MAIL_OUTBOX_SECRET")
             self._validate_production_frontend_origins()
 
+        if self.DATABASE_POOL_SIZE < 1:
+            raise ValueError("DATABASE_POOL_SIZE must be at least 1")
+        if self.DATABASE_POOL_MAX_OVERFLOW < 0:
+            raise ValueError("DATABASE_POOL_MAX_OVERFLOW must not be negative")
+        if self.DATABASE_POOL_TIMEOUT_SECONDS <= 0:
+            raise ValueError("DATABASE_POOL_TIMEOUT_SECONDS must be positive")
+        if self.DATABASE_PRIMARY_PIN_SECONDS < 0:
+            raise ValueError("DATABASE_PRIMARY_PIN_SECONDS must not be negative")
+
+        if self.LOG_QUEUE_SIZE < 0:
+            raise ValueError("LOG_QUEUE_SIZE must not be negative")
+        if self.LOG_MAX_FIELD_LENGTH < 0:
+            raise ValueError("LOG_MAX_FIELD_LENGTH must not be negative")
+        rates = [
+            self.ACCESS_LOG_SAMPLE_RATE,
+            *self.ACCESS_LOG_PATH_SAMPLE_RATES.values(),
+        ]
+        if not all(0.0 <= rate <= 1.0 for rate in rates):
+            raise ValueError("access log sample rates must be between 0 and 1")
+
+        if self.METRICS_FLUSH_SECONDS <= 0:
+            raise ValueError("METRICS_FLUSH_SECONDS must be positive")
+
+        if self.COMPRESSION_MINIMUM_SIZE < 0:
+            raise ValueError("COMPRESSION_MINIMUM_SIZE must not be negative")
+        if not 1 <= self.COMPRESSION_GZIP_LEVEL <= 9:
+            raise ValueError("COMPRESSION_GZIP_LEVEL must be between 1 and 9")
+        if not 1 <= self.COMPRESSION_ZSTD_LEVEL <= 22:
+            raise ValueError("COMPRESSION_ZSTD_LEVEL must be between 1 and 22")
+
+        if self.PASSWORD_HASH_WORKERS < 1:
+            raise ValueError("PASSWORD_HASH_WORKERS must be at least 1")
+        if self.PASSWORD_HASH_QUEUE_SIZE < 0:
+            raise ValueError("PASSWORD_HASH_QUEUE_SIZE must not be negative")
+        if not 4 <= self.PASSWORD_HASH_ROUNDS <= 31:
+            raise ValueError("PASSWORD_HASH_ROUNDS must be between 4 and 31")
+
+        if self.ACCESS_TOKEN_ALGORITHM != "HS256" and not self.ACCESS_TOKEN_PRIVATE_KEY:
+            raise ValueError(
+                "ACCESS_TOKEN_PRIVATE_KEY is required when ACCESS_TOKEN_ALGORITHM "
+                f"is {self.ACCESS_TOKEN_ALGORITHM}"
+            )
+        if bool(self.ACCESS_TOKEN_PREVIOUS_PUBLIC_KEY) != bool(
+            self.ACCESS_TOKEN_PREVIOUS_KEY_ID
+        ):
+            raise ValueError(
+                "ACCESS_TOKEN_PREVIOUS_PUBLIC_KEY and ACCESS_TOKEN_PREVIOUS_KEY_ID "
+                "must be set together"
+            )
+
         if self.MAIL_PROVIDER == "smtp" and not self.SMTP_HOST:
             raise ValueError("SMTP_HOST is required when MAIL_PROVIDER=smtp")
+        if self.SMTP_TIMEOUT_SECONDS <= 0:
+            raise ValueError("SMTP_TIMEOUT_SECONDS must be positive")
+        if self.MAIL_OUTBOX_POLL_SECONDS <= 0:
+            raise ValueError("MAIL_OUTBOX_POLL_SECONDS must be positive")
+        if self.MAIL_OUTBOX_BATCH_SIZE < 1:
+            raise ValueError("MAIL_OUTBOX_BATCH_SIZE must be at least 1")
+        if self.MAIL_OUTBOX_MAX_ATTEMPTS < 1:
+            raise ValueError("MAIL_OUTBOX_MAX_ATTEMPTS must be at least 1")
+        if (
+            not 0
+            < self.MAIL_OUTBOX_RETRY_BASE_SECONDS
+            <= (self.MAIL_OUTBOX_RETRY_MAX_SECONDS)
+        ):
+            raise ValueError(
+                "MAIL_OUTBOX_RETRY_BASE_SECONDS must be positive and at most "
+                "MAIL_OUTBOX_RETRY_MAX_SECONDS"
+            )
 
         return self
 
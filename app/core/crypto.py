@@ -1,23 +1,216 @@
+import asyncio
+import base64
 import bcrypt
 import hashlib
+import multiprocessing
 import secrets
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Callable
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from app.core.config import config
+from app.core.error import AppError, ErrorCode
+from app.core.metrics import register_collector
+
+
+class PasswordHasher:
+    def __init__(self, mode: str, workers: int, queue_size: int):
+        self.mode = mode
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        try:
+            submitted_at = time.perf_counter()
+            future = self._get_executor().submit(_timed_call, fn, *args)
+            return self._complete(submitted_at, *future.result())
+        finally:
+            self._release()
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        try:
+            submitted_at = time.perf_counter()
+            future = self._get_executor().submit(_timed_call, fn, *args)
+            return self._complete(submitted_at, *await asyncio.wrap_future(future))
+        finally:
+            self._release()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "workers": self.workers,
+                "capacity": self.capacity,
+                "in_flight": self.in_flight,
+                "queue_depth": max(self.in_flight - self.workers, 0),
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _acquire(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise AppError(code=ErrorCode.PASSWORD_HASHER_BUSY)
+        with self._lock:
+            self.in_flight += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def _complete(self, submitted_at: float, run_seconds: float, result: Any) -> Any:
+        wait_seconds = max(time.perf_counter() - submitted_at - run_seconds, 0.0)
+        with self._lock:
+            self.completed += 1
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        return result
+
+    def _get_executor(self) -> Executor:
+        # Created lazily so that process pools are never forked from a parent
+        # that has not started serving yet.
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = self._create_executor()
+        return self._executor
+
+    def _create_executor(self) -> Executor:
+        if self.mode == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="password-hasher",
+        )
+
+
+def _timed_call(fn: Callable[..., Any], *args: Any) -> tuple[float, Any]:
+    started_at = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started_at, result
+
+
+def _bcrypt_hash(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _bcrypt_check(password: bytes, hashed: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed)
+
+
+password_hasher = PasswordHasher(
+    mode=config.PASSWORD_HASH_EXECUTOR,
+    workers=config.PASSWORD_HASH_WORKERS,
+    queue_size=config.PASSWORD_HASH_QUEUE_SIZE,
+)
+register_collector("password_hasher", password_hasher.stats)
 
 
 def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode(), salt).decode()
+    return password_hasher.run(
+        _bcrypt_hash,
+        password.encode(),
+        config.PASSWORD_HASH_ROUNDS,
+    ).decode()
+
+
+async def hash_password_async(password: str) -> str:
+    hashed = await password_hasher.run_async(
+        _bcrypt_hash,
+        password.encode(),
+        config.PASSWORD_HASH_ROUNDS,
+    )
+    return hashed.decode()
+
+
+def hash_passwords(passwords: list[str], executor: Executor) -> list[str]:
+    # For bulk jobs: fans out over the caller's pool instead of going through
+    # password_hasher, whose admission limit exists to protect request latency.
+    hashes = executor.map(
+        _bcrypt_hash,
+        [password.encode() for password in passwords],
+        repeat(config.PASSWORD_HASH_ROUNDS),
+    )
+    return [hashed.decode() for hashed in hashes]
 
 
 def verify_password(plain: str, hashed: str) -> bool:
     try:
-        return bcrypt.checkpw(plain.encode(), hashed.encode())
+        return password_hasher.run(_bcrypt_check, plain.encode(), hashed.encode())
     except ValueError:
         return False
 
 
+def password_hash_rounds(hashed: str) -> int | None:
+    # bcrypt hashes look like $2b$12$<salt and digest>.
+    parts = hashed.split("$", 3)
+    if len(parts) != 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(hashed: str) -> bool:
+    rounds = password_hash_rounds(hashed)
+    return rounds is not None and rounds != config.PASSWORD_HASH_ROUNDS
+
+
+def measure_hash_seconds(rounds: int, samples: int = 3) -> float:
+    durations = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        _bcrypt_hash(b"calibration-password", rounds)
+        durations.append(time.perf_counter() - started_at)
+    return sorted(durations)[len(durations) // 2]
+
+
 def hash_token(token: str) -> str:
     return hashlib.sha256(token.encode()).hexdigest()
 
 
 def generate_token(byte_length: int = 48) -> str:
     return secrets.token_urlsafe(byte_length)
+
+
+def encrypt_text(text: str, secret: str) -> str:
+    return _fernet(secret).encrypt(text.encode()).decode()
+
+
+def decrypt_text(token: str, secret: str) -> str | None:
+    # None when the token was not produced with this secret, e.g. after the
+    # secret was rotated.
+    try:
+        return _fernet(secret).decrypt(token.encode()).decode()
+    except InvalidToken:
+        return None
+
+
+def _fernet(secret: str) -> Fernet:
+    # Fernet takes 32 url-safe base64 encoded bytes, not an arbitrary string.
+    return Fernet(base64.urlsafe_b64encode(hashlib.sha256(secret.encode()).digest()))
@@ -1,19 +1,199 @@
 import importlib
 import pkgutil
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable
 
 import app.module
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from fastapi import Depends, Request
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import config
+from app.core.metrics import Histogram, register_collector
 
 Base = declarative_base()
 
+_AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+
+def after_commit(db: Session | AsyncSession, callback: Callable[[], None]) -> None:
+    db.info.setdefault(_AFTER_COMMIT_CALLBACKS, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_CALLBACKS, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_CALLBACKS, None)
+
+
+_READ_ONLY = "read_only"
+
+
+@event.listens_for(Session, "after_begin")
+def _begin_read_only_transaction(session: Session, transaction, connection) -> None:
+    if session.info.get(_READ_ONLY) and connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    duration_ns: int = 0
+
+
+# Set per request by SecurityMiddleware. The object is shared, not copied, so
+# statements run in threadpool workers and greenlets count towards it too.
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+_QUERY_STARTED = "query_started_ns"
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if query_stats.get() is not None:
+        conn.info.setdefault(_QUERY_STARTED, []).append(time.perf_counter_ns())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats.get()
+    started = conn.info.get(_QUERY_STARTED)
+    if stats is None or not started:
+        return
+    stats.statements += 1
+    stats.duration_ns += time.perf_counter_ns() - started.pop()
+
+
+@event.listens_for(Engine, "handle_error")
+def _record_failed_query(context) -> None:
+    # after_cursor_execute does not run for failed statements.
+    connection = context.connection
+    stats = query_stats.get()
+    started = connection.info.get(_QUERY_STARTED) if connection is not None else None
+    if stats is None or not started:
+        return
+    stats.statements += 1
+    stats.duration_ns += time.perf_counter_ns() - started.pop()
+
+
 for module_info in pkgutil.walk_packages(app.module.__path__, "app.module."):
     if module_info.name.endswith(".model"):
         importlib.import_module(module_info.name)
 
-engine = create_engine(config.DATABASE_URL, pool_pre_ping=True, future=True)
+# Seconds spent waiting for a pooled connection, including connects for new ones.
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.checkout_wait_seconds = Histogram(POOL_WAIT_BUCKETS)
+        self._lock = threading.Lock()
+        self.checkout_timeouts = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def record_invalidation(self, soft: bool) -> None:
+        with self._lock:
+            if soft:
+                self.soft_invalidations += 1
+            else:
+                self.invalidations += 1
+
+
+class _InstrumentedPoolMixin:
+    # Keep pool logs under sqlalchemy.* instead of the "app" logger tree.
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.QueuePool"
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.checkout_wait_seconds.observe(time.perf_counter() - started_at)
+        return connection
+
+    def recreate(self):
+        # dispose() swaps in a fresh pool; keep counting into the same metrics.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_options() -> dict[str, Any]:
+    return {
+        "pool_size": config.DATABASE_POOL_SIZE,
+        "max_overflow": config.DATABASE_POOL_MAX_OVERFLOW,
+        "pool_timeout": config.DATABASE_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": config.DATABASE_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": config.DATABASE_POOL_PRE_PING,
+        "pool_use_lifo": config.DATABASE_POOL_USE_LIFO,
+    }
+
+
+def _instrument_pool(name: str, engine: Engine) -> None:
+    metrics = engine.pool.metrics = PoolMetrics()
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.record_invalidation(soft=False)
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_connection, connection_record, exception):
+        metrics.record_invalidation(soft=True)
+
+    register_collector(name, lambda: pool_stats(engine))
+
+
+def pool_stats(engine: Engine) -> dict[str, Any]:
+    pool = engine.pool
+    metrics = pool.metrics
+    return {
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # QueuePool.overflow() starts at -size and counts up as connections open.
+        "overflow_in_use": max(pool.overflow(), 0),
+        "checkout_timeouts": metrics.checkout_timeouts,
+        "invalidations": metrics.invalidations,
+        "soft_invalidations": metrics.soft_invalidations,
+        "checkout_wait_seconds": metrics.checkout_wait_seconds.snapshot(),
+    }
+
+
+engine = create_engine(
+    config.DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    future=True,
+    **_pool_options(),
+)
+_instrument_pool("database_pool", engine)
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
@@ -23,9 +203,97 @@ SessionLocal = sessionmaker(
 )
 
 
+replica_engines = [
+    create_engine(url, poolclass=InstrumentedQueuePool, future=True, **_pool_options())
+    for url in config.DATABASE_REPLICA_URLS
+]
+for index, replica_engine in enumerate(replica_engines):
+    _instrument_pool(f"database_replica_pool_{index}", replica_engine)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_read_db(request: Request, db: Session = Depends(get_db)):
+    # Read-only usecases go to a replica unless the client recently wrote.
+    # On the primary the request's own session is reused: the auth lookup has
+    # already checked out a connection through it, and a second session would
+    # hold another one from the same pool.
+    if not replica_engines or is_pinned_to_primary(request):
+        yield db
+        return
+    replica_db = SessionLocal(
+        bind=random.choice(replica_engines), info={_READ_ONLY: True}
+    )
+    try:
+        yield replica_db
+    finally:
+        replica_db.close()
+
+
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+
+
+def is_pinned_to_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def primary_pin_cookie() -> str | None:
+    # Read-your-writes: replicas may lag behind the write this client just made.
+    # Returns a Set-Cookie value so ASGI middleware can append it directly.
+    seconds = config.DATABASE_PRIMARY_PIN_SECONDS
+    if not replica_engines or seconds <= 0:
+        return None
+    cookie = (
+        f"{PRIMARY_PIN_COOKIE}={int(time.time()) + seconds}; HttpOnly; "
+        f"Max-Age={seconds}; Path=/; SameSite=lax"
+    )
+    return cookie + "; Secure" if config.APP_ENV == "production" else cookie
+
+
+# The psycopg dialect resolves to its async variant under create_async_engine.
+async_engine = create_async_engine(
+    config.DATABASE_URL,
+    poolclass=InstrumentedAsyncQueuePool,
+    **_pool_options(),
+)
+_instrument_pool("database_async_pool", async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async_replica_engines = [
+    create_async_engine(url, poolclass=InstrumentedAsyncQueuePool, **_pool_options())
+    for url in config.DATABASE_REPLICA_URLS
+]
+for index, replica_engine in enumerate(async_replica_engines):
+    _instrument_pool(
+        f"database_async_replica_pool_{index}",
+        replica_engine.sync_engine,
+    )
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db(request: Request, db: AsyncSession = Depends(get_async_db)):
+    if not async_replica_engines or is_pinned_to_primary(request):
+        yield db
+        return
+    bind = random.choice(async_replica_engines)
+    async with AsyncSessionLocal(bind=bind, info={_READ_ONLY: True}) as replica_db:
+        yield replica_db
@@ -35,8 +35,10 @@ class ErrorCode(str, Enum):
 
     # Common
     FORBIDDEN = "FORBIDDEN"
+    INVALID_CURSOR = "INVALID_CURSOR"
     INVALID_STATE = "INVALID_STATE"
     OPTIMISTIC_LOCK_CONFLICT = "OPTIMISTIC_LOCK_CONFLICT"
+    PASSWORD_HASHER_BUSY = "PASSWORD_HASHER_BUSY"
 
     # Accounts
     LOGIN_ID_ALREADY_EXISTS = "LOGIN_ID_ALREADY_EXISTS"
@@ -76,6 +78,7 @@ APP_ERROR_CODE_KINDS: dict[str, AppErrorKind] = {
     ErrorCode.EMAIL_ALREADY_EXISTS.value: AppErrorKind.CONFLICT,
     ErrorCode.LOGIN_ID_ALREADY_EXISTS.value: AppErrorKind.CONFLICT,
     ErrorCode.OPTIMISTIC_LOCK_CONFLICT.value: AppErrorKind.CONFLICT,
+    ErrorCode.PASSWORD_HASHER_BUSY.value: AppErrorKind.SERVICE_UNAVAILABLE,
 }
 
 
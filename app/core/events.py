@@ -0,0 +1,172 @@
+import json
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Hashable
+
+import psycopg
+from psycopg import sql
+from sqlalchemy import ARRAY, Text, bindparam, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import config
+from app.core.logger import logger
+
+_PENDING_CHANGES = "pending_change_events"
+# NOTIFY payloads must stay below 8000 bytes.
+_MAX_KEYS_PER_NOTIFICATION = 200
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    topic: str
+    # None means events may have been missed and everything for the topic is stale.
+    keys: tuple[Hashable, ...] | None
+
+
+_subscribers: dict[str, list[Callable[[ChangeEvent], None]]] = defaultdict(list)
+
+
+def subscribe(topic: str, callback: Callable[[ChangeEvent], None]) -> None:
+    _subscribers[topic].append(callback)
+
+
+def dispatch(change: ChangeEvent) -> None:
+    for callback in list(_subscribers.get(change.topic, ())):
+        try:
+            callback(change)
+        except Exception:
+            logger.exception(
+                "change event subscriber failed",
+                extra={"topic": change.topic},
+            )
+
+
+def publish_change(db: Session | AsyncSession, topic: str, key: Hashable) -> None:
+    changes = db.info.setdefault(_PENDING_CHANGES, {})
+    changes.setdefault(topic, {})[key] = None
+
+
+def build_payloads(changes: dict[str, dict[Hashable, None]]) -> list[str]:
+    payloads = []
+    for topic, keys in changes.items():
+        keys = list(keys)
+        for start in range(0, len(keys), _MAX_KEYS_PER_NOTIFICATION):
+            chunk = keys[start : start + _MAX_KEYS_PER_NOTIFICATION]
+            payloads.append(
+                json.dumps({"topic": topic, "keys": chunk}, separators=(",", ":"))
+            )
+    return payloads
+
+
+def parse_payload(payload: str) -> ChangeEvent | None:
+    try:
+        data = json.loads(payload)
+        return ChangeEvent(topic=data["topic"], keys=tuple(data["keys"]))
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+_NOTIFY_ALL = text(
+    "SELECT pg_notify(:channel, payload) FROM unnest(:payloads) AS payload"
+).bindparams(bindparam("payloads", type_=ARRAY(Text)))
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_pending_changes(session: Session) -> None:
+    changes = session.info.pop(_PENDING_CHANGES, None)
+    if not changes or not config.CHANGE_EVENTS_ENABLED:
+        return
+    if session.get_bind().dialect.name != "postgresql":
+        return
+
+    # NOTIFY is transactional: listeners receive it only if this commit succeeds.
+    # All payloads go in one statement, so bulk changes that need many of them
+    # still cost a single round trip.
+    session.execute(
+        _NOTIFY_ALL,
+        {"channel": config.CHANGE_EVENTS_CHANNEL, "payloads": build_payloads(changes)},
+    )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES, None)
+
+
+class ChangeEventListener:
+    def __init__(self, database_url: str, channel: str):
+        self.conninfo = (
+            make_url(database_url)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self.channel = channel
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="change-event-listener",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        backoff = 1.0
+        connected_before = False
+        while not self._stopping.is_set():
+            try:
+                with psycopg.connect(
+                    self.conninfo,
+                    autocommit=True,
+                    connect_timeout=10,
+                ) as conn:
+                    conn.execute(
+                        sql.SQL("LISTEN {}").format(sql.Identifier(self.channel))
+                    )
+                    if connected_before:
+                        _reset_subscribers()
+                    connected_before = True
+                    backoff = 1.0
+                    self._listen(conn)
+            except psycopg.Error as exc:
+                logger.warning(
+                    "change event listener disconnected",
+                    extra={"error_class": type(exc).__name__},
+                )
+                self._stopping.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _listen(self, conn: psycopg.Connection) -> None:
+        while not self._stopping.is_set():
+            for notify in conn.notifies(timeout=1.0):
+                change = parse_payload(notify.payload)
+                if change is None:
+                    logger.warning("malformed change event ignored")
+                    continue
+                dispatch(change)
+
+
+def _reset_subscribers() -> None:
+    for topic in list(_subscribers):
+        dispatch(ChangeEvent(topic=topic, keys=None))
+
+
+change_event_listener = ChangeEventListener(
+    config.DATABASE_URL,
+    config.CHANGE_EVENTS_CHANNEL,
+)
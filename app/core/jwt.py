@@ -1,33 +1,225 @@
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
-from uuid import uuid4
+import base64
+import binascii
+import hashlib
+import hmac
+import os
+import time
+from typing import Any, Optional, Tuple
 
 import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
 from fastapi import Header, Cookie
 from jwt import InvalidTokenError
+from jwt.algorithms import get_default_algorithms
+from pydantic_core import from_json, to_json
 
+from app.core.cache import TTLCache
 from app.core.config import config
 from app.core.error import AppError, ErrorCode
+from app.core.metrics import register_collector
 
 ALGORITHM = "HS256"
 
 
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class HS256Codec:
+    # Same header bytes as PyJWT, so tokens issued by either path decode here.
+    HEADER = _b64encode(b'{"alg":"HS256","typ":"JWT"}')
+
+    def __init__(self, secret: str):
+        self.secret = secret
+        self._mac = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+        self._prefix = self.HEADER + b"."
+        self._header = self.HEADER.decode()
+
+    def encode(self, payload: dict) -> str:
+        signing_input = self._prefix + _b64encode(to_json(payload))
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode()
+
+    def decode(self, token: str) -> Optional[dict]:
+        signing_input, _, signature = token.rpartition(".")
+        header, _, body = signing_input.partition(".")
+        if header != self._header:
+            return self._decode_generic(token)
+
+        try:
+            expected = self._sign(signing_input.encode("ascii"))
+            if not hmac.compare_digest(expected, _b64decode(signature)):
+                return None
+            payload = from_json(_b64decode(body))
+        except (ValueError, binascii.Error):
+            return None
+
+        if not isinstance(payload, dict) or not _claims_are_valid(payload):
+            return None
+        return payload
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def _decode_generic(self, token: str) -> Optional[dict]:
+        try:
+            return jwt.decode(token, self.secret, algorithms=[ALGORITHM])
+        except InvalidTokenError:
+            return None
+
+    def jwks(self) -> dict:
+        return {"keys": []}
+
+
+class AsymmetricCodec:
+    KEY_TYPES = {
+        "EdDSA": ed25519.Ed25519PrivateKey,
+        "ES256": ec.EllipticCurvePrivateKey,
+    }
+
+    def __init__(
+        self,
+        algorithm: str,
+        private_key_pem: str,
+        key_id: str | None = None,
+        previous_public_keys: dict[str, str] | None = None,
+    ):
+        private_key = load_pem_private_key(private_key_pem.encode(), password=None)
+        if not isinstance(private_key, self.KEY_TYPES[algorithm]) or (
+            algorithm == "ES256" and private_key.curve.name != "secp256r1"
+        ):
+            raise ValueError(f"ACCESS_TOKEN_PRIVATE_KEY is not a {algorithm} key")
+
+        self.algorithm = algorithm
+        self._jwa = get_default_algorithms()[algorithm]
+        self._signing_key = private_key
+        public_key = private_key.public_key()
+        self.key_id = key_id or _jwk_thumbprint(
+            self._jwa.to_jwk(public_key, as_dict=True)
+        )
+        self._headers = {"kid": self.key_id}
+        self._verification_keys = {self.key_id: public_key}
+        for previous_key_id, public_key_pem in (previous_public_keys or {}).items():
+            self._verification_keys[previous_key_id] = load_pem_public_key(
+                public_key_pem.encode()
+            )
+
+    def encode(self, payload: dict) -> str:
+        return jwt.encode(
+            payload,
+            self._signing_key,
+            algorithm=self.algorithm,
+            headers=self._headers,
+        )
+
+    def decode(self, token: str) -> Optional[dict]:
+        try:
+            key_id = jwt.get_unverified_header(token).get("kid")
+            key = self._verification_keys.get(key_id)
+            if key is None:
+                return None
+            return jwt.decode(token, key, algorithms=[self.algorithm])
+        except InvalidTokenError:
+            return None
+
+    def jwks(self) -> dict:
+        keys = []
+        for key_id, public_key in self._verification_keys.items():
+            jwk = self._jwa.to_jwk(public_key, as_dict=True)
+            jwk.update({"kid": key_id, "use": "sig", "alg": self.algorithm})
+            keys.append(jwk)
+        return {"keys": keys}
+
+
+def _jwk_thumbprint(jwk: dict) -> str:
+    # RFC 7638: SHA-256 over the required members in lexicographic order.
+    required = {
+        "OKP": ("crv", "kty", "x"),
+        "EC": ("crv", "kty", "x", "y"),
+    }[jwk["kty"]]
+    canonical = to_json({name: jwk[name] for name in required})
+    return _b64encode(hashlib.sha256(canonical).digest()).decode()
+
+
+def _claims_are_valid(payload: dict) -> bool:
+    # Mirrors the registered-claim checks PyJWT applies by default.
+    if "aud" in payload:
+        return False
+
+    now = time.time()
+    for claim in ("exp", "nbf", "iat"):
+        value = payload.get(claim)
+        if value is not None and not _is_number(value):
+            return False
+
+    exp = payload.get("exp")
+    if exp is not None and exp <= now:
+        return False
+    nbf = payload.get("nbf")
+    if nbf is not None and nbf > now:
+        return False
+    return True
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _create_access_token_codec() -> HS256Codec | AsymmetricCodec:
+    if config.ACCESS_TOKEN_ALGORITHM == ALGORITHM:
+        return HS256Codec(config.ACCESS_TOKEN_SECRET)
+
+    previous_public_keys = {}
+    if config.ACCESS_TOKEN_PREVIOUS_KEY_ID and config.ACCESS_TOKEN_PREVIOUS_PUBLIC_KEY:
+        previous_public_keys[config.ACCESS_TOKEN_PREVIOUS_KEY_ID] = (
+            config.ACCESS_TOKEN_PREVIOUS_PUBLIC_KEY
+        )
+    return AsymmetricCodec(
+        config.ACCESS_TOKEN_ALGORITHM,
+        config.ACCESS_TOKEN_PRIVATE_KEY,
+        key_id=config.ACCESS_TOKEN_KEY_ID,
+        previous_public_keys=previous_public_keys,
+    )
+
+
+access_token_codec = _create_access_token_codec()
+refresh_token_codec = HS256Codec(config.REFRESH_TOKEN_SECRET)
+
+# Bearer tokens are re-sent on every request during their lifetime. Entries
+# are keyed by a digest so raw tokens are not kept in memory.
+verified_access_tokens = TTLCache(
+    maxsize=config.ACCESS_TOKEN_MEMO_SIZE,
+    ttl=config.ACCESS_TOKEN_EXPIRES_SECONDS,
+)
+register_collector("verified_access_tokens", verified_access_tokens.stats)
+
+
+def _new_token_id() -> str:
+    return os.urandom(16).hex()
+
+
 def create_access_token(data: dict) -> str:
     if "sub" not in data or "token_version" not in data:
         raise ValueError("sub and token_version are required")
     to_encode = data.copy()
     to_encode["sub"] = str(to_encode["sub"])
-    expire = datetime.now(timezone.utc) + timedelta(
-        seconds=config.ACCESS_TOKEN_EXPIRES_SECONDS
-    )
     to_encode.update(
         {
-            "exp": expire,
+            "exp": int(time.time()) + config.ACCESS_TOKEN_EXPIRES_SECONDS,
             "type": "access",
-            "jti": str(uuid4()),
+            "jti": _new_token_id(),
         }
     )
-    return jwt.encode(to_encode, config.ACCESS_TOKEN_SECRET, algorithm=ALGORITHM)
+    return access_token_codec.encode(to_encode)
 
 
 def create_refresh_token(data: dict, remember_me: bool = False) -> str:
@@ -40,15 +232,14 @@ def create_refresh_token(data: dict, remember_me: bool = False) -> str:
         if remember_me
         else config.REFRESH_TOKEN_EXPIRES_SECONDS
     )
-    expire = datetime.now(timezone.utc) + timedelta(seconds=seconds)
     to_encode.update(
         {
-            "exp": expire,
+            "exp": int(time.time()) + seconds,
             "type": "refresh",
-            "jti": str(uuid4()),
+            "jti": _new_token_id(),
         }
     )
-    return jwt.encode(to_encode, config.REFRESH_TOKEN_SECRET, algorithm=ALGORITHM)
+    return refresh_token_codec.encode(to_encode)
 
 
 def create_token_pair(
@@ -64,17 +255,26 @@ def create_token_pair(
 
 
 def decode_access_token(token: str) -> Optional[dict]:
-    try:
-        return jwt.decode(token, config.ACCESS_TOKEN_SECRET, algorithms=[ALGORITHM])
-    except InvalidTokenError:
-        return None
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = verified_access_tokens.get(key)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            return dict(payload)
+        verified_access_tokens.invalidate(key)
+
+    payload = access_token_codec.decode(token)
+    if payload is not None and _is_number(payload.get("exp")):
+        verified_access_tokens.set(key, payload, ttl=payload["exp"] - time.time())
+        return dict(payload)
+    return payload
 
 
 def decode_refresh_token(token: str) -> Optional[dict]:
-    try:
-        return jwt.decode(token, config.REFRESH_TOKEN_SECRET, algorithms=[ALGORITHM])
-    except InvalidTokenError:
-        return None
+    return refresh_token_codec.decode(token)
+
+
+def access_token_jwks() -> dict:
+    return access_token_codec.jwks()
 
 
 def verify_access_token(authorization: str = Header(None)) -> dict:
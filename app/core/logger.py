@@ -1,65 +1,157 @@
-import json
+import atexit
+import copy
 import logging
+import os
+import queue
 import sys
-from datetime import datetime, timezone
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
+
+from pydantic_core import to_json
+
 from app.core.config import config
+from app.core.metrics import register_collector
 
 
 LOG_LEVEL = config.LOG_LEVEL.upper()
 
+# Every attribute a bare LogRecord carries, plus those Formatter adds later.
+_LOGRECORD_INTERNAL_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+_CONTAINERS = (dict, list, tuple, set)
+
 
 class JsonFormatter(logging.Formatter):
-    _LOGRECORD_INTERNAL_ATTRS = {
-        "name",
-        "msg",
-        "args",
-        "levelname",
-        "levelno",
-        "pathname",
-        "filename",
-        "module",
-        "exc_info",
-        "exc_text",
-        "stack_info",
-        "lineno",
-        "funcName",
-        "created",
-        "msecs",
-        "relativeCreated",
-        "thread",
-        "threadName",
-        "processName",
-        "process",
-        "taskName",
-    }
+    def __init__(self, max_field_length: int = 0) -> None:
+        super().__init__()
+        self.max_field_length = max_field_length
+        self._timestamp_second = -1
+        self._timestamp_prefix = ""
 
     def format(self, record: logging.LogRecord) -> str:
         log: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
         invalid_keys: list[str] = []
-        for key, value in record.__dict__.items():
-            if key in self._LOGRECORD_INTERNAL_ATTRS or key.startswith("_"):
+        for key in record.__dict__.keys() - _LOGRECORD_INTERNAL_ATTRS:
+            if key.startswith("_"):
                 continue
 
             if key.lower() != key:
                 invalid_keys.append(key)
                 continue
 
-            log[key] = value
+            log[key] = self._cap(record.__dict__[key])
 
         if invalid_keys:
             log["_invalid_extra_keys"] = invalid_keys
 
         if record.exc_info:
             log["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log["exception"] = record.exc_text
+
+        return to_json(log, fallback=str).decode()
+
+    def _cap(self, value: Any) -> Any:
+        limit = self.max_field_length
+        if not limit:
+            return value
+        if isinstance(value, str):
+            text = value
+        elif isinstance(value, _CONTAINERS):
+            text = to_json(value, fallback=str).decode()
+            if len(text) <= limit:
+                return value
+        else:
+            return value
+        if len(text) <= limit:
+            return text
+        return f"{text[:limit]}...[truncated {len(text) - limit} chars]"
+
+    def _format_timestamp(self, created: float) -> str:
+        # Same layout as datetime.isoformat(timespec="milliseconds") in UTC;
+        # the second-resolution prefix is rebuilt at most once per second.
+        second = int(created)
+        if second != self._timestamp_second:
+            self._timestamp_prefix = time.strftime(
+                "%Y-%m-%dT%H:%M:%S", time.gmtime(second)
+            )
+            self._timestamp_second = second
+        millis = int((created - second) * 1000)
+        return f"{self._timestamp_prefix}.{millis:03d}+00:00"
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Hands records to a background listener through a bounded queue.
+
+    With policy "drop" a full queue discards the record and counts it, so
+    a stalled stdout never blocks request threads; "block" waits instead.
+    """
+
+    def __init__(self, maxsize: int, policy: str = "drop") -> None:
+        super().__init__(queue.Queue(maxsize))
+        self.policy = policy
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is left to the listener thread. Only resolve what may
+        # change after this call returns: message args and the traceback.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "capacity": self.queue.maxsize,
+            "queue_depth": self.queue.qsize(),
+            "dropped": self.dropped,
+        }
+
+
+def _start_listener(handler: BoundedQueueHandler, target: logging.Handler) -> None:
+    listener = QueueListener(handler.queue, target, respect_handler_level=True)
+    listener.start()
+    # stop() drains the queue, so records logged during shutdown still land.
+    atexit.register(listener.stop)
+
+
+def _listen_in_this_and_forked_processes(
+    handler: BoundedQueueHandler, target: logging.Handler
+) -> None:
+    def restart_in_child() -> None:
+        # The listener thread does not survive fork; give the child its own.
+        handler.queue = queue.Queue(handler.queue.maxsize)
+        handler.dropped = 0
+        _start_listener(handler, target)
 
-        return json.dumps(log, ensure_ascii=False, default=str)
+    _start_listener(handler, target)
+    os.register_at_fork(after_in_child=restart_in_child)
 
 
 def get_logger(name: str = "app") -> logging.Logger:
@@ -71,8 +163,17 @@ def get_logger(name: str = "app") -> logging.Logger:
     logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 
     stream_handler = logging.StreamHandler(sys.stdout)
-    stream_handler.setFormatter(JsonFormatter())
-    logger.addHandler(stream_handler)
+    stream_handler.setFormatter(JsonFormatter(config.LOG_MAX_FIELD_LENGTH))
+
+    if config.LOG_QUEUE_SIZE > 0:
+        queue_handler = BoundedQueueHandler(
+            config.LOG_QUEUE_SIZE, config.LOG_QUEUE_FULL_POLICY
+        )
+        logger.addHandler(queue_handler)
+        _listen_in_this_and_forked_processes(queue_handler, stream_handler)
+        register_collector(f"logger_{name}", queue_handler.stats)
+    else:
+        logger.addHandler(stream_handler)
 
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 import smtplib
+import threading
+from contextlib import contextmanager
 from email.message import EmailMessage
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from app.core.config import config
 
@@ -14,6 +16,15 @@ def _normalize_recipients(value: str | Iterable[str] | None) -> list[str]:
     return list(value)
 
 
+# Set after a transaction that queued mail commits, so the dispatcher in this
+# process sends it right away instead of at its next poll.
+mail_outbox_wakeup = threading.Event()
+
+
+class MailDeliveryError(Exception):
+    pass
+
+
 class Mailer(ABC):
     @abstractmethod
     def send(
@@ -25,6 +36,12 @@ class Mailer(ABC):
     ) -> None:
         pass
 
+    @contextmanager
+    def connection(self) -> Iterator[None]:
+        # Sends inside this block may share one connection. Mailers without
+        # a connection to reuse need not override it.
+        yield
+
 
 class SMTPMailer(Mailer):
     def __init__(
@@ -43,6 +60,8 @@ class SMTPMailer(Mailer):
         self.password = password
         self.use_tls = use_tls
         self.from_address = from_address
+        self.timeout = config.SMTP_TIMEOUT_SECONDS
+        self._server: smtplib.SMTP | None = None
 
     def send(
         self,
@@ -65,12 +84,43 @@ class SMTPMailer(Mailer):
         message["Subject"] = subject
         message.set_content(body)
 
-        with smtplib.SMTP(self.host, self.port) as server:
+        try:
+            if self._server is not None:
+                self._server.send_message(message)
+                return
+            with self._connect() as server:
+                server.send_message(message)
+        except (smtplib.SMTPException, OSError) as exc:
+            raise MailDeliveryError(f"{type(exc).__name__}: {exc}") from exc
+
+    @contextmanager
+    def connection(self) -> Iterator[None]:
+        # Connect, STARTTLS and login once for the whole block.
+        try:
+            server = self._connect()
+        except (smtplib.SMTPException, OSError) as exc:
+            raise MailDeliveryError(f"{type(exc).__name__}: {exc}") from exc
+        self._server = server
+        try:
+            yield
+        finally:
+            self._server = None
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
             if self.use_tls:
                 server.starttls()
             if self.username and self.password:
                 server.login(self.username, self.password)
-            server.send_message(message)
+        except BaseException:
+            server.close()
+            raise
+        return server
 
 
 class MailHogMailer(SMTPMailer):
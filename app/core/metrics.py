@@ -0,0 +1,123 @@
+import bisect
+import threading
+from typing import Any, Callable
+
+_collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+
+
+def register_collector(name: str, collect: Callable[[], dict[str, Any]]) -> None:
+    _collectors[name] = collect
+
+
+def collect_metrics() -> dict[str, dict[str, Any]]:
+    return {name: collect() for name, collect in _collectors.items()}
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        # Cumulative "less than or equal" counts, as Prometheus expects.
+        cumulative = {}
+        running = 0
+        for bound, count in zip((*self.buckets, float("inf")), counts):
+            running += count
+            cumulative["+Inf" if bound == float("inf") else str(bound)] = running
+        return {"buckets": cumulative, "count": running, "sum": total}
+
+
+class MetricFamily:
+    """A labelled counter, gauge or histogram exposed at /metrics.
+
+    Counters and histograms from exited workers still count towards the
+    aggregate; gauges only reflect live workers (see app.core.prometheus).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = (),
+    ):
+        self.name = name
+        self.kind = kind
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._values: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def observe(self, *labels: str, value: float) -> None:
+        histogram = self._values.get(labels)
+        if histogram is None:
+            with self._lock:
+                histogram = self._values.setdefault(labels, Histogram(self.buckets))
+        histogram.observe(value)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            values = list(self._values.items())
+        series = [
+            [list(labels), value.snapshot() if self.kind == "histogram" else value]
+            for labels, value in values
+        ]
+        return {
+            "kind": self.kind,
+            "help": self.help,
+            "labelnames": list(self.labelnames),
+            "series": series,
+        }
+
+
+_families: dict[str, MetricFamily] = {}
+
+
+def _family(name: str, kind: str, help: str, **options: Any) -> MetricFamily:
+    if name in _families:
+        return _families[name]
+    family = _families[name] = MetricFamily(name, kind, help, **options)
+    return family
+
+
+def counter(name: str, help: str, labelnames: tuple[str, ...] = ()) -> MetricFamily:
+    return _family(name, "counter", help, labelnames=labelnames)
+
+
+def gauge(name: str, help: str, labelnames: tuple[str, ...] = ()) -> MetricFamily:
+    return _family(name, "gauge", help, labelnames=labelnames)
+
+
+def histogram(
+    name: str,
+    help: str,
+    labelnames: tuple[str, ...] = (),
+    buckets: tuple[float, ...] = (),
+) -> MetricFamily:
+    return _family(name, "histogram", help, labelnames=labelnames, buckets=buckets)
+
+
+def snapshot_families() -> dict[str, dict[str, Any]]:
+    return {name: family.snapshot() for name, family in _families.items()}
@@ -0,0 +1,192 @@
+import random
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.database import QueryStats, primary_pin_cookie, query_stats
+from app.core.logger import logger
+from app.core.metrics import counter, gauge, histogram
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+http_requests = counter(
+    "app_http_requests_total",
+    "HTTP requests by route template and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration = histogram(
+    "app_http_request_duration_seconds",
+    "HTTP request latency by route template, until the body is sent.",
+    ("method", "route"),
+    LATENCY_BUCKETS,
+)
+http_requests_in_flight = gauge(
+    "app_http_requests_in_flight",
+    "HTTP requests currently being served.",
+)
+
+
+def route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        # Unmatched paths would give every scanner probe its own series.
+        return "unmatched"
+    # Routes of included routers are relative to the router prefix; restore
+    # the prefix from the leading segments of the requested path.
+    path = scope["path"]
+    depth = path.count("/") - template.count("/")
+    if depth > 0:
+        template = "/".join(path.split("/")[: depth + 1]) + template
+    return template
+
+
+def security_headers(is_prod: bool) -> list[tuple[bytes, bytes]]:
+    headers = [
+        (b"x-content-type-options", b"nosniff"),
+        (b"x-frame-options", b"DENY"),
+        (b"referrer-policy", b"strict-origin"),
+    ]
+    if is_prod:
+        headers += [
+            (b"content-security-policy", b"default-src 'self'"),
+            (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+        ]
+    return headers
+
+
+class AccessLogSampler:
+    """Decides which access lines to log.
+
+    Errors (status >= 400) and requests slower than `slow_ms` are always
+    logged; other requests are logged with the rate of the longest matching
+    path prefix, falling back to `default_rate`.
+    """
+
+    def __init__(
+        self,
+        default_rate: float = 1.0,
+        path_rates: dict[str, float] | None = None,
+        slow_ms: int = 1000,
+    ) -> None:
+        self.default_rate = default_rate
+        self.slow_ns = slow_ms * 1_000_000
+        self.path_rates = sorted(
+            (path_rates or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def rate_for(self, path: str) -> float:
+        for prefix, rate in self.path_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.default_rate
+
+    def sample(self, path: str, status_code: int, duration_ns: int) -> float | None:
+        # Returns the rate the line was kept at, or None to skip it.
+        if status_code >= 400 or duration_ns >= self.slow_ns:
+            return 1.0
+        rate = self.rate_for(path)
+        if rate >= 1.0:
+            return 1.0
+        if rate > 0.0 and random.random() < rate:
+            return rate
+        return None
+
+
+class SecurityMiddleware:
+    """Security headers, primary pinning, access logs and request metrics.
+
+    Pure ASGI so streaming bodies pass straight through; the header pairs are
+    built once and appended to the start message of every response.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        is_prod: bool = False,
+        sampler: AccessLogSampler | None = None,
+    ) -> None:
+        self.app = app
+        self.headers = security_headers(is_prod)
+        self.sampler = sampler or AccessLogSampler()
+        # Timings reveal internals, so production responses do not carry them.
+        self.server_timing = not is_prod
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()
+        method = scope["method"]
+        status_code = 500
+        stats = QueryStats()
+        stats_token = query_stats.set(stats)
+        http_requests_in_flight.inc()
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", ()))
+                headers += self.headers
+                if method in WRITE_METHODS and status_code < 400:
+                    cookie = primary_pin_cookie()
+                    if cookie is not None:
+                        headers.append((b"set-cookie", cookie.encode("latin-1")))
+                if self.server_timing:
+                    elapsed_ns = time.perf_counter_ns() - start
+                    headers.append(
+                        (b"server-timing", _server_timing(stats, elapsed_ns))
+                    )
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            duration_ns = time.perf_counter_ns() - start
+            query_stats.reset(stats_token)
+            http_requests_in_flight.dec()
+            route = route_template(scope)
+            http_requests.inc(method, route, str(status_code))
+            http_request_duration.observe(method, route, value=duration_ns / 1e9)
+            if method != "OPTIONS":
+                rate = self.sampler.sample(scope["path"], status_code, duration_ns)
+                if rate is not None:
+                    _log_access(scope, status_code, duration_ns, stats, rate)
+
+
+def _server_timing(stats: QueryStats, elapsed_ns: int) -> bytes:
+    # Measured when the response starts; streamed bodies may query further.
+    db_ms = stats.duration_ns / 1e6
+    app_ms = max(elapsed_ns - stats.duration_ns, 0) / 1e6
+    return (
+        f'db;dur={db_ms:.2f};desc="{stats.statements} statements", app;dur={app_ms:.2f}'
+    ).encode()
+
+
+def _log_access(
+    scope: Scope,
+    status_code: int,
+    duration_ns: int,
+    stats: QueryStats,
+    sample_rate: float,
+) -> None:
+    account_id = scope.get("state", {}).get("account_id")
+    client = scope.get("client")
+    logger.info(
+        "access",
+        extra={
+            "method": scope["method"],
+            "path": scope["path"],
+            "status_code": status_code,
+            "duration_ms": duration_ns // 1_000_000,
+            "db_statements": stats.statements,
+            "db_duration_ms": round(stats.duration_ns / 1e6, 3),
+            "client": client[0] if client else None,
+            "account": {"id": account_id} if account_id is not None else None,
+            "sample_rate": sample_rate,
+        },
+    )
@@ -0,0 +1,234 @@
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+from pydantic_core import from_json, to_json
+
+from app.core.config import config
+from app.core.metrics import collect_metrics, snapshot_families
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Exited workers are folded into this file so the directory stays bounded.
+DEAD_WORKERS_FILE = "dead.json"
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+Families = dict[str, dict[str, Any]]
+
+
+def collector_families() -> Families:
+    # Collector dicts (pools, caches, hasher, logger) are point-in-time views
+    # of one process: numbers become gauges and Histogram snapshots become
+    # histograms, and none of them outlive the worker that reported them.
+    families: Families = {}
+    for collector, values in collect_metrics().items():
+        _flatten(families, f"app_{collector}", values)
+    return families
+
+
+def _flatten(families: Families, name: str, value: Any) -> None:
+    if isinstance(value, dict):
+        if {"buckets", "count", "sum"} <= value.keys():
+            families[_metric_name(name)] = _live_family("histogram", value)
+            return
+        for key, item in value.items():
+            _flatten(families, f"{name}_{key}", item)
+    elif isinstance(value, (int, float)):
+        families[_metric_name(name)] = _live_family("gauge", float(value))
+
+
+def _live_family(kind: str, value: Any) -> dict[str, Any]:
+    return {
+        "kind": kind,
+        "help": "",
+        "labelnames": [],
+        "series": [[[], value]],
+        "live_only": True,
+    }
+
+
+def _metric_name(name: str) -> str:
+    return _INVALID_NAME_CHARS.sub("_", name)
+
+
+def process_families() -> Families:
+    return {**snapshot_families(), **collector_families()}
+
+
+# =================================
+# Multi-process mode
+# =================================
+
+
+def write_process_snapshot(directory: str) -> None:
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    path = Path(directory) / f"{os.getpid()}.json"
+    temporary = path.with_suffix(".tmp")
+    temporary.write_bytes(to_json(process_families()))
+    os.replace(temporary, path)
+
+
+def read_snapshots(directory: str) -> list[tuple[Families, bool]]:
+    snapshots = []
+    for path in Path(directory).glob("*.json"):
+        try:
+            families = from_json(path.read_bytes())
+        except (OSError, ValueError):
+            # Removed or replaced between glob and read.
+            continue
+        snapshots.append((families, path.name != DEAD_WORKERS_FILE))
+    return snapshots
+
+
+def mark_process_dead(directory: str, pid: int) -> None:
+    # Called from the gunicorn master after a worker exits. Its counters and
+    # histograms are merged into DEAD_WORKERS_FILE; its gauges are dropped.
+    path = Path(directory) / f"{pid}.json"
+    dead_path = Path(directory) / DEAD_WORKERS_FILE
+    try:
+        families = from_json(path.read_bytes())
+    except (OSError, ValueError):
+        return
+    snapshots = [(families, False)]
+    if dead_path.exists():
+        snapshots.append((from_json(dead_path.read_bytes()), False))
+    temporary = dead_path.with_suffix(".tmp")
+    temporary.write_bytes(to_json(_as_snapshot(aggregate(snapshots))))
+    os.replace(temporary, dead_path)
+    path.unlink(missing_ok=True)
+
+
+class SnapshotWriter:
+    """Periodically writes this worker's metrics for other workers to serve."""
+
+    def __init__(self, directory: str, interval_seconds: float):
+        self.directory = directory
+        self.interval_seconds = interval_seconds
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="metrics-snapshot-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+        write_process_snapshot(self.directory)
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval_seconds):
+            write_process_snapshot(self.directory)
+
+
+# =================================
+# Aggregation and exposition
+# =================================
+
+
+def aggregate(snapshots: Iterable[tuple[Families, bool]]) -> Families:
+    merged: Families = {}
+    for families, live in snapshots:
+        for name, family in families.items():
+            if not live and (family.get("live_only") or family["kind"] == "gauge"):
+                continue
+            target = merged.setdefault(name, {**family, "series": {}})
+            for labels, value in family["series"]:
+                key = tuple(labels)
+                target["series"][key] = _add(target["series"].get(key), value)
+    return merged
+
+
+def _add(total: Any, value: Any) -> Any:
+    if total is None:
+        return (
+            dict(value, buckets=dict(value["buckets"]))
+            if isinstance(value, dict)
+            else value
+        )
+    if isinstance(value, dict):
+        # Cumulative bucket counts stay cumulative when summed.
+        return {
+            "buckets": {
+                bound: total["buckets"].get(bound, 0) + count
+                for bound, count in value["buckets"].items()
+            },
+            "count": total["count"] + value["count"],
+            "sum": total["sum"] + value["sum"],
+        }
+    return total + value
+
+
+def _as_snapshot(merged: Families) -> Families:
+    return {
+        name: {
+            **family,
+            "series": [
+                [list(labels), value] for labels, value in family["series"].items()
+            ],
+        }
+        for name, family in merged.items()
+    }
+
+
+def render(merged: Families) -> str:
+    lines = []
+    for name, family in sorted(merged.items()):
+        if family["help"]:
+            lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['kind']}")
+        labelnames = family["labelnames"]
+        for labels, value in sorted(family["series"].items()):
+            pairs = list(zip(labelnames, labels))
+            if family["kind"] != "histogram":
+                lines.append(f"{name}{_labels(pairs)} {_number(value)}")
+                continue
+            for bound, count in value["buckets"].items():
+                bucket_labels = _labels([*pairs, ("le", bound)])
+                lines.append(f"{name}_bucket{bucket_labels} {count}")
+            lines.append(f"{name}_sum{_labels(pairs)} {_number(value['sum'])}")
+            lines.append(f"{name}_count{_labels(pairs)} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def _labels(pairs: list[tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    escaped = (f'{name}="{_escape(value)}"' for name, value in pairs)
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def collect_prometheus() -> str:
+    directory = config.METRICS_MULTIPROC_DIR
+    if directory is None:
+        return render(aggregate([(process_families(), True)]))
+    # Refresh this worker's file so the scrape sees its latest values.
+    write_process_snapshot(directory)
+    return render(aggregate(read_snapshots(directory)))
+
+
+snapshot_writer = (
+    SnapshotWriter(config.METRICS_MULTIPROC_DIR, config.METRICS_FLUSH_SECONDS)
+    if config.METRICS_MULTIPROC_DIR
+    else None
+)
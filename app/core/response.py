@@ -1,13 +1,38 @@
 from typing import Any, Optional
 from fastapi import Response
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
+from pydantic_core import to_json
+
+# Set by the response itself; never copied from the handler's Response.
+_BODY_HEADERS = {b"content-length", b"content-type"}
+
+
+def _merge_headers(target: Response, source: Optional[Response]) -> None:
+    # raw_headers keeps repeated headers such as several Set-Cookie lines.
+    if source is not None:
+        target.raw_headers.extend(
+            (name, value)
+            for name, value in source.raw_headers
+            if name not in _BODY_HEADERS
+        )
+
+
+class JsonBytesResponse(Response):
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: bytes,
+        status_code: int,
+        response: Optional[Response] = None,
+    ):
+        super().__init__(content=content, status_code=status_code)
+        _merge_headers(self, response)
 
 
 class NoContentResponse(Response):
     def __init__(self, response: Optional[Response] = None):
-        headers = dict(response.headers) if response else {}
-        super().__init__(status_code=204, headers=headers)
+        super().__init__(status_code=204)
+        _merge_headers(self, response)
 
 
 class ApiResponse:
@@ -16,17 +41,13 @@ class ApiResponse:
         data: Any,
         status_code: int,
         response: Optional[Response] = None,
-    ) -> JSONResponse:
-        if hasattr(data, "model_dump"):
-            data = data.model_dump()
-
-        encoded = jsonable_encoder(data)
-        headers = dict(response.headers) if response else {}
-
-        return JSONResponse(
-            content=encoded,
+    ) -> JsonBytesResponse:
+        # One pass in pydantic-core: DTOs go through their compiled serializer
+        # and plain dicts/lists are encoded directly to bytes.
+        return JsonBytesResponse(
+            content=to_json(data, fallback=str),
             status_code=status_code,
-            headers=headers,
+            response=response,
         )
 
     # ----------------------------------------
@@ -38,7 +59,7 @@ class ApiResponse:
         data: Any = None,
         response: Optional[Response] = None,
         status_code: int = 200,
-    ) -> JSONResponse:
+    ) -> JsonBytesResponse:
         return cls._build_response(
             data=data,
             status_code=status_code,
@@ -53,7 +74,7 @@ class ApiResponse:
         cls,
         data: Any = None,
         response: Optional[Response] = None,
-    ) -> JSONResponse:
+    ) -> JsonBytesResponse:
         return cls._build_response(
             data=data,
             status_code=201,
@@ -78,7 +99,7 @@ class ApiResponse:
         cls,
         data: Any = None,
         status_code: int = 400,
-    ) -> JSONResponse:
+    ) -> JsonBytesResponse:
         return cls._build_response(
             data=data,
             status_code=status_code,
@@ -88,7 +109,7 @@ class ApiResponse:
     # 401 Unauthorized
     # ----------------------------------------
     @classmethod
-    def unauthorized(cls, message: str = "Unauthorized") -> JSONResponse:
+    def unauthorized(cls, message: str = "Unauthorized") -> JsonBytesResponse:
         return cls._build_response(
             data={"detail": message},
             status_code=401,
@@ -98,7 +119,7 @@ class ApiResponse:
     # 404 Not Found
     # ----------------------------------------
     @classmethod
-    def not_found(cls, message: str = "Resource not found") -> JSONResponse:
+    def not_found(cls, message: str = "Resource not found") -> JsonBytesResponse:
         return cls._build_response(
             data={"detail": message},
             status_code=404,
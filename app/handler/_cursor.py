@@ -0,0 +1,25 @@
+import base64
+import binascii
+import json
+
+from app.core.error import AppError, ErrorCode
+
+
+def encode_cursor(after_id: int | None) -> str | None:
+    if after_id is None:
+        return None
+    raw = json.dumps({"after_id": after_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        after_id = json.loads(raw)["after_id"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise AppError(code=ErrorCode.INVALID_CURSOR)
+    if not isinstance(after_id, int) or isinstance(after_id, bool):
+        raise AppError(code=ErrorCode.INVALID_CURSOR)
+    return after_id
@@ -1,16 +1,41 @@
+from typing import Callable
+
 from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_async_read_db, get_db, get_read_db
 from app.core.jwt import verify_access_token
-from app.usecase.auth.authorize import AuthorizeAccessTokenUsecase
+from app.usecase.auth.authorize import (
+    AsyncAuthorizeAccessTokenUsecase,
+    AuthorizeAccessTokenUsecase,
+)
+
+
+def db_for(usecase: type) -> Callable:
+    # Usecases that declare read_only = True are served from a replica session.
+    return get_read_db if getattr(usecase, "read_only", False) else get_db
+
+
+def async_db_for(usecase: type) -> Callable:
+    return get_async_read_db if getattr(usecase, "read_only", False) else get_async_db
 
 
 def get_account_id(
     request: Request,
     payload: dict = Depends(verify_access_token),
-    db: Session = Depends(get_db),
+    db: Session = Depends(db_for(AuthorizeAccessTokenUsecase)),
 ) -> int:
     account_id = AuthorizeAccessTokenUsecase(db).execute(payload)
     request.state.account_id = account_id
     return account_id
+
+
+async def get_account_id_async(
+    request: Request,
+    payload: dict = Depends(verify_access_token),
+    db: AsyncSession = Depends(async_db_for(AsyncAuthorizeAccessTokenUsecase)),
+) -> int:
+    account_id = await AsyncAuthorizeAccessTokenUsecase(db).execute(payload)
+    request.state.account_id = account_id
+    return account_id
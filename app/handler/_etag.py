@@ -0,0 +1,38 @@
+from fastapi import Request, Response
+
+# Revalidate on every use; private because responses are per account.
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_for(version: str) -> str:
+    # Weak: the same representation may be sent gzip-encoded or not.
+    return f'W/"{version}"'
+
+
+def if_none_match(request: Request) -> str | None:
+    return request.headers.get("if-none-match")
+
+
+def etag_matches(header: str, version: str | None) -> bool:
+    if version is None:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored.
+    opaque = f'"{version}"'
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def not_modified(version: str) -> Response:
+    return Response(
+        status_code=304,
+        headers={"ETag": etag_for(version), "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_etag(response: Response, version: str) -> None:
+    response.headers["ETag"] = etag_for(version)
+    response.headers["Cache-Control"] = CACHE_CONTROL
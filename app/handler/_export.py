@@ -0,0 +1,43 @@
+import csv
+import io
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from pydantic_core import to_json
+
+# Spreadsheet apps evaluate cells starting with these as formulas.
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def ndjson_chunks(batches: Iterable[list[Mapping[str, Any]]]) -> Iterator[bytes]:
+    for batch in batches:
+        yield b"".join(to_json(row) + b"\n" for row in batch)
+
+
+def csv_chunks(
+    batches: Iterable[list[Mapping[str, Any]]],
+    columns: Sequence[str],
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for batch in batches:
+        writer.writerows(
+            [_csv_value(row[column]) for column in columns] for row in batch
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        # Same rendering as the NDJSON encoder, e.g. a "Z" suffix for UTC.
+        return to_json(value)[1:-1].decode()
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
@@ -1,10 +1,18 @@
-from fastapi import APIRouter, Depends, Response
+from datetime import datetime
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.error import AppError, AppErrorKind
 from app.core.response import ApiResponse
-from app.handler._dependency import get_account_id
+from app.handler._cursor import decode_cursor, encode_cursor
+from app.handler._dependency import db_for, get_account_id
+from app.handler._etag import etag_matches, if_none_match, not_modified, set_etag
+from app.handler._export import csv_chunks, ndjson_chunks
 from app.handler.dto.accounts import (
     AccountResponse,
     GetAccountResponse,
@@ -12,21 +20,35 @@ from app.handler.dto.accounts import (
     GetCurrentAccountResponse,
     PostAccountRequest,
     PostAccountResponse,
+    PostAccountsBulkDisableRequest,
+    PostAccountsBulkDisableResponse,
+    PostAccountsBulkEnableRequest,
+    PostAccountsBulkEnableResponse,
+    account_responses,
     PutAccountDisableResponse,
     PutAccountEnableResponse,
     PutAccountPasswordRequest,
     PutAccountRequest,
     PutAccountResponse,
 )
+from app.usecase.accounts.bulk_disable import (
+    BulkDisableAccountsInput,
+    BulkDisableAccountsUsecase,
+)
+from app.usecase.accounts.bulk_enable import (
+    BulkEnableAccountsInput,
+    BulkEnableAccountsUsecase,
+)
 from app.usecase.accounts.create import CreateAccountInput, CreateAccountUsecase
 from app.usecase.accounts.disable import DisableAccountInput, DisableAccountUsecase
 from app.usecase.accounts.enable import EnableAccountInput, EnableAccountUsecase
+from app.usecase.accounts.export import ExportAccountsUsecase
 from app.usecase.accounts.get import GetAccountInput, GetAccountUsecase
 from app.usecase.accounts.get_current import (
     GetCurrentAccountInput,
     GetCurrentAccountUsecase,
 )
-from app.usecase.accounts.list import ListAccountsUsecase
+from app.usecase.accounts.list import ListAccountsInput, ListAccountsUsecase
 from app.usecase.accounts.update import UpdateAccountInput, UpdateAccountUsecase
 from app.usecase.accounts.update_password import (
     UpdatePasswordInput,
@@ -34,20 +56,43 @@ from app.usecase.accounts.update_password import (
 )
 
 router = APIRouter()
+# Mounted ahead of every other accounts router so no /accounts/{id} route,
+# sync or async, can capture the literal segment.
+export_router = APIRouter()
 
 
 @router.get("/accounts", response_model=GetAccountsResponse)
 def get_accounts(
+    request: Request,
     response: Response,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, max_length=200),
+    disabled: bool | None = Query(default=None),
+    created_from: datetime | None = Query(default=None),
+    created_to: datetime | None = Query(default=None),
     account_id: int = Depends(get_account_id),
-    db: Session = Depends(get_db),
+    db: Session = Depends(db_for(ListAccountsUsecase)),
 ):
     _ = account_id
     usecase = ListAccountsUsecase(db)
-    accounts = usecase.execute()
+    input = ListAccountsInput(
+        limit=limit,
+        after_id=decode_cursor(cursor),
+        disabled=disabled,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    if (header := if_none_match(request)) is not None:
+        version = usecase.version(input)
+        if etag_matches(header, version):
+            return not_modified(version)
+
+    result = usecase.execute(input)
     data = GetAccountsResponse(
-        accounts=[AccountResponse.model_validate(account) for account in accounts]
+        accounts=account_responses.validate_python(result.accounts),
+        next_cursor=encode_cursor(result.next_after_id),
     )
+    set_etag(response, result.version)
     return ApiResponse.ok(data=data, response=response)
 
 
@@ -73,15 +118,63 @@ def post_account(
     return ApiResponse.created(data=data, response=response)
 
 
+@router.post(
+    "/accounts/bulk-disable",
+    response_model=PostAccountsBulkDisableResponse,
+)
+def post_accounts_bulk_disable(
+    request: PostAccountsBulkDisableRequest,
+    response: Response,
+    account_id: int = Depends(get_account_id),
+    db: Session = Depends(get_db),
+):
+    _ = account_id
+    usecase = BulkDisableAccountsUsecase(db)
+    account_ids = usecase.execute(
+        BulkDisableAccountsInput(account_ids=request.account_ids)
+    )
+    data = PostAccountsBulkDisableResponse(account_ids=account_ids)
+    return ApiResponse.ok(data=data, response=response)
+
+
+@router.post(
+    "/accounts/bulk-enable",
+    response_model=PostAccountsBulkEnableResponse,
+)
+def post_accounts_bulk_enable(
+    request: PostAccountsBulkEnableRequest,
+    response: Response,
+    account_id: int = Depends(get_account_id),
+    db: Session = Depends(get_db),
+):
+    _ = account_id
+    usecase = BulkEnableAccountsUsecase(db)
+    account_ids = usecase.execute(
+        BulkEnableAccountsInput(account_ids=request.account_ids)
+    )
+    data = PostAccountsBulkEnableResponse(account_ids=account_ids)
+    return ApiResponse.ok(data=data, response=response)
+
+
 @router.get("/accounts/me", response_model=GetCurrentAccountResponse)
 def get_current_account(
+    request: Request,
     response: Response,
     account_id: int = Depends(get_account_id),
-    db: Session = Depends(get_db),
+    db: Session = Depends(db_for(GetCurrentAccountUsecase)),
 ):
     usecase = GetCurrentAccountUsecase(db)
-    account = usecase.execute(GetCurrentAccountInput(account_id=account_id))
-    data = GetCurrentAccountResponse(account=AccountResponse.model_validate(account))
+    input = GetCurrentAccountInput(account_id=account_id)
+    if (header := if_none_match(request)) is not None:
+        version = usecase.version(input)
+        if etag_matches(header, version):
+            return not_modified(version)
+
+    result = usecase.execute(input)
+    data = GetCurrentAccountResponse(
+        account=AccountResponse.model_validate(result.account)
+    )
+    set_etag(response, result.version)
     return ApiResponse.ok(data=data, response=response)
 
 
@@ -103,18 +196,56 @@ def put_account_password(
     return ApiResponse.no_content(response=response)
 
 
+@export_router.get("/accounts/export")
+def export_accounts(
+    format: Literal["ndjson", "csv"] = Query(default="ndjson"),
+    account_id: int = Depends(get_account_id),
+    db: Session = Depends(db_for(ExportAccountsUsecase)),
+):
+    _ = account_id
+    usecase = ExportAccountsUsecase(db)
+    batches = usecase.execute()
+    if format == "csv":
+        body = csv_chunks(batches, usecase.columns)
+        media_type = "text/csv; charset=utf-8"
+    else:
+        body = ndjson_chunks(batches)
+        media_type = "application/x-ndjson"
+
+    # Starlette pulls one batch per send, so a slow client throttles the
+    # database cursor instead of the rows piling up in memory. The session
+    # dependency is closed only after the last chunk has been sent.
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="accounts.{format}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("/accounts/{target_account_id}", response_model=GetAccountResponse)
 def get_account(
     target_account_id: str,
+    request: Request,
     response: Response,
     account_id: int = Depends(get_account_id),
-    db: Session = Depends(get_db),
+    db: Session = Depends(db_for(GetAccountUsecase)),
 ):
     _ = account_id
     parsed_account_id = _parse_target_account_id(target_account_id)
     usecase = GetAccountUsecase(db)
-    account = usecase.execute(GetAccountInput(account_id=parsed_account_id))
-    data = GetAccountResponse(account=AccountResponse.model_validate(account))
+    input = GetAccountInput(account_id=parsed_account_id)
+    if (header := if_none_match(request)) is not None:
+        version = usecase.version(input)
+        if etag_matches(header, version):
+            return not_modified(version)
+
+    result = usecase.execute(input)
+    data = GetAccountResponse(account=AccountResponse.model_validate(result.account))
+    set_etag(response, result.version)
     return ApiResponse.ok(data=data, response=response)
 
 
@@ -0,0 +1,133 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.core.response import ApiResponse
+from app.handler._cursor import decode_cursor, encode_cursor
+from app.handler._dependency import async_db_for, get_account_id_async
+from app.handler._etag import etag_matches, if_none_match, not_modified, set_etag
+from app.handler.accounts import _parse_target_account_id
+from app.handler.dto.accounts import (
+    AccountResponse,
+    GetAccountResponse,
+    GetAccountsResponse,
+    GetCurrentAccountResponse,
+    PostAccountRequest,
+    PostAccountResponse,
+    account_responses,
+)
+from app.usecase.accounts.create import AsyncCreateAccountUsecase, CreateAccountInput
+from app.usecase.accounts.get import AsyncGetAccountUsecase, GetAccountInput
+from app.usecase.accounts.get_current import (
+    AsyncGetCurrentAccountUsecase,
+    GetCurrentAccountInput,
+)
+from app.usecase.accounts.list import AsyncListAccountsUsecase, ListAccountsInput
+
+# Mounted ahead of app.handler.accounts when DATABASE_MODE=async. The sync
+# routes stay registered and keep serving the endpoints not listed here.
+router = APIRouter(include_in_schema=False)
+
+
+@router.get("/accounts", response_model=GetAccountsResponse)
+async def get_accounts(
+    request: Request,
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, max_length=200),
+    disabled: bool | None = Query(default=None),
+    created_from: datetime | None = Query(default=None),
+    created_to: datetime | None = Query(default=None),
+    account_id: int = Depends(get_account_id_async),
+    db: AsyncSession = Depends(async_db_for(AsyncListAccountsUsecase)),
+):
+    _ = account_id
+    usecase = AsyncListAccountsUsecase(db)
+    input = ListAccountsInput(
+        limit=limit,
+        after_id=decode_cursor(cursor),
+        disabled=disabled,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    if (header := if_none_match(request)) is not None:
+        version = await usecase.version(input)
+        if etag_matches(header, version):
+            return not_modified(version)
+
+    result = await usecase.execute(input)
+    data = GetAccountsResponse(
+        accounts=account_responses.validate_python(result.accounts),
+        next_cursor=encode_cursor(result.next_after_id),
+    )
+    set_etag(response, result.version)
+    return ApiResponse.ok(data=data, response=response)
+
+
+@router.post("/accounts", response_model=PostAccountResponse)
+async def post_account(
+    request: PostAccountRequest,
+    response: Response,
+    account_id: int = Depends(get_account_id_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    _ = account_id
+    usecase = AsyncCreateAccountUsecase(db)
+    account = await usecase.execute(
+        CreateAccountInput(
+            login_id=request.login_id,
+            email=request.email,
+            password=request.password,
+            first_name=request.first_name,
+            last_name=request.last_name,
+        )
+    )
+    data = PostAccountResponse(account=AccountResponse.model_validate(account))
+    return ApiResponse.created(data=data, response=response)
+
+
+@router.get("/accounts/me", response_model=GetCurrentAccountResponse)
+async def get_current_account(
+    request: Request,
+    response: Response,
+    account_id: int = Depends(get_account_id_async),
+    db: AsyncSession = Depends(async_db_for(AsyncGetCurrentAccountUsecase)),
+):
+    usecase = AsyncGetCurrentAccountUsecase(db)
+    input = GetCurrentAccountInput(account_id=account_id)
+    if (header := if_none_match(request)) is not None:
+        version = await usecase.version(input)
+        if etag_matches(header, version):
+            return not_modified(version)
+
+    result = await usecase.execute(input)
+    data = GetCurrentAccountResponse(
+        account=AccountResponse.model_validate(result.account)
+    )
+    set_etag(response, result.version)
+    return ApiResponse.ok(data=data, response=response)
+
+
+@router.get("/accounts/{target_account_id}", response_model=GetAccountResponse)
+async def get_account(
+    target_account_id: str,
+    request: Request,
+    response: Response,
+    account_id: int = Depends(get_account_id_async),
+    db: AsyncSession = Depends(async_db_for(AsyncGetAccountUsecase)),
+):
+    _ = account_id
+    parsed_account_id = _parse_target_account_id(target_account_id)
+    usecase = AsyncGetAccountUsecase(db)
+    input = GetAccountInput(account_id=parsed_account_id)
+    if (header := if_none_match(request)) is not None:
+        version = await usecase.version(input)
+        if etag_matches(header, version):
+            return not_modified(version)
+
+    result = await usecase.execute(input)
+    data = GetAccountResponse(account=AccountResponse.model_validate(result.account))
+    set_etag(response, result.version)
+    return ApiResponse.ok(data=data, response=response)
@@ -6,6 +6,7 @@ from app.core.database import get_db
 from app.core.error import AppError, ErrorCode
 from app.core.jwt import verify_refresh_token
 from app.core.response import ApiResponse
+from app.handler._dependency import db_for
 from app.handler.dto.auth import (
     AccountResponse,
     ForgotPasswordRequest,
@@ -127,7 +128,7 @@ def forgot_password(
 def verify_reset_password_token(
     response: Response,
     token: str = Query(...),
-    db: Session = Depends(get_db),
+    db: Session = Depends(db_for(VerifyResetPasswordTokenUsecase)),
 ):
     usecase = VerifyResetPasswordTokenUsecase(db)
     usecase.execute(VerifyResetPasswordTokenInput(token=token))
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.response import ApiResponse
+from app.handler._dependency import async_db_for
+from app.usecase.auth.verify_reset_password_token import (
+    AsyncVerifyResetPasswordTokenUsecase,
+    VerifyResetPasswordTokenInput,
+)
+
+# Mounted ahead of app.handler.auth when DATABASE_MODE=async.
+router = APIRouter(include_in_schema=False)
+
+
+@router.get("/auth/reset-password/verify", status_code=204)
+async def verify_reset_password_token(
+    response: Response,
+    token: str = Query(...),
+    db: AsyncSession = Depends(async_db_for(AsyncVerifyResetPasswordTokenUsecase)),
+):
+    usecase = AsyncVerifyResetPasswordTokenUsecase(db)
+    await usecase.execute(VerifyResetPasswordTokenInput(token=token))
+    return ApiResponse.no_content(response=response)
@@ -1,12 +1,18 @@
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from typing import Annotated
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
 
-from app.handler.dto.constraints import PasswordString, String100, String255
+from app.handler.dto.constraints import (
+    PasswordString,
+    StoredEmail,
+    String100,
+    String255,
+)
 
 
 class AccountResponse(BaseModel):
     id: int
-    email: EmailStr | None = None
+    email: StoredEmail | None = None
     login_id: str
     first_name: str
     last_name: str
@@ -18,6 +24,11 @@ class AccountResponse(BaseModel):
         from_attributes = True
 
 
+# Built once: validating a whole page of rows through one adapter runs the loop
+# in pydantic-core instead of calling model_validate per row.
+account_responses = TypeAdapter(list[AccountResponse])
+
+
 class PostAccountRequest(BaseModel):
     login_id: String255 | None = None
     email: EmailStr | None = None
@@ -34,6 +45,18 @@ class PutAccountRequest(BaseModel):
     password: PasswordString | None = None
 
 
+# One request may name a whole tenant; the module chunks the UPDATEs.
+BulkAccountIds = Annotated[list[int], Field(min_length=1, max_length=10000)]
+
+
+class PostAccountsBulkDisableRequest(BaseModel):
+    account_ids: BulkAccountIds
+
+
+class PostAccountsBulkEnableRequest(BaseModel):
+    account_ids: BulkAccountIds
+
+
 class PutAccountPasswordRequest(BaseModel):
     old_password: String255
     new_password: PasswordString
@@ -41,6 +64,7 @@ class PutAccountPasswordRequest(BaseModel):
 
 class GetAccountsResponse(BaseModel):
     accounts: list[AccountResponse]
+    next_cursor: str | None = None
 
 
 class GetCurrentAccountResponse(BaseModel):
@@ -65,3 +89,11 @@ class PutAccountDisableResponse(BaseModel):
 
 class PutAccountEnableResponse(BaseModel):
     account: AccountResponse
+
+
+class PostAccountsBulkDisableResponse(BaseModel):
+    account_ids: list[int]
+
+
+class PostAccountsBulkEnableResponse(BaseModel):
+    account_ids: list[int]
@@ -3,6 +3,7 @@ from pydantic import BaseModel, EmailStr
 
 from app.handler.dto.constraints import (
     PasswordString,
+    StoredEmail,
     String100,
     String255,
     TokenString,
@@ -44,7 +45,7 @@ class ResetPasswordRequest(BaseModel):
 
 class AccountResponse(BaseModel):
     id: int
-    email: EmailStr | None = None
+    email: StoredEmail | None = None
     login_id: str
     first_name: str
     last_name: str
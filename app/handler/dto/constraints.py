@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from pydantic import StringConstraints
+from pydantic import Field, StringConstraints
 
 
 String50 = Annotated[str, StringConstraints(max_length=50)]
@@ -9,3 +9,6 @@ String255 = Annotated[str, StringConstraints(max_length=255)]
 String500 = Annotated[str, StringConstraints(max_length=500)]
 PasswordString = Annotated[str, StringConstraints(min_length=8, max_length=255)]
 TokenString = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+# Response-side email: already validated as EmailStr on the way in, and running
+# email-validator again costs ~300us per row when serializing account lists.
+StoredEmail = Annotated[str, Field(json_schema_extra={"format": "email"})]
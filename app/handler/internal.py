@@ -0,0 +1,46 @@
+import hmac
+import os
+
+from fastapi import APIRouter, Header, Response
+
+from app.core.config import config
+from app.core.error import AppError, ErrorCode
+from app.core.metrics import collect_metrics
+from app.core.prometheus import CONTENT_TYPE, collect_prometheus
+from app.core.response import ApiResponse
+
+router = APIRouter(include_in_schema=False)
+
+
+@router.get("/internal/metrics")
+async def get_metrics(
+    response: Response,
+    authorization: str | None = Header(default=None),
+):
+    _authorize_metrics(authorization)
+    response.headers["Cache-Control"] = "no-store"
+    # Values are per worker process; scrape every worker or aggregate by pid.
+    data = {"pid": os.getpid(), **collect_metrics()}
+    return ApiResponse.ok(data=data, response=response)
+
+
+@router.get("/metrics")
+def get_prometheus_metrics(authorization: str | None = Header(default=None)):
+    _authorize_metrics(authorization)
+    # Sync handler: in multi-process mode this reads every worker's file.
+    return Response(
+        content=collect_prometheus(),
+        media_type=CONTENT_TYPE,
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+def _authorize_metrics(authorization: str | None) -> None:
+    if config.METRICS_TOKEN is None:
+        if config.APP_ENV == "production":
+            raise AppError(code=ErrorCode.FORBIDDEN)
+        return
+
+    expected = f"Bearer {config.METRICS_TOKEN}"
+    if not hmac.compare_digest((authorization or "").encode(), expected.encode()):
+        raise AppError(code=ErrorCode.FORBIDDEN)
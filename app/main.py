@@ -1,21 +1,51 @@
-from fastapi import FastAPI, Request, HTTPException
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
-import time
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import config
+from app.core.crypto import password_hasher
+from app.core.database import async_engine, async_replica_engines
+from app.core.middleware import AccessLogSampler, SecurityMiddleware
+from app.core.prometheus import snapshot_writer
 from app.core.response import ApiResponse
 from app.core.logger import logger
 from app.core.error import AppError
+from app.core.events import change_event_listener
+from app.core.jwt import access_token_jwks
+from app.handler.internal import router as internal_router
+from app.worker.mail_outbox import mail_outbox_dispatcher
 from .router import api_router
 
 
 is_prod = config.APP_ENV == "production"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if config.CHANGE_EVENTS_ENABLED:
+        change_event_listener.start()
+    if snapshot_writer is not None:
+        snapshot_writer.start()
+    if config.MAIL_OUTBOX_DISPATCH_ENABLED:
+        mail_outbox_dispatcher.start()
+    yield
+    mail_outbox_dispatcher.stop()
+    if snapshot_writer is not None:
+        snapshot_writer.stop()
+    change_event_listener.stop()
+    password_hasher.shutdown()
+    for engine in (async_engine, *async_replica_engines):
+        await engine.dispose()
+
+
 app = FastAPI(
     title="scaf-fast",
     version="1.0.0",
+    lifespan=lifespan,
     docs_url=None if is_prod else "/docs",
     redoc_url=None if is_prod else "/redoc",
     openapi_url=None if is_prod else "/openapi.json",
@@ -29,48 +59,27 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type"],
 )
 
-app.include_router(api_router, prefix="/api")
-
-
-# =================================
-# Middleware
-# =================================
-
-
-@app.middleware("http")
-async def security_middleware(request: Request, call_next):
-    start = time.time()
+if config.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=config.COMPRESSION_GZIP_LEVEL,
+        zstd_level=config.COMPRESSION_ZSTD_LEVEL,
+    )
 
-    response = await call_next(request)
+# Added last so it wraps CORS and compression and sees the final response.
+app.add_middleware(
+    SecurityMiddleware,
+    is_prod=is_prod,
+    sampler=AccessLogSampler(
+        default_rate=config.ACCESS_LOG_SAMPLE_RATE,
+        path_rates=config.ACCESS_LOG_PATH_SAMPLE_RATES,
+        slow_ms=config.ACCESS_LOG_SLOW_MS,
+    ),
+)
 
-    duration_ms = int((time.time() - start) * 1000)
-    account_id = getattr(request.state, "account_id", None)
-    account = {"id": account_id} if account_id is not None else None
-
-    if request.method != "OPTIONS":
-        logger.info(
-            "access",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_ms": duration_ms,
-                "client": request.client.host if request.client else None,
-                "account": account,
-            },
-        )
-
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["Referrer-Policy"] = "strict-origin"
-
-    if is_prod:
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
-        response.headers["Strict-Transport-Security"] = (
-            "max-age=31536000; includeSubDomains"
-        )
-
-    return response
+app.include_router(api_router, prefix="/api")
+app.include_router(internal_router)
 
 
 # =================================
@@ -139,6 +148,14 @@ async def handle_db_error(request: Request, exc: SQLAlchemyError):
     )
 
 
+def _loggable_errors(errors) -> list[dict]:
+    # "input" echoes the rejected value: potentially large and often a secret.
+    return [
+        {key: value for key, value in error.items() if key != "input"}
+        for error in errors
+    ]
+
+
 @app.exception_handler(RequestValidationError)
 async def handle_validation_error(request: Request, exc: RequestValidationError):
     account_id = getattr(request.state, "account_id", None)
@@ -148,7 +165,7 @@ async def handle_validation_error(request: Request, exc: RequestValidationError)
         extra={
             "error_type": "validation_error",
             "status_code": 422,
-            "errors": exc.errors(),
+            "errors": _loggable_errors(exc.errors()),
             "path": str(request.url),
             "method": request.method,
             "account_id": account_id,
@@ -183,3 +200,9 @@ async def handle_generic_error(request: Request, exc: Exception):
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
+
+
+@app.get("/.well-known/jwks.json")
+async def jwks(response: Response):
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return ApiResponse.ok(data=access_token_jwks(), response=response)
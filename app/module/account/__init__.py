@@ -1,7 +1,11 @@
+from .async_module import AsyncAccountModule
 from .model import Account
-from .module import AccountModule
+from .module import AccountAuthState, AccountModule, unique_violation_column
 
 __all__ = [
     "Account",
+    "AccountAuthState",
     "AccountModule",
+    "AsyncAccountModule",
+    "unique_violation_column",
 ]
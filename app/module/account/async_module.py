@@ -0,0 +1,31 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from .model import Account
+from .module import AccountAuthState, account_auth_state_cache, auth_state_select
+
+
+class AsyncAccountModule:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, entity: Account) -> Account:
+        self.db.add(entity)
+        await self.db.flush()
+        return entity
+
+    async def get_auth_state(self, account_id: int) -> Optional[AccountAuthState]:
+        state = account_auth_state_cache.get(account_id)
+        if state is not None:
+            return state
+
+        generation = account_auth_state_cache.generation
+        row = (await self.db.execute(auth_state_select(account_id))).first()
+        if row is None:
+            return None
+
+        state = AccountAuthState(id=row[0], token_version=row[1], disabled=row[2])
+        account_auth_state_cache.set(account_id, state, generation=generation)
+        return state
+
+
+__all__ = ["AsyncAccountModule"]
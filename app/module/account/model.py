@@ -1,11 +1,24 @@
 from datetime import datetime
-from sqlalchemy import BigInteger, Integer, String, Text, DateTime, func
+from sqlalchemy import BigInteger, Index, Integer, String, Text, DateTime, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 from app.core.database import Base
 
 
 class Account(Base):
     __tablename__ = "account"
+    __table_args__ = (
+        Index(
+            "ix_account_disabled_id",
+            "id",
+            postgresql_where=text("deleted_at IS NULL AND disabled_at IS NOT NULL"),
+        ),
+        Index(
+            "ix_account_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     email: Mapped[str | None] = mapped_column(Text, nullable=True, unique=True)
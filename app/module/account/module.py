@@ -1,9 +1,90 @@
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Optional
 from datetime import datetime, timezone
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.core.config import config
+from app.core.database import after_commit
+from app.core.events import ChangeEvent, publish_change, subscribe
+from app.core.metrics import register_collector
 from .model import Account
 
+ACCOUNT_CHANGE_TOPIC = "account"
+# Ids per set-based UPDATE, keeping each statement's IN list and bind
+# parameters bounded however many accounts a bulk request names.
+BULK_UPDATE_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class AccountAuthState:
+    id: int
+    token_version: int
+    disabled: bool
+
+
+account_auth_state_cache = TTLCache(
+    maxsize=config.ACCOUNT_AUTH_STATE_CACHE_SIZE,
+    ttl=config.ACCOUNT_AUTH_STATE_CACHE_TTL_SECONDS,
+)
+register_collector("account_auth_state_cache", account_auth_state_cache.stats)
+
+
+def _on_account_changed(change: ChangeEvent) -> None:
+    if change.keys is None:
+        account_auth_state_cache.clear()
+        return
+    for account_id in change.keys:
+        account_auth_state_cache.invalidate(account_id)
+
+
+subscribe(ACCOUNT_CHANGE_TOPIC, _on_account_changed)
+
+
+def auth_state_select(account_id: int):
+    return select(
+        Account.id,
+        Account.token_version,
+        Account.disabled_at.is_not(None),
+    ).where(Account.deleted_at.is_(None), Account.id == account_id)
+
+
+def _disable_values() -> dict[str, Any]:
+    return {
+        "disabled_at": datetime.now(timezone.utc),
+        "token_version": Account.token_version + 1,
+    }
+
+
+# Postgres names the unnamed UNIQUE constraints account_<column>_key; SQLite
+# reports "UNIQUE constraint failed: account.<column>".
+_UNIQUE_COLUMNS = ("login_id", "email")
+
+
+def unique_violation_column(exc: IntegrityError) -> str | None:
+    table = Account.__tablename__
+    constraint = getattr(getattr(exc.orig, "diag", None), "constraint_name", None)
+    for column in _UNIQUE_COLUMNS:
+        if constraint is not None:
+            if constraint == f"{table}_{column}_key":
+                return column
+        elif f"{table}.{column}" in str(exc.orig):
+            return column
+    return None
+
+
+def _mark_accounts_changed(db: Session, account_ids: list[int]) -> None:
+    def invalidate() -> None:
+        for account_id in account_ids:
+            account_auth_state_cache.invalidate(account_id)
+
+    invalidate()
+    after_commit(db, invalidate)
+    for account_id in account_ids:
+        publish_change(db, ACCOUNT_CHANGE_TOPIC, account_id)
+
 
 class AccountModule:
     def __init__(self, db: Session):
@@ -13,19 +94,23 @@ class AccountModule:
         return select(Account).where(Account.deleted_at.is_(None))
 
     def create(self, entity: Account) -> Account:
+        # The flush INSERTs with RETURNING for the server defaults, so the
+        # entity is complete without a refresh. Duplicates raise
+        # IntegrityError; see unique_violation_column.
         self.db.add(entity)
         self.db.flush()
-        self.db.refresh(entity)
         return entity
 
-    def get_all(self) -> list[Account]:
-        stmt = self._base_select().order_by(Account.id)
-        return list(self.db.scalars(stmt).all())
-
     def get_by_id(self, account_id: int) -> Optional[Account]:
         stmt = self._base_select().where(Account.id == account_id)
         return self.db.scalars(stmt).first()
 
+    def exists(self, account_id: int) -> bool:
+        stmt = select(Account.id).where(
+            Account.deleted_at.is_(None), Account.id == account_id
+        )
+        return self.db.scalar(stmt) is not None
+
     def get_by_email(self, email: str) -> Optional[Account]:
         stmt = self._base_select().where(Account.email == email)
         return self.db.scalars(stmt).first()
@@ -34,18 +119,126 @@ class AccountModule:
         stmt = self._base_select().where(Account.login_id == login_id)
         return self.db.scalars(stmt).first()
 
+    def find_taken(
+        self, login_ids: list[str], emails: list[str]
+    ) -> tuple[set[str], set[str]]:
+        # Soft-deleted rows are included: the unique constraints cover them.
+        stmt = select(Account.login_id, Account.email).where(
+            or_(Account.login_id.in_(login_ids), Account.email.in_(emails))
+        )
+        rows = self.db.execute(stmt).all()
+        return {row.login_id for row in rows}, {row.email for row in rows}
+
+    def insert_many(self, values: list[dict[str, Any]]) -> dict[str, int]:
+        # One multi-row INSERT per batch. Rows hitting a unique constraint are
+        # skipped rather than failing the batch, and are missing from the
+        # returned login_id -> id mapping.
+        stmt = (
+            insert(Account.__table__)
+            .on_conflict_do_nothing()
+            .returning(Account.id, Account.login_id)
+        )
+        return {row.login_id: row.id for row in self.db.execute(stmt, values)}
+
+    def get_auth_state(self, account_id: int) -> Optional[AccountAuthState]:
+        state = account_auth_state_cache.get(account_id)
+        if state is not None:
+            return state
+
+        generation = account_auth_state_cache.generation
+        row = self.db.execute(auth_state_select(account_id)).first()
+        if row is None:
+            return None
+
+        state = AccountAuthState(id=row[0], token_version=row[1], disabled=row[2])
+        account_auth_state_cache.set(account_id, state, generation=generation)
+        return state
+
     def update(self, entity: Account) -> Account:
         self.db.flush()
+        self._mark_changed(entity.id)
         return entity
 
-    def disable(self, entity: Account) -> Account:
-        entity.disabled_at = datetime.now(timezone.utc)
-        entity.token_version += 1
-        return self.update(entity)
+    def update_by_id(
+        self, account_id: int, values: dict[str, Any]
+    ) -> Optional[Account]:
+        return self._update_returning(values, Account.id == account_id)
 
-    def enable(self, entity: Account) -> Account:
-        entity.disabled_at = None
-        return self.update(entity)
+    def change_password(
+        self, account_id: int, current_hash: str, new_hash: str
+    ) -> Optional[Account]:
+        # Compare-and-set on the hash the caller verified: if the password
+        # changed in between, no row matches and None is returned.
+        return self._update_returning(
+            {"password_hash": new_hash, "token_version": Account.token_version + 1},
+            Account.id == account_id,
+            Account.password_hash == current_hash,
+        )
+
+    def rehash_password(
+        self, account_id: int, current_hash: str, new_hash: str
+    ) -> None:
+        # Same password under new hash parameters: token_version and the
+        # cached auth state are unchanged, so nothing is invalidated or
+        # published. Compare-and-set so a concurrent password change wins.
+        stmt = (
+            update(Account)
+            .where(Account.id == account_id, Account.password_hash == current_hash)
+            .values(password_hash=new_hash)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.execute(stmt)
+
+    def disable(self, account_id: int) -> Optional[Account]:
+        return self.update_by_id(account_id, _disable_values())
+
+    def enable(self, account_id: int) -> Optional[Account]:
+        return self.update_by_id(account_id, {"disabled_at": None})
+
+    def disable_many(self, account_ids: list[int]) -> list[int]:
+        # Already disabled accounts are left alone, so the returned ids are
+        # exactly the accounts whose tokens this call revoked.
+        return self._update_many(
+            _disable_values(), account_ids, Account.disabled_at.is_(None)
+        )
+
+    def enable_many(self, account_ids: list[int]) -> list[int]:
+        return self._update_many(
+            {"disabled_at": None}, account_ids, Account.disabled_at.is_not(None)
+        )
+
+    def _update_many(
+        self, values: dict[str, Any], account_ids: list[int], *conditions
+    ) -> list[int]:
+        ordered = sorted(set(account_ids))
+        updated: list[int] = []
+        for start in range(0, len(ordered), BULK_UPDATE_CHUNK_SIZE):
+            chunk = ordered[start : start + BULK_UPDATE_CHUNK_SIZE]
+            stmt = (
+                update(Account)
+                .where(Account.deleted_at.is_(None), Account.id.in_(chunk), *conditions)
+                .values(values)
+                .returning(Account.id)
+            )
+            updated.extend(self.db.scalars(stmt))
+        _mark_accounts_changed(self.db, updated)
+        return updated
+
+    def _update_returning(
+        self, values: dict[str, Any], *conditions
+    ) -> Optional[Account]:
+        # One UPDATE ... RETURNING instead of SELECT then flush; the returned
+        # row also carries the new updated_at, so nothing is lazy-loaded.
+        stmt = (
+            update(Account)
+            .where(Account.deleted_at.is_(None), *conditions)
+            .values(values)
+            .returning(Account)
+        )
+        account = self.db.scalars(stmt).first()
+        if account is not None:
+            self._mark_changed(account.id)
+        return account
 
     def delete(self, entity: Account, soft: bool = True) -> bool:
         if not entity:
@@ -57,7 +250,17 @@ class AccountModule:
             return True
 
         self.db.delete(entity)
+        self._mark_changed(entity.id)
         return True
 
+    def _mark_changed(self, account_id: int) -> None:
+        _mark_accounts_changed(self.db, [account_id])
+
 
-__all__ = ["AccountModule", "Account"]
+__all__ = [
+    "AccountModule",
+    "Account",
+    "AccountAuthState",
+    "auth_state_select",
+    "unique_violation_column",
+]
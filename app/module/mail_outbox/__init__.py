@@ -0,0 +1,8 @@
+from .model import MailOutbox
+from .module import ClaimedMail, MailOutboxModule
+
+__all__ = [
+    "ClaimedMail",
+    "MailOutbox",
+    "MailOutboxModule",
+]
@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+from app.core.config import config
+from app.core.crypto import decrypt_text, encrypt_text
+from app.core.database import after_commit
+from app.core.mailer import mail_outbox_wakeup
+from .model import MailOutbox
+
+# Claimed mail is invisible to other dispatchers for this long. A dispatcher
+# that dies mid-send leaves its claim to expire, and the mail is retried.
+CLAIM_LEASE = timedelta(minutes=10)
+
+
+@dataclass(frozen=True)
+class ClaimedMail:
+    id: int
+    recipient: str
+    subject: str
+    # None when the stored body cannot be decrypted with MAIL_OUTBOX_SECRET.
+    body: str | None
+    attempts: int
+
+
+class MailOutboxModule:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, recipient: str, subject: str, body: str) -> MailOutbox:
+        # Bodies can carry credentials such as password reset links, so only
+        # ciphertext is stored.
+        entity = MailOutbox(
+            recipient=recipient,
+            subject=subject,
+            body=encrypt_text(body, config.MAIL_OUTBOX_SECRET),
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+        self.db.add(entity)
+        self.db.flush()
+        after_commit(self.db, mail_outbox_wakeup.set)
+        return entity
+
+    def claim_due(self, limit: int) -> list[ClaimedMail]:
+        # SKIP LOCKED lets dispatchers in every worker drain the table
+        # together without waiting on, or double-sending, each other's rows.
+        now = datetime.now(timezone.utc)
+        due = (
+            select(MailOutbox.id)
+            .where(MailOutbox.failed_at.is_(None), MailOutbox.next_attempt_at <= now)
+            .order_by(MailOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(MailOutbox)
+            .where(MailOutbox.id.in_(due.scalar_subquery()))
+            .values(
+                attempts=MailOutbox.attempts + 1,
+                next_attempt_at=now + CLAIM_LEASE,
+            )
+            .returning(
+                MailOutbox.id,
+                MailOutbox.recipient,
+                MailOutbox.subject,
+                MailOutbox.body,
+                MailOutbox.attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        # Plain values, not entities: the claim is committed before sending,
+        # and nothing should be reloaded from the database after that.
+        return [
+            ClaimedMail(
+                id=row.id,
+                recipient=row.recipient,
+                subject=row.subject,
+                body=decrypt_text(row.body, config.MAIL_OUTBOX_SECRET),
+                attempts=row.attempts,
+            )
+            for row in self.db.execute(stmt)
+        ]
+
+    def delete_sent(self, outbox_id: int) -> None:
+        # Sent mail is removed rather than kept: even encrypted, a reset link
+        # has no business outliving its delivery.
+        self.db.execute(delete(MailOutbox).where(MailOutbox.id == outbox_id))
+
+    def schedule_retry(self, outbox_id: int, error: str, delay: timedelta) -> None:
+        stmt = (
+            update(MailOutbox)
+            .where(MailOutbox.id == outbox_id)
+            .values(
+                last_error=error,
+                next_attempt_at=datetime.now(timezone.utc) + delay,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.execute(stmt)
+
+    def mark_failed(self, outbox_id: int, error: str) -> None:
+        # Kept for inspection, but without the body, as in delete_sent.
+        stmt = (
+            update(MailOutbox)
+            .where(MailOutbox.id == outbox_id)
+            .values(last_error=error, failed_at=datetime.now(timezone.utc), body="")
+            .execution_options(synchronize_session=False)
+        )
+        self.db.execute(stmt)
+
+
+__all__ = ["ClaimedMail", "MailOutboxModule", "MailOutbox"]
@@ -1,4 +1,9 @@
+from .async_module import AsyncPasswordResetTokenModule
 from .model import PasswordResetToken
 from .module import PasswordResetTokenModule
 
-__all__ = ["PasswordResetToken", "PasswordResetTokenModule"]
+__all__ = [
+    "AsyncPasswordResetTokenModule",
+    "PasswordResetToken",
+    "PasswordResetTokenModule",
+]
@@ -0,0 +1,16 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .model import PasswordResetToken
+
+
+class AsyncPasswordResetTokenModule:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_hash(self, token_hash: str) -> Optional[PasswordResetToken]:
+        stmt = select(PasswordResetToken).where(
+            PasswordResetToken.token_hash == token_hash
+        )
+        return (await self.db.scalars(stmt)).first()
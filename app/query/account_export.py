@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Iterator, TypedDict
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.module.account import Account
+
+
+class AccountExportRow(TypedDict):
+    id: int
+    login_id: str
+    email: str | None
+    first_name: str
+    last_name: str
+    disabled_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+
+
+ACCOUNT_EXPORT_COLUMNS = tuple(AccountExportRow.__annotations__)
+
+
+class AccountExportQuery:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def stream(self, batch_size: int = 1000) -> Iterator[list[AccountExportRow]]:
+        # yield_per streams from a server-side cursor, so only one batch of
+        # plain rows is held in memory at a time.
+        stmt = (
+            select(*(getattr(Account, column) for column in ACCOUNT_EXPORT_COLUMNS))
+            .where(Account.deleted_at.is_(None))
+            .order_by(Account.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for partition in self.db.execute(stmt).mappings().partitions():
+            yield [dict(row) for row in partition]
@@ -0,0 +1,169 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, TypedDict
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.module.account import Account
+
+
+class AccountView(TypedDict):
+    id: int
+    email: str | None
+    login_id: str
+    first_name: str
+    last_name: str
+    disabled_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class AccountFilter:
+    disabled: bool | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+# Core select of the response columns only: no password_hash, no ORM identity
+# map, no attribute instrumentation.
+_VIEW_COLUMNS = tuple(
+    getattr(Account, column) for column in AccountView.__annotations__
+)
+
+
+def _view_select(*columns) -> Select:
+    return select(*(columns or _VIEW_COLUMNS)).where(Account.deleted_at.is_(None))
+
+
+def _page_select(
+    account_filter: AccountFilter,
+    after_id: int | None,
+    limit: int,
+    *columns,
+):
+    # Keyset pagination on the primary key; see the partial indexes on Account.
+    stmt = _view_select(*columns)
+    if after_id is not None:
+        stmt = stmt.where(Account.id > after_id)
+    if account_filter.disabled is True:
+        stmt = stmt.where(Account.disabled_at.is_not(None))
+    elif account_filter.disabled is False:
+        stmt = stmt.where(Account.disabled_at.is_(None))
+    if account_filter.created_from is not None:
+        stmt = stmt.where(Account.created_at >= account_filter.created_from)
+    if account_filter.created_to is not None:
+        stmt = stmt.where(Account.created_at < account_filter.created_to)
+    return stmt.order_by(Account.id).limit(limit)
+
+
+def _version(*parts: object) -> str:
+    return hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+
+
+def view_version(account_id: int, updated_at: datetime) -> str:
+    # updated_at is bumped by every ORM update, including disable and delete.
+    return _version(account_id, updated_at.timestamp())
+
+
+def page_version(rows: Iterable[tuple[int, datetime]]) -> str:
+    # Count and id sum catch rows entering or leaving the page; max(updated_at)
+    # catches edits. Computed identically from loaded rows and from SQL.
+    count, id_sum, latest = 0, 0, None
+    for account_id, updated_at in rows:
+        count += 1
+        id_sum += account_id
+        latest = updated_at if latest is None else max(latest, updated_at)
+    return _page_version(count, id_sum, latest)
+
+
+def _page_version(count: int, id_sum: int, latest: datetime | None) -> str:
+    return _version(count, id_sum, latest.timestamp() if latest else None)
+
+
+def _version_select(account_id: int) -> Select:
+    return _view_select(Account.id, Account.updated_at).where(Account.id == account_id)
+
+
+def _page_version_select(
+    account_filter: AccountFilter,
+    after_id: int | None,
+    limit: int,
+) -> Select:
+    page = _page_select(
+        account_filter, after_id, limit, Account.id, Account.updated_at
+    ).subquery()
+    return select(
+        func.count(),
+        func.coalesce(func.sum(page.c.id), 0),
+        func.max(page.c.updated_at),
+    )
+
+
+class AccountViewQuery:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_page(
+        self,
+        account_filter: AccountFilter,
+        after_id: int | None,
+        limit: int,
+    ) -> list[AccountView]:
+        stmt = _page_select(account_filter, after_id, limit)
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
+
+    def get(self, account_id: int) -> AccountView | None:
+        stmt = _view_select().where(Account.id == account_id)
+        row = self.db.execute(stmt).mappings().first()
+        return dict(row) if row is not None else None
+
+    def get_version(self, account_id: int) -> str | None:
+        row = self.db.execute(_version_select(account_id)).first()
+        return view_version(*row) if row is not None else None
+
+    def get_page_version(
+        self,
+        account_filter: AccountFilter,
+        after_id: int | None,
+        limit: int,
+    ) -> str:
+        stmt = _page_version_select(account_filter, after_id, limit)
+        count, id_sum, latest = self.db.execute(stmt).one()
+        return _page_version(count, int(id_sum), latest)
+
+
+class AsyncAccountViewQuery:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_page(
+        self,
+        account_filter: AccountFilter,
+        after_id: int | None,
+        limit: int,
+    ) -> list[AccountView]:
+        stmt = _page_select(account_filter, after_id, limit)
+        return [dict(row) for row in (await self.db.execute(stmt)).mappings()]
+
+    async def get(self, account_id: int) -> AccountView | None:
+        stmt = _view_select().where(Account.id == account_id)
+        row = (await self.db.execute(stmt)).mappings().first()
+        return dict(row) if row is not None else None
+
+    async def get_version(self, account_id: int) -> str | None:
+        row = (await self.db.execute(_version_select(account_id))).first()
+        return view_version(*row) if row is not None else None
+
+    async def get_page_version(
+        self,
+        account_filter: AccountFilter,
+        after_id: int | None,
+        limit: int,
+    ) -> str:
+        stmt = _page_version_select(account_filter, after_id, limit)
+        count, id_sum, latest = (await self.db.execute(stmt)).one()
+        return _page_version(count, int(id_sum), latest)
@@ -1,9 +1,23 @@
 from fastapi import APIRouter
 
+from app.core.config import config
+from app.handler.accounts import export_router as accounts_export_router
 from app.handler.accounts import router as accounts_router
+from app.handler.accounts_async import router as accounts_async_router
 from app.handler.auth import router as auth_router
+from app.handler.auth_async import router as auth_async_router
 
 
-api_router = APIRouter()
-api_router.include_router(auth_router)
-api_router.include_router(accounts_router)
+def build_api_router(database_mode: str) -> APIRouter:
+    api_router = APIRouter()
+    api_router.include_router(accounts_export_router)
+    if database_mode == "async":
+        # Earlier routes win, so the async handlers shadow their sync twins.
+        api_router.include_router(auth_async_router)
+        api_router.include_router(accounts_async_router)
+    api_router.include_router(auth_router)
+    api_router.include_router(accounts_router)
+    return api_router
+
+
+api_router = build_api_router(config.DATABASE_MODE)
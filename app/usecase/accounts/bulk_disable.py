@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from sqlalchemy.orm import Session
+from app.module.account.module import AccountModule
+
+
+@dataclass(frozen=True)
+class BulkDisableAccountsInput:
+    account_ids: list[int]
+
+
+class BulkDisableAccountsUsecase:
+    def __init__(self, db: Session):
+        self.db = db
+        self.module = AccountModule(db)
+
+    def execute(self, input: BulkDisableAccountsInput) -> list[int]:
+        disabled_ids = self.module.disable_many(input.account_ids)
+        self.db.commit()
+        return disabled_ids
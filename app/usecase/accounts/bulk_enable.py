@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from sqlalchemy.orm import Session
+from app.module.account.module import AccountModule
+
+
+@dataclass(frozen=True)
+class BulkEnableAccountsInput:
+    account_ids: list[int]
+
+
+class BulkEnableAccountsUsecase:
+    def __init__(self, db: Session):
+        self.db = db
+        self.module = AccountModule(db)
+
+    def execute(self, input: BulkEnableAccountsInput) -> list[int]:
+        enabled_ids = self.module.enable_many(input.account_ids)
+        self.db.commit()
+        return enabled_ids
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.crypto import hash_password
-from app.core.error import AppError, ErrorCode
-from app.module.account.module import AccountModule, Account
-from app.usecase.helper import resolve_login_id
+from app.core.crypto import hash_password, hash_password_async
+from app.module.account import Account, AccountModule, AsyncAccountModule
+from app.usecase.helper import raise_account_conflict, resolve_login_id
 
 
 @dataclass(frozen=True)
@@ -23,24 +24,43 @@ class CreateAccountUsecase:
     def execute(self, input: CreateAccountInput) -> Account:
         login_id = resolve_login_id(input.login_id, input.email)
 
-        existing_login_id = self.module.get_by_login_id(login_id)
-        if existing_login_id:
-            raise AppError(code=ErrorCode.LOGIN_ID_ALREADY_EXISTS)
-
-        if input.email is not None:
-            existing_email = self.module.get_by_email(input.email)
-            if existing_email:
-                raise AppError(code=ErrorCode.EMAIL_ALREADY_EXISTS)
-
-        account = self.module.create(
-            Account(
-                login_id=login_id,
-                email=input.email,
-                password_hash=hash_password(input.password),
-                first_name=input.first_name,
-                last_name=input.last_name,
+        try:
+            account = self.module.create(
+                Account(
+                    login_id=login_id,
+                    email=input.email,
+                    password_hash=hash_password(input.password),
+                    first_name=input.first_name,
+                    last_name=input.last_name,
+                )
             )
-        )
+        except IntegrityError as exc:
+            raise_account_conflict(exc, login_id, input.email)
 
         self.db.commit()
         return account
+
+
+class AsyncCreateAccountUsecase:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.module = AsyncAccountModule(db)
+
+    async def execute(self, input: CreateAccountInput) -> Account:
+        login_id = resolve_login_id(input.login_id, input.email)
+
+        try:
+            account = await self.module.create(
+                Account(
+                    login_id=login_id,
+                    email=input.email,
+                    password_hash=await hash_password_async(input.password),
+                    first_name=input.first_name,
+                    last_name=input.last_name,
+                )
+            )
+        except IntegrityError as exc:
+            raise_account_conflict(exc, login_id, input.email)
+
+        await self.db.commit()
+        return account
@@ -15,10 +15,9 @@ class DisableAccountUsecase:
         self.module = AccountModule(db)
 
     def execute(self, input: DisableAccountInput) -> Account:
-        account = self.module.get_by_id(input.account_id)
-        if not account:
+        disabled_account = self.module.disable(input.account_id)
+        if not disabled_account:
             raise AppError(code=ErrorCode.ACCOUNT_NOT_FOUND)
 
-        disabled_account = self.module.disable(account)
         self.db.commit()
         return disabled_account
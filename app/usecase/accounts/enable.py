@@ -15,10 +15,9 @@ class EnableAccountUsecase:
         self.module = AccountModule(db)
 
     def execute(self, input: EnableAccountInput) -> Account:
-        account = self.module.get_by_id(input.account_id)
-        if not account:
+        enabled_account = self.module.enable(input.account_id)
+        if not enabled_account:
             raise AppError(code=ErrorCode.ACCOUNT_NOT_FOUND)
 
-        enabled_account = self.module.enable(account)
         self.db.commit()
         return enabled_account
@@ -0,0 +1,20 @@
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+from app.query.account_export import (
+    ACCOUNT_EXPORT_COLUMNS,
+    AccountExportQuery,
+    AccountExportRow,
+)
+
+
+class ExportAccountsUsecase:
+    read_only = True
+    columns = ACCOUNT_EXPORT_COLUMNS
+
+    def __init__(self, db: Session):
+        self.query = AccountExportQuery(db)
+
+    def execute(self) -> Iterator[list[AccountExportRow]]:
+        return self.query.stream()
@@ -1,7 +1,13 @@
 from dataclasses import dataclass
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.core.error import AppError, ErrorCode
-from app.module.account.module import AccountModule, Account
+from app.query.account_view import (
+    AccountView,
+    AccountViewQuery,
+    AsyncAccountViewQuery,
+    view_version,
+)
 
 
 @dataclass(frozen=True)
@@ -9,12 +15,46 @@ class GetCurrentAccountInput:
     account_id: int
 
 
+@dataclass(frozen=True)
+class GetCurrentAccountResult:
+    account: AccountView
+    version: str
+
+
 class GetCurrentAccountUsecase:
+    read_only = True
+
     def __init__(self, db: Session):
-        self.module = AccountModule(db)
+        self.query = AccountViewQuery(db)
+
+    def execute(self, input: GetCurrentAccountInput) -> GetCurrentAccountResult:
+        account = self.query.get(input.account_id)
+        if not account:
+            raise AppError(code=ErrorCode.ACCOUNT_NOT_FOUND)
+        return _result(account)
 
-    def execute(self, input: GetCurrentAccountInput) -> Account:
-        account = self.module.get_by_id(input.account_id)
+    def version(self, input: GetCurrentAccountInput) -> str | None:
+        return self.query.get_version(input.account_id)
+
+
+class AsyncGetCurrentAccountUsecase:
+    read_only = True
+
+    def __init__(self, db: AsyncSession):
+        self.query = AsyncAccountViewQuery(db)
+
+    async def execute(self, input: GetCurrentAccountInput) -> GetCurrentAccountResult:
+        account = await self.query.get(input.account_id)
         if not account:
             raise AppError(code=ErrorCode.ACCOUNT_NOT_FOUND)
-        return account
+        return _result(account)
+
+    async def version(self, input: GetCurrentAccountInput) -> str | None:
+        return await self.query.get_version(input.account_id)
+
+
+def _result(account: AccountView) -> GetCurrentAccountResult:
+    return GetCurrentAccountResult(
+        account=account,
+        version=view_version(account["id"], account["updated_at"]),
+    )
@@ -0,0 +1,117 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy.orm import Session
+
+from app.core.crypto import hash_passwords
+from app.core.error import AppError, ErrorCode
+from app.module.account import AccountModule
+from app.usecase.accounts.create import CreateAccountInput
+from app.usecase.helper import resolve_login_id
+
+
+@dataclass(frozen=True)
+class ImportAccountResult:
+    status: Literal["created", "conflict", "invalid"]
+    account_id: int | None = None
+    error: str | None = None
+
+
+class ImportAccountsUsecase:
+    """Creates one batch of accounts and reports an outcome per input.
+
+    Conflicting or invalid rows are reported, not raised, so one bad row
+    never aborts the batch. Each batch commits on its own; re-running an
+    import reports the rows that already exist as conflicts.
+    """
+
+    def __init__(self, db: Session, executor: Executor):
+        self.db = db
+        self.executor = executor
+        self.module = AccountModule(db)
+
+    def execute(self, inputs: list[CreateAccountInput]) -> list[ImportAccountResult]:
+        results: list[ImportAccountResult | None] = [None] * len(inputs)
+        login_ids: dict[int, str] = {}
+        for index, input in enumerate(inputs):
+            try:
+                login_ids[index] = resolve_login_id(input.login_id, input.email)
+            except AppError as exc:
+                # AppError.code is already the ErrorCode value, as in _conflict.
+                results[index] = ImportAccountResult("invalid", error=exc.code)
+
+        # Skip known conflicts before hashing, which dominates the cost.
+        taken_login_ids, taken_emails = self.module.find_taken(
+            list(login_ids.values()),
+            [inputs[index].email for index in login_ids if inputs[index].email],
+        )
+        pending = []
+        for index, login_id in login_ids.items():
+            email = inputs[index].email
+            code = _conflict_code(login_id, email, taken_login_ids, taken_emails)
+            if code is not None:
+                results[index] = _conflict(code)
+            else:
+                pending.append(index)
+            # Later duplicates within the batch conflict with this row.
+            taken_login_ids.add(login_id)
+            if email is not None:
+                taken_emails.add(email)
+
+        if pending:
+            password_hashes = hash_passwords(
+                [inputs[index].password for index in pending], self.executor
+            )
+            created = self.module.insert_many(
+                [
+                    {
+                        "login_id": login_ids[index],
+                        "email": inputs[index].email,
+                        "password_hash": password_hash,
+                        "first_name": inputs[index].first_name,
+                        "last_name": inputs[index].last_name,
+                    }
+                    for index, password_hash in zip(pending, password_hashes)
+                ]
+            )
+            self.db.commit()
+            # Not returned: inserted concurrently since find_taken. Look again
+            # to report which key conflicted.
+            skipped = [index for index in pending if login_ids[index] not in created]
+            if skipped:
+                taken_login_ids, taken_emails = self.module.find_taken(
+                    [login_ids[index] for index in skipped],
+                    [inputs[index].email for index in skipped if inputs[index].email],
+                )
+            for index in pending:
+                account_id = created.get(login_ids[index])
+                if account_id is not None:
+                    results[index] = ImportAccountResult(
+                        "created", account_id=account_id
+                    )
+                    continue
+                code = _conflict_code(
+                    login_ids[index], inputs[index].email, taken_login_ids, taken_emails
+                )
+                # Without a match the conflicting row is gone again already.
+                results[index] = _conflict(code or ErrorCode.LOGIN_ID_ALREADY_EXISTS)
+
+        return results
+
+
+def _conflict_code(
+    login_id: str,
+    email: str | None,
+    taken_login_ids: set[str],
+    taken_emails: set[str],
+) -> ErrorCode | None:
+    if login_id in taken_login_ids:
+        return ErrorCode.LOGIN_ID_ALREADY_EXISTS
+    if email is not None and email in taken_emails:
+        return ErrorCode.EMAIL_ALREADY_EXISTS
+    return None
+
+
+def _conflict(code: ErrorCode) -> ImportAccountResult:
+    return ImportAccountResult("conflict", error=code.value)
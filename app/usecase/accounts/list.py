@@ -1,10 +1,99 @@
+from dataclasses import dataclass
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.module.account.module import AccountModule, Account
+from app.query.account_view import (
+    AccountFilter,
+    AccountView,
+    AccountViewQuery,
+    AsyncAccountViewQuery,
+    page_version,
+)
+
+
+@dataclass(frozen=True)
+class ListAccountsInput:
+    limit: int
+    after_id: int | None = None
+    disabled: bool | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+@dataclass(frozen=True)
+class ListAccountsResult:
+    accounts: list[AccountView]
+    next_after_id: int | None
+    version: str
 
 
 class ListAccountsUsecase:
+    read_only = True
+
     def __init__(self, db: Session):
-        self.module = AccountModule(db)
+        self.query = AccountViewQuery(db)
+
+    def execute(self, input: ListAccountsInput) -> ListAccountsResult:
+        # One extra row tells whether another page exists without a COUNT.
+        accounts = self.query.get_page(
+            _account_filter(input),
+            input.after_id,
+            input.limit + 1,
+        )
+        return _page_result(accounts, input.limit)
+
+    def version(self, input: ListAccountsInput) -> str:
+        return self.query.get_page_version(
+            _account_filter(input),
+            input.after_id,
+            input.limit + 1,
+        )
+
+
+class AsyncListAccountsUsecase:
+    read_only = True
+
+    def __init__(self, db: AsyncSession):
+        self.query = AsyncAccountViewQuery(db)
+
+    async def execute(self, input: ListAccountsInput) -> ListAccountsResult:
+        accounts = await self.query.get_page(
+            _account_filter(input),
+            input.after_id,
+            input.limit + 1,
+        )
+        return _page_result(accounts, input.limit)
+
+    async def version(self, input: ListAccountsInput) -> str:
+        return await self.query.get_page_version(
+            _account_filter(input),
+            input.after_id,
+            input.limit + 1,
+        )
+
+
+def _account_filter(input: ListAccountsInput) -> AccountFilter:
+    return AccountFilter(
+        disabled=input.disabled,
+        created_from=input.created_from,
+        created_to=input.created_to,
+    )
+
 
-    def execute(self) -> list[Account]:
-        return self.module.get_all()
+def _page_result(accounts: list[AccountView], limit: int) -> ListAccountsResult:
+    # The version covers the extra row too, matching get_page_version.
+    version = page_version(
+        (account["id"], account["updated_at"]) for account in accounts
+    )
+    if len(accounts) <= limit:
+        return ListAccountsResult(
+            accounts=accounts,
+            next_after_id=None,
+            version=version,
+        )
+    page = accounts[:limit]
+    return ListAccountsResult(
+        accounts=page,
+        next_after_id=page[-1]["id"],
+        version=version,
+    )
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
+from typing import Any
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.core.crypto import hash_password
 from app.core.error import AppError, ErrorCode
 from app.module.account.module import AccountModule, Account
-from app.usecase.helper import resolve_login_id
+from app.usecase.helper import raise_account_conflict, resolve_login_id
 
 
 @dataclass(frozen=True)
@@ -22,30 +24,28 @@ class UpdateAccountUsecase:
         self.module = AccountModule(db)
 
     def execute(self, input: UpdateAccountInput) -> Account:
-        account = self.module.get_by_id(input.account_id)
-        if not account:
-            raise AppError(code=ErrorCode.ACCOUNT_NOT_FOUND)
-
         login_id = resolve_login_id(input.login_id, input.email)
 
-        existing_login_id = self.module.get_by_login_id(login_id)
-        if existing_login_id and existing_login_id.id != account.id:
-            raise AppError(code=ErrorCode.LOGIN_ID_ALREADY_EXISTS)
-
-        if input.email is not None:
-            existing_email = self.module.get_by_email(input.email)
-            if existing_email and existing_email.id != account.id:
-                raise AppError(code=ErrorCode.EMAIL_ALREADY_EXISTS)
-
-        account.login_id = login_id
-        account.email = input.email
-        account.first_name = input.first_name
-        account.last_name = input.last_name
-
+        values: dict[str, Any] = {
+            "login_id": login_id,
+            "email": input.email,
+            "first_name": input.first_name,
+            "last_name": input.last_name,
+        }
         if input.password is not None:
-            account.password_hash = hash_password(input.password)
-            account.token_version += 1
+            # Hashing takes a password hasher slot shared with logins; do not
+            # spend one on an account that is not there.
+            if not self.module.exists(input.account_id):
+                raise AppError(code=ErrorCode.ACCOUNT_NOT_FOUND)
+            values["password_hash"] = hash_password(input.password)
+            values["token_version"] = Account.token_version + 1
+
+        try:
+            updated_account = self.module.update_by_id(input.account_id, values)
+        except IntegrityError as exc:
+            raise_account_conflict(exc, login_id, input.email)
+        if not updated_account:
+            raise AppError(code=ErrorCode.ACCOUNT_NOT_FOUND)
 
-        updated_account = self.module.update(account)
         self.db.commit()
         return updated_account
@@ -26,8 +26,12 @@ class UpdatePasswordUsecase:
         if not verify_password(input.old_password, account.password_hash):
             raise AppError(code=ErrorCode.CURRENT_PASSWORD_INCORRECT)
 
-        account.password_hash = hash_password(input.new_password)
-        account.token_version += 1
+        updated = self.module.change_password(
+            account.id,
+            current_hash=account.password_hash,
+            new_hash=hash_password(input.new_password),
+        )
+        if not updated:
+            raise AppError(code=ErrorCode.OPTIMISTIC_LOCK_CONFLICT)
 
-        self.module.update(account)
         self.db.commit()
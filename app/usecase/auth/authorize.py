@@ -1,29 +1,50 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.error import AppError, ErrorCode
-from app.module.account import AccountModule
+from app.module.account import AccountAuthState, AccountModule, AsyncAccountModule
 
 
+# Not read_only: get_auth_state caches what it reads, and a lagging replica
+# would re-cache a revoked token_version or disabled flag for the full TTL.
 class AuthorizeAccessTokenUsecase:
     def __init__(self, db: Session):
         self.accounts = AccountModule(db)
 
     def execute(self, payload: dict) -> int:
-        sub = payload.get("sub")
-        token_version = payload.get("token_version")
-        if sub is None or token_version is None:
-            raise AppError(code=ErrorCode.AUTH_INVALID_PAYLOAD)
-
-        try:
-            account_id = int(sub)
-        except ValueError as exc:
-            raise AppError(code=ErrorCode.AUTH_INVALID_SUBJECT) from exc
-
-        account = self.accounts.get_by_id(account_id)
-        if not account:
-            raise AppError(code=ErrorCode.AUTH_NOT_FOUND)
-        if account.disabled_at is not None:
-            raise AppError(code=ErrorCode.ACCOUNT_DISABLED)
-        if token_version != account.token_version:
-            raise AppError(code=ErrorCode.AUTH_TOKEN_REVOKED)
-        return account.id
+        account_id, token_version = _parse_payload(payload)
+        state = self.accounts.get_auth_state(account_id)
+        return _authorize(state, token_version)
+
+
+class AsyncAuthorizeAccessTokenUsecase:
+    def __init__(self, db: AsyncSession):
+        self.accounts = AsyncAccountModule(db)
+
+    async def execute(self, payload: dict) -> int:
+        account_id, token_version = _parse_payload(payload)
+        state = await self.accounts.get_auth_state(account_id)
+        return _authorize(state, token_version)
+
+
+def _parse_payload(payload: dict) -> tuple[int, object]:
+    sub = payload.get("sub")
+    token_version = payload.get("token_version")
+    if sub is None or token_version is None:
+        raise AppError(code=ErrorCode.AUTH_INVALID_PAYLOAD)
+
+    try:
+        account_id = int(sub)
+    except ValueError as exc:
+        raise AppError(code=ErrorCode.AUTH_INVALID_SUBJECT) from exc
+    return account_id, token_version
+
+
+def _authorize(state: AccountAuthState | None, token_version: object) -> int:
+    if not state:
+        raise AppError(code=ErrorCode.AUTH_NOT_FOUND)
+    if state.disabled:
+        raise AppError(code=ErrorCode.ACCOUNT_DISABLED)
+    if token_version != state.token_version:
+        raise AppError(code=ErrorCode.AUTH_TOKEN_REVOKED)
+    return state.id
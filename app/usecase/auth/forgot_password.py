@@ -6,8 +6,8 @@ from sqlalchemy.orm import Session
 
 from app.core.config import config
 from app.core.crypto import generate_token, hash_token
-from app.core.mailer import get_mailer
 from app.module.account import AccountModule
+from app.module.mail_outbox import MailOutboxModule
 from app.module.password_reset_token import (
     PasswordResetToken,
     PasswordResetTokenModule,
@@ -24,6 +24,7 @@ class ForgotPasswordUsecase:
         self.db = db
         self.account_module = AccountModule(db)
         self.token_module = PasswordResetTokenModule(db)
+        self.outbox_module = MailOutboxModule(db)
 
     def execute(self, input: ForgotPasswordInput) -> None:
         account = self.account_module.get_by_email(input.email)
@@ -54,7 +55,6 @@ class ForgotPasswordUsecase:
                 expires_at=expires_at,
             )
         )
-        self.db.commit()
 
         reset_url = _build_reset_url(raw_token)
         body = _build_mail_body(
@@ -63,11 +63,14 @@ class ForgotPasswordUsecase:
             expires_minutes=config.PASSWORD_RESET_TOKEN_EXPIRES_MINUTES,
         )
 
-        get_mailer().send(
-            to=account.email,
+        # Queued in the token's transaction: the mail goes out if and only if
+        # the token is committed, and SMTP latency stays out of the request.
+        self.outbox_module.enqueue(
+            recipient=account.email,
             subject="Password reset",
             body=body,
         )
+        self.db.commit()
 
 
 def _build_reset_url(token: str) -> str:
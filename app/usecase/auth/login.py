@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from sqlalchemy.orm import Session
 from app.module.account.module import AccountModule, Account
-from app.core.crypto import verify_password
+from app.core.crypto import hash_password, needs_rehash, verify_password
 from app.core.error import AppError, ErrorCode
 from app.core.jwt import create_token_pair
 
@@ -22,6 +22,7 @@ class LoginResult:
 
 class LoginUsecase:
     def __init__(self, db: Session):
+        self.db = db
         self.module = AccountModule(db)
 
     def execute(self, input: LoginInput) -> LoginResult:
@@ -33,6 +34,9 @@ class LoginUsecase:
         if account.disabled_at is not None:
             raise AppError(code=ErrorCode.ACCOUNT_DISABLED)
 
+        if needs_rehash(account.password_hash):
+            self._rehash_password(account, input.password)
+
         access_token, refresh_token = create_token_pair(
             account.id,
             account.token_version,
@@ -44,3 +48,15 @@ class LoginUsecase:
             access_token=access_token,
             refresh_token=refresh_token,
         )
+
+    def _rehash_password(self, account: Account, password: str) -> None:
+        try:
+            new_hash = hash_password(password)
+        except AppError as exc:
+            # The upgrade is retried on a later login; it must not fail this one.
+            if exc.code != ErrorCode.PASSWORD_HASHER_BUSY.value:
+                raise
+            return
+
+        self.module.rehash_password(account.id, account.password_hash, new_hash)
+        self.db.commit()
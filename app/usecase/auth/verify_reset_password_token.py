@@ -1,11 +1,16 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.crypto import hash_token
 from app.core.error import AppError, ErrorCode
-from app.module.password_reset_token import PasswordResetTokenModule
+from app.module.password_reset_token import (
+    AsyncPasswordResetTokenModule,
+    PasswordResetToken,
+    PasswordResetTokenModule,
+)
 
 
 @dataclass(frozen=True)
@@ -14,18 +19,35 @@ class VerifyResetPasswordTokenInput:
 
 
 class VerifyResetPasswordTokenUsecase:
+    read_only = True
+
     def __init__(self, db: Session):
         self.token_module = PasswordResetTokenModule(db)
 
     def execute(self, input: VerifyResetPasswordTokenInput) -> None:
         token_hash = hash_token(input.token)
         token = self.token_module.get_by_hash(token_hash)
+        _validate_token(token)
+
+
+class AsyncVerifyResetPasswordTokenUsecase:
+    read_only = True
+
+    def __init__(self, db: AsyncSession):
+        self.token_module = AsyncPasswordResetTokenModule(db)
+
+    async def execute(self, input: VerifyResetPasswordTokenInput) -> None:
+        token_hash = hash_token(input.token)
+        token = await self.token_module.get_by_hash(token_hash)
+        _validate_token(token)
+
 
-        if not token:
-            raise AppError(code=ErrorCode.TOKEN_INVALID)
+def _validate_token(token: PasswordResetToken | None) -> None:
+    if not token:
+        raise AppError(code=ErrorCode.TOKEN_INVALID)
 
-        if token.used_at is not None:
-            raise AppError(code=ErrorCode.TOKEN_ALREADY_USED)
+    if token.used_at is not None:
+        raise AppError(code=ErrorCode.TOKEN_ALREADY_USED)
 
-        if token.expires_at <= datetime.now(timezone.utc):
-            raise AppError(code=ErrorCode.TOKEN_EXPIRED)
+    if token.expires_at <= datetime.now(timezone.utc):
+        raise AppError(code=ErrorCode.TOKEN_EXPIRED)
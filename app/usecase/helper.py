@@ -1,5 +1,10 @@
+from typing import NoReturn
+
+from sqlalchemy.exc import IntegrityError
+
 from app.core.config import config
 from app.core.error import AppError, ErrorCode
+from app.module.account import unique_violation_column
 
 
 def resolve_login_id(login_id: str | None, email: str | None) -> str:
@@ -14,3 +19,19 @@ def resolve_login_id(login_id: str | None, email: str | None) -> str:
         return login_id
 
     raise AppError(code=ErrorCode.INVALID_STATE)
+
+
+def raise_account_conflict(
+    exc: IntegrityError, login_id: str, email: str | None
+) -> NoReturn:
+    # Uniqueness is left to the database instead of being pre-checked, which
+    # saves round trips and cannot race with a concurrent insert.
+    column = unique_violation_column(exc)
+    # In email mode login_id is the email, so a duplicate breaks both unique
+    # constraints and the database reports whichever it checks first. Report
+    # the login_id conflict either way, as the former pre-checks did.
+    if column == "login_id" or (column == "email" and email == login_id):
+        raise AppError(code=ErrorCode.LOGIN_ID_ALREADY_EXISTS) from exc
+    if column == "email":
+        raise AppError(code=ErrorCode.EMAIL_ALREADY_EXISTS) from exc
+    raise exc
@@ -0,0 +1,80 @@
+from collections import Counter
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy.orm import Session
+
+from app.core.config import config
+from app.core.mailer import MailDeliveryError, Mailer
+from app.module.mail_outbox import ClaimedMail, MailOutboxModule
+
+
+@dataclass(frozen=True)
+class DispatchMailOutboxResult:
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+class DispatchMailOutboxUsecase:
+    """Sends one batch of due outbox mail over a single mailer connection.
+
+    Claiming commits first, so the SMTP round trips never run inside a
+    database transaction. Each outcome then commits on its own: sent mail is
+    deleted, failures are retried with backoff until MAIL_OUTBOX_MAX_ATTEMPTS.
+    """
+
+    def __init__(self, db: Session, mailer: Mailer):
+        self.db = db
+        self.mailer = mailer
+        self.module = MailOutboxModule(db)
+
+    def execute(self) -> DispatchMailOutboxResult:
+        messages = self.module.claim_due(config.MAIL_OUTBOX_BATCH_SIZE)
+        self.db.commit()
+        if not messages:
+            return DispatchMailOutboxResult()
+
+        outcomes: Counter[str] = Counter()
+        done = 0
+        try:
+            with self.mailer.connection():
+                for message in messages:
+                    outcomes[self._deliver(message)] += 1
+                    self.db.commit()
+                    done += 1
+        except MailDeliveryError as exc:
+            # The connection itself failed; nothing after `done` was sent.
+            for message in messages[done:]:
+                outcomes[self._record_failure(message, str(exc))] += 1
+            self.db.commit()
+
+        return DispatchMailOutboxResult(**outcomes)
+
+    def _deliver(self, message: ClaimedMail) -> str:
+        if message.body is None:
+            # Encrypted with a previous MAIL_OUTBOX_SECRET; retrying cannot help.
+            self.module.mark_failed(message.id, "undecryptable body")
+            return "failed"
+        try:
+            self.mailer.send(
+                to=message.recipient,
+                subject=message.subject,
+                body=message.body,
+            )
+        except MailDeliveryError as exc:
+            return self._record_failure(message, str(exc))
+        self.module.delete_sent(message.id)
+        return "sent"
+
+    def _record_failure(self, message: ClaimedMail, error: str) -> str:
+        if message.attempts >= config.MAIL_OUTBOX_MAX_ATTEMPTS:
+            self.module.mark_failed(message.id, error)
+            return "failed"
+        self.module.schedule_retry(message.id, error, retry_delay(message.attempts))
+        return "retried"
+
+
+def retry_delay(attempts: int) -> timedelta:
+    seconds = config.MAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, config.MAIL_OUTBOX_RETRY_MAX_SECONDS))
@@ -0,0 +1,66 @@
+import threading
+
+from app.core.config import config
+from app.core.database import SessionLocal
+from app.core.logger import logger
+from app.core.mailer import get_mailer, mail_outbox_wakeup
+from app.usecase.mail.dispatch_outbox import DispatchMailOutboxUsecase
+
+
+class MailOutboxDispatcher:
+    """Background trigger for DispatchMailOutboxUsecase in each worker.
+
+    Runs a batch when mail is committed in this process or every
+    `poll_seconds`, which also picks up retries and mail queued by other
+    workers. Full batches are followed immediately by the next one.
+    """
+
+    def __init__(self, poll_seconds: float):
+        self.poll_seconds = poll_seconds
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="mail-outbox-dispatcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        mail_outbox_wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            mail_outbox_wakeup.wait(self.poll_seconds)
+            mail_outbox_wakeup.clear()
+            while not self._stopping.is_set() and self._dispatch_batch():
+                pass
+
+    def _dispatch_batch(self) -> bool:
+        try:
+            with SessionLocal() as db:
+                result = DispatchMailOutboxUsecase(db, get_mailer()).execute()
+        except Exception:
+            logger.exception("mail outbox dispatch failed")
+            return False
+
+        if result.retried or result.failed:
+            logger.warning(
+                "mail delivery failed",
+                extra={"retried": result.retried, "failed": result.failed},
+            )
+        batch = result.sent + result.retried + result.failed
+        return batch >= config.MAIL_OUTBOX_BATCH_SIZE
+
+
+mail_outbox_dispatcher = MailOutboxDispatcher(config.MAIL_OUTBOX_POLL_SECONDS)
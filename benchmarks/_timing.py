@@ -0,0 +1,16 @@
+import time
+from typing import Callable
+
+
+def measure(label: str, fn: Callable[[], object], number: int) -> float:
+    fn()
+    started_at = time.perf_counter()
+    for _ in range(number):
+        fn()
+    per_call_us = (time.perf_counter() - started_at) / number * 1_000_000
+    print(f"{label:<40} {per_call_us:10.2f} us/op")
+    return per_call_us
+
+
+def report_speedup(baseline_us: float, candidate_us: float) -> None:
+    print(f"{'speedup':<40} {baseline_us / candidate_us:10.2f} x")
@@ -0,0 +1,81 @@
+import argparse
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.handler.dto.accounts import AccountResponse, account_responses
+from app.module.account import Account
+from app.query.account_view import AccountFilter, AccountViewQuery
+from benchmarks._timing import measure, report_speedup
+
+
+def seed(db: Session, rows: int) -> None:
+    now = datetime.now(timezone.utc)
+    db.execute(
+        Account.__table__.insert(),
+        [
+            {
+                "id": account_id,
+                "login_id": f"user{account_id}@example.com",
+                "email": f"user{account_id}@example.com",
+                "password_hash": "$2b$12$" + "x" * 53,
+                "first_name": "First",
+                "last_name": "Last",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for account_id in range(1, rows + 1)
+        ],
+    )
+    db.commit()
+
+
+def orm_page(db: Session, limit: int) -> list[AccountResponse]:
+    stmt = (
+        select(Account)
+        .where(Account.deleted_at.is_(None))
+        .order_by(Account.id)
+        .limit(limit)
+    )
+    accounts = db.scalars(stmt).all()
+    result = [AccountResponse.model_validate(account) for account in accounts]
+    db.expunge_all()
+    return result
+
+
+def query_page(db: Session, limit: int) -> list[AccountResponse]:
+    rows = AccountViewQuery(db).get_page(AccountFilter(), None, limit)
+    return account_responses.validate_python(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare ORM and Query read paths for account pages."
+    )
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    # SQLite keeps the benchmark self-contained; driver cost is lower than
+    # Postgres, so the ORM share of the total is, if anything, understated.
+    engine = create_engine("sqlite://")
+    Account.__table__.create(engine)
+    with Session(engine) as db:
+        seed(db, args.rows)
+
+        print(f"{args.rows} rows per page")
+        baseline = measure(
+            "ORM + model_validate", lambda: orm_page(db, args.rows), args.number
+        )
+        candidate = measure(
+            "Core Query + TypeAdapter", lambda: query_page(db, args.rows), args.number
+        )
+        for label, per_call_us in (("ORM", baseline), ("Query", candidate)):
+            rows_per_second = args.rows / (per_call_us / 1_000_000)
+            print(f"{label + ' rows/s':<40} {rows_per_second:10.0f}")
+        report_speedup(baseline, candidate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+from datetime import datetime, timezone
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.response import ApiResponse
+from app.handler.dto.accounts import GetAccountsResponse, account_responses
+from benchmarks._timing import measure, report_speedup
+
+
+def build_data(items: int) -> GetAccountsResponse:
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": account_id,
+            "email": f"user{account_id}@example.com",
+            "login_id": f"user{account_id}@example.com",
+            "first_name": "First",
+            "last_name": "Last",
+            "disabled_at": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for account_id in range(1, items + 1)
+    ]
+    return GetAccountsResponse(
+        accounts=account_responses.validate_python(rows),
+        next_cursor="eyJhZnRlcl9pZCI6MTAwMDB9",
+    )
+
+
+def previous_build_response(data, response: Response) -> JSONResponse:
+    if hasattr(data, "model_dump"):
+        data = data.model_dump()
+    encoded = jsonable_encoder(data)
+    headers = dict(response.headers)
+    return JSONResponse(content=encoded, status_code=200, headers=headers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare ApiResponse encoders.")
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    response = Response()
+    response.headers["Cache-Control"] = "private, no-cache"
+
+    for items in (1000, 10000):
+        data = build_data(items)
+        print(f"GetAccountsResponse with {items} accounts")
+        baseline = measure(
+            "model_dump + jsonable_encoder + json",
+            lambda: previous_build_response(data, response),
+            args.number,
+        )
+        candidate = measure(
+            "pydantic-core to_json",
+            lambda: ApiResponse.ok(data=data, response=response),
+            args.number,
+        )
+        report_speedup(baseline, candidate)
+
+
+if __name__ == "__main__":
+    main()
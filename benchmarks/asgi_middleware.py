@@ -0,0 +1,117 @@
+import argparse
+import asyncio
+import logging
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.logger import logger
+from app.core.middleware import SecurityMiddleware
+from benchmarks._timing import measure, report_speedup
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/api/accounts/me",
+    "raw_path": b"/api/accounts/me",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"localhost")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("localhost", 8000),
+}
+
+
+async def endpoint(scope, receive, send) -> None:
+    response = Response(b'{"data":{}}', media_type="application/json")
+    await response(scope, receive, send)
+
+
+async def previous_security_middleware(request: Request, call_next):
+    # The @app.middleware("http") implementation this replaces.
+    start = time.time()
+    response = await call_next(request)
+    duration_ms = int((time.time() - start) * 1000)
+    account_id = getattr(request.state, "account_id", None)
+    logger.info(
+        "access",
+        extra={
+            "method": request.method,
+            "path": request.url.path,
+            "status_code": response.status_code,
+            "duration_ms": duration_ms,
+            "client": request.client.host if request.client else None,
+            "account": {"id": account_id} if account_id is not None else None,
+        },
+    )
+    response.headers["X-Content-Type-Options"] = "nosniff"
+    response.headers["X-Frame-Options"] = "DENY"
+    response.headers["Referrer-Policy"] = "strict-origin"
+    return response
+
+
+def drive(loop: asyncio.AbstractEventLoop, app, requests: int):
+    async def send(message):
+        pass
+
+    async def run():
+        for _ in range(requests):
+            # Like a real server: the body arrives once, then receive blocks
+            # until the client disconnects.
+            messages = [{"type": "http.request", "body": b"", "more_body": False}]
+            disconnected = asyncio.Event()
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                await disconnected.wait()
+                return {"type": "http.disconnect"}
+
+            await app(dict(SCOPE, state={}), receive, send)
+
+    return lambda: loop.run_until_complete(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare BaseHTTPMiddleware and pure ASGI middleware overhead."
+    )
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    # Both variants log the same record; keep handler I/O out of the numbers.
+    logger.setLevel(logging.WARNING)
+    loop = asyncio.new_event_loop()
+    per_request = args.requests
+
+    print(f"Requests per op: {per_request}")
+    bare = measure("no middleware", drive(loop, endpoint, per_request), args.number)
+    baseline = measure(
+        "BaseHTTPMiddleware",
+        drive(
+            loop,
+            BaseHTTPMiddleware(endpoint, dispatch=previous_security_middleware),
+            per_request,
+        ),
+        args.number,
+    )
+    candidate = measure(
+        "pure ASGI SecurityMiddleware",
+        drive(loop, SecurityMiddleware(endpoint), per_request),
+        args.number,
+    )
+    overhead = f"{(baseline - bare) / per_request:.2f} -> "
+    overhead += f"{(candidate - bare) / per_request:.2f} us/request"
+    print(f"{'middleware overhead':<40} {overhead}")
+    report_speedup(baseline - bare, candidate - bare)
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
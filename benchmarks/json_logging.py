@@ -0,0 +1,101 @@
+import argparse
+import io
+import json
+import logging
+from datetime import datetime, timezone
+
+from app.core.logger import BoundedQueueHandler, JsonFormatter
+from benchmarks._timing import measure, report_speedup
+
+
+class PreviousJsonFormatter(logging.Formatter):
+    _LOGRECORD_INTERNAL_ATTRS = {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        log = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key in self._LOGRECORD_INTERNAL_ATTRS or key.startswith("_"):
+                continue
+            log[key] = value
+        return json.dumps(log, ensure_ascii=False, default=str)
+
+
+def access_record() -> logging.LogRecord:
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, "access", None, None)
+    record.__dict__.update(
+        method="GET",
+        path="/api/accounts/me",
+        status_code=200,
+        duration_ms=3,
+        client="10.0.0.1",
+        account={"id": 123},
+    )
+    return record
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare access log costs.")
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    record = access_record()
+    print("Formatting one access record")
+    baseline = measure(
+        "datetime + json.dumps",
+        lambda: PreviousJsonFormatter().format(record),
+        args.number,
+    )
+    formatter = JsonFormatter()
+    candidate = measure(
+        "cached timestamp + to_json",
+        lambda: formatter.format(record),
+        args.number,
+    )
+    report_speedup(baseline, candidate)
+
+    print("Cost on the request thread per access log line")
+    stream_handler = logging.StreamHandler(io.StringIO())
+    stream_handler.setFormatter(PreviousJsonFormatter())
+    baseline = measure(
+        "StreamHandler (format + write)",
+        lambda: stream_handler.handle(record),
+        args.number,
+    )
+    queue_handler = BoundedQueueHandler(maxsize=args.number * 2)
+    candidate = measure(
+        "BoundedQueueHandler (enqueue)",
+        lambda: queue_handler.handle(record),
+        args.number,
+    )
+    report_speedup(baseline, candidate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import jwt
+
+from app.core.config import config
+from app.core.jwt import (
+    ALGORITHM,
+    access_token_codec,
+    create_access_token,
+    decode_access_token,
+    verified_access_tokens,
+)
+from benchmarks._timing import measure, report_speedup
+
+
+def pyjwt_create_access_token(data: dict) -> str:
+    to_encode = data.copy()
+    to_encode["sub"] = str(to_encode["sub"])
+    to_encode.update(
+        {
+            "exp": datetime.now(timezone.utc)
+            + timedelta(seconds=config.ACCESS_TOKEN_EXPIRES_SECONDS),
+            "type": "access",
+            "jti": str(uuid4()),
+        }
+    )
+    return jwt.encode(to_encode, config.ACCESS_TOKEN_SECRET, algorithm=ALGORITHM)
+
+
+def pyjwt_decode_access_token(token: str) -> dict:
+    return jwt.decode(token, config.ACCESS_TOKEN_SECRET, algorithms=[ALGORITHM])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare JWT codec paths.")
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    data = {"sub": 42, "token_version": 3}
+    token = create_access_token(data)
+
+    print("encode")
+    baseline = measure("PyJWT", lambda: pyjwt_create_access_token(data), args.number)
+    candidate = measure("HS256Codec", lambda: create_access_token(data), args.number)
+    report_speedup(baseline, candidate)
+
+    print("decode")
+    baseline = measure("PyJWT", lambda: pyjwt_decode_access_token(token), args.number)
+    measure("HS256Codec", lambda: access_token_codec.decode(token), args.number)
+    verified_access_tokens.clear()
+    candidate = measure(
+        "HS256Codec + verified token memo",
+        lambda: decode_access_token(token),
+        args.number,
+    )
+    report_speedup(baseline, candidate)
+
+
+if __name__ == "__main__":
+    main()
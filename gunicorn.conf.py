@@ -0,0 +1,16 @@
+# Loaded automatically by gunicorn from the working directory.
+import shutil
+
+from app.core.config import config
+from app.core.prometheus import mark_process_dead
+
+
+def on_starting(server):
+    # Files left by a previous master would be summed into the new one.
+    if config.METRICS_MULTIPROC_DIR:
+        shutil.rmtree(config.METRICS_MULTIPROC_DIR, ignore_errors=True)
+
+
+def child_exit(server, worker):
+    if config.METRICS_MULTIPROC_DIR:
+        mark_process_dead(config.METRICS_MULTIPROC_DIR, worker.pid)
@@ -31,12 +31,38 @@ test("account endpoints provide authenticated CRUD operations", async () => {
     409,
     "reject duplicate account",
   );
-  const accounts = expectStatus(
-    await client.get("/api/accounts", { token: accessToken }),
+  const listed = [];
+  let cursor = null;
+  do {
+    const query = cursor ? `&cursor=${encodeURIComponent(cursor)}` : "";
+    const page = expectStatus(
+      await client.get(`/api/accounts?limit=200${query}`, {
+        token: accessToken,
+      }),
+      200,
+      "list accounts",
+    );
+    assert.ok(page.json?.accounts?.length <= 200);
+    listed.push(...page.json.accounts);
+    cursor = page.json.next_cursor;
+  } while (cursor);
+  assert.ok(listed.some(({ id }) => id === secondaryId));
+  const enabledOnly = expectStatus(
+    await client.get("/api/accounts?disabled=false&limit=1", {
+      token: accessToken,
+    }),
     200,
-    "list accounts",
+    "list enabled accounts",
+  );
+  assert.equal(enabledOnly.json?.accounts?.length, 1);
+  assert.equal(enabledOnly.json.accounts[0].disabled_at, null);
+  expectStatus(
+    await client.get("/api/accounts?cursor=not-a-cursor", {
+      token: accessToken,
+    }),
+    400,
+    "reject malformed cursor",
   );
-  assert.ok(accounts.json?.accounts?.some(({ id }) => id === secondaryId));
   const fetched = expectStatus(
     await client.get(`/api/accounts/${secondaryId}`, { token: accessToken }),
     200,
@@ -113,3 +139,60 @@ test("account disable and enable transitions affect authentication", async () =>
   assert.equal(enabled.json?.account?.disabled_at, null);
   await login(client, secondary.login_id, secondary.password);
 });
+
+test("bulk disable and enable report the affected accounts", async () => {
+  const client = new ApiClient();
+  const { accessToken } = await createAuthenticatedAccount(
+    client,
+    "account-bulk-owner",
+  );
+  const secondary = accountFixture("account-bulk-secondary", {
+    password: passwords.secondary,
+  });
+  const created = expectStatus(
+    await client.post("/api/accounts", secondary, { token: accessToken }),
+    201,
+    "create account for bulk status transition",
+  );
+  const secondaryId = created.json?.account?.id;
+  const disabled = expectStatus(
+    await client.post(
+      "/api/accounts/bulk-disable",
+      { account_ids: [secondaryId, secondaryId] },
+      { token: accessToken },
+    ),
+    200,
+    "bulk disable accounts",
+  );
+  assert.deepEqual(disabled.json?.account_ids, [secondaryId]);
+  expectStatus(
+    await client.post("/api/auth/login", {
+      login_id: secondary.login_id,
+      password: secondary.password,
+      remember_me: false,
+    }),
+    401,
+    "reject bulk disabled account login",
+  );
+  const disabledAgain = expectStatus(
+    await client.post(
+      "/api/accounts/bulk-disable",
+      { account_ids: [secondaryId] },
+      { token: accessToken },
+    ),
+    200,
+    "bulk disable already disabled accounts",
+  );
+  assert.deepEqual(disabledAgain.json?.account_ids, []);
+  const enabled = expectStatus(
+    await client.post(
+      "/api/accounts/bulk-enable",
+      { account_ids: [secondaryId] },
+      { token: accessToken },
+    ),
+    200,
+    "bulk enable accounts",
+  );
+  assert.deepEqual(enabled.json?.account_ids, [secondaryId]);
+  await login(client, secondary.login_id, secondary.password);
+});
@@ -0,0 +1,143 @@
+import asyncio
+import csv
+import io
+import json
+import unittest
+from datetime import datetime, timezone
+
+from fastapi import FastAPI, Request
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.handler._dependency import get_account_id, get_account_id_async
+from app.handler._export import csv_chunks, ndjson_chunks
+from app.handler.accounts import export_accounts
+from app.handler.accounts_async import get_account as get_account_async
+from app.module.account import Account
+from app.query.account_export import ACCOUNT_EXPORT_COLUMNS, AccountExportQuery
+from app.router import build_api_router
+
+
+class AccountExportQueryTest(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Account.__table__.create(engine)
+        self.addCleanup(engine.dispose)
+        self.db = Session(engine)
+        self.addCleanup(self.db.close)
+        for account_id in range(1, 6):
+            self.db.add(
+                Account(
+                    id=account_id,
+                    login_id=f"user{account_id}",
+                    password_hash="secret-hash",
+                    first_name="First",
+                    last_name="Last",
+                    deleted_at=datetime.now(timezone.utc) if account_id == 3 else None,
+                )
+            )
+        self.db.commit()
+
+    def test_streams_batches_without_deleted_rows_or_secrets(self):
+        batches = list(AccountExportQuery(self.db).stream(batch_size=2))
+
+        self.assertEqual(
+            [[row["id"] for row in batch] for batch in batches], [[1, 2], [4, 5]]
+        )
+        self.assertEqual(tuple(batches[0][0]), ACCOUNT_EXPORT_COLUMNS)
+        self.assertNotIn("password_hash", batches[0][0])
+
+
+class ExportEncodingTest(unittest.TestCase):
+    def setUp(self):
+        self.batches = [
+            [
+                {
+                    "id": 1,
+                    "email": None,
+                    "first_name": "=HYPERLINK()",
+                    "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+                }
+            ],
+            [
+                {
+                    "id": 2,
+                    "email": "b@example.com",
+                    "first_name": "Bob",
+                    "created_at": datetime(2026, 1, 2, tzinfo=timezone.utc),
+                }
+            ],
+        ]
+        self.columns = ("id", "email", "first_name", "created_at")
+
+    def test_ndjson_writes_one_chunk_per_batch(self):
+        chunks = list(ndjson_chunks(self.batches))
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(json.loads(chunks[1])["created_at"], "2026-01-02T00:00:00Z")
+
+    def test_csv_writes_header_and_neutralizes_formulas(self):
+        body = b"".join(csv_chunks(self.batches, self.columns)).decode()
+
+        rows = list(csv.reader(io.StringIO(body)))
+        self.assertEqual(rows[0], list(self.columns))
+        self.assertEqual(rows[1], ["1", "", "'=HYPERLINK()", "2026-01-01T00:00:00Z"])
+        self.assertEqual(len(rows), 3)
+
+    def test_csv_and_ndjson_render_datetimes_alike(self):
+        body = b"".join(csv_chunks(self.batches, self.columns)).decode()
+        lines = b"".join(ndjson_chunks(self.batches)).splitlines()
+
+        csv_values = [row["created_at"] for row in csv.DictReader(io.StringIO(body))]
+        ndjson_values = [json.loads(line)["created_at"] for line in lines]
+        self.assertEqual(csv_values, ndjson_values)
+
+
+class _Resolved(Exception):
+    pass
+
+
+def _resolve(request: Request):
+    raise _Resolved(request.scope["endpoint"])
+
+
+class ExportRoutingTest(unittest.TestCase):
+    def _endpoint_for(self, database_mode: str, path: str):
+        app = FastAPI()
+        app.include_router(build_api_router(database_mode), prefix="/api")
+        app.dependency_overrides[get_account_id] = _resolve
+        app.dependency_overrides[get_account_id_async] = _resolve
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "headers": [],
+        }
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            pass
+
+        with self.assertRaises(_Resolved) as resolved:
+            asyncio.run(app(scope, receive, send))
+        return resolved.exception.args[0]
+
+    def test_export_wins_over_account_id_route_in_both_modes(self):
+        for database_mode in ("sync", "async"):
+            with self.subTest(database_mode=database_mode):
+                self.assertIs(
+                    self._endpoint_for(database_mode, "/api/accounts/export"),
+                    export_accounts,
+                )
+
+        self.assertIs(
+            self._endpoint_for("async", "/api/accounts/12"), get_account_async
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
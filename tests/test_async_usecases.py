@@ -0,0 +1,109 @@
+import unittest
+from dataclasses import replace
+from unittest.mock import AsyncMock, Mock, patch
+
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import config
+from app.core.crypto import PasswordHasher
+from app.core.error import AppError, ErrorCode
+from app.module.account import AccountAuthState
+from app.usecase.accounts.create import AsyncCreateAccountUsecase, CreateAccountInput
+from app.usecase.auth.authorize import AsyncAuthorizeAccessTokenUsecase
+
+
+class AsyncAuthorizeAccessTokenUsecaseTest(unittest.IsolatedAsyncioTestCase):
+    async def test_returns_account_id_for_active_matching_account(self):
+        usecase = AsyncAuthorizeAccessTokenUsecase(Mock())
+        usecase.accounts = Mock()
+        usecase.accounts.get_auth_state = AsyncMock(
+            return_value=AccountAuthState(id=123, token_version=4, disabled=False)
+        )
+
+        self.assertEqual(
+            await usecase.execute({"sub": "123", "token_version": 4}),
+            123,
+        )
+
+    async def test_rejects_revoked_token(self):
+        usecase = AsyncAuthorizeAccessTokenUsecase(Mock())
+        usecase.accounts = Mock()
+        usecase.accounts.get_auth_state = AsyncMock(
+            return_value=AccountAuthState(id=123, token_version=5, disabled=False)
+        )
+
+        with self.assertRaises(AppError) as context:
+            await usecase.execute({"sub": "123", "token_version": 4})
+        self.assertEqual(context.exception.code, ErrorCode.AUTH_TOKEN_REVOKED)
+
+
+class AsyncCreateAccountUsecaseTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.db = Mock()
+        self.db.commit = AsyncMock()
+        self.usecase = AsyncCreateAccountUsecase(self.db)
+        self.usecase.module = Mock()
+        self.usecase.module.create = AsyncMock(side_effect=lambda entity: entity)
+        self.input = CreateAccountInput(
+            login_id=None,
+            email="user@example.com",
+            password="password123",
+            first_name="Taro",
+            last_name="Yamada",
+        )
+
+    async def test_inserts_without_pre_checks_and_commits(self):
+        with patch(
+            "app.usecase.accounts.create.hash_password_async",
+            AsyncMock(return_value="hashed"),
+        ):
+            account = await self.usecase.execute(self.input)
+
+        self.assertEqual(account.password_hash, "hashed")
+        self.usecase.module.create.assert_awaited_once()
+        self.db.commit.assert_awaited_once()
+
+    async def _execute_conflicting(self, input: CreateAccountInput) -> str:
+        orig = Exception("UNIQUE constraint failed: account.email")
+        self.usecase.module.create = AsyncMock(
+            side_effect=IntegrityError("INSERT", {}, orig)
+        )
+
+        with (
+            patch(
+                "app.usecase.accounts.create.hash_password_async",
+                AsyncMock(return_value="hashed"),
+            ),
+            self.assertRaises(AppError) as context,
+        ):
+            await self.usecase.execute(input)
+        return context.exception.code
+
+    async def test_maps_unique_violation_to_conflict(self):
+        input = replace(self.input, login_id="taro")
+        with patch.object(config, "AUTH_LOGIN_ID_MODE", "login_id"):
+            code = await self._execute_conflicting(input)
+
+        self.assertEqual(code, ErrorCode.EMAIL_ALREADY_EXISTS)
+
+    async def test_email_mode_duplicates_report_login_id(self):
+        # login_id is the email, so whichever constraint the database
+        # reports, the conflict is the login_id.
+        with patch.object(config, "AUTH_LOGIN_ID_MODE", "email"):
+            code = await self._execute_conflicting(self.input)
+
+        self.assertEqual(code, ErrorCode.LOGIN_ID_ALREADY_EXISTS)
+        self.db.commit.assert_not_awaited()
+
+
+class PasswordHasherAsyncTest(unittest.IsolatedAsyncioTestCase):
+    async def test_run_async_awaits_executor_result(self):
+        hasher = PasswordHasher(mode="thread", workers=1, queue_size=0)
+        self.addCleanup(hasher.shutdown)
+
+        self.assertEqual(await hasher.run_async(lambda value: value + 1, 41), 42)
+        self.assertEqual(hasher.stats()["completed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,8 @@
-from datetime import datetime, timezone
-from types import SimpleNamespace
 import unittest
 from unittest.mock import Mock
 
 from app.core.error import AppError, ErrorCode
+from app.module.account import AccountAuthState
 from app.usecase.auth.authorize import AuthorizeAccessTokenUsecase
 
 
@@ -13,16 +12,16 @@ class AuthorizeAccessTokenUsecaseTest(unittest.TestCase):
         self.usecase.accounts = Mock()
 
     def test_returns_account_id_for_active_matching_account(self):
-        self.usecase.accounts.get_by_id.return_value = SimpleNamespace(
+        self.usecase.accounts.get_auth_state.return_value = AccountAuthState(
             id=123,
-            disabled_at=None,
+            disabled=False,
             token_version=4,
         )
 
         account_id = self.usecase.execute({"sub": "123", "token_version": 4})
 
         self.assertEqual(account_id, 123)
-        self.usecase.accounts.get_by_id.assert_called_once_with(123)
+        self.usecase.accounts.get_auth_state.assert_called_once_with(123)
 
     def test_rejects_missing_token_claims(self):
         for payload in ({}, {"sub": "123"}, {"token_version": 1}):
@@ -31,17 +30,17 @@ class AuthorizeAccessTokenUsecaseTest(unittest.TestCase):
                     payload,
                     ErrorCode.AUTH_INVALID_PAYLOAD,
                 )
-        self.usecase.accounts.get_by_id.assert_not_called()
+        self.usecase.accounts.get_auth_state.assert_not_called()
 
     def test_rejects_non_numeric_subject(self):
         self._assert_error(
             {"sub": "invalid", "token_version": 1},
             ErrorCode.AUTH_INVALID_SUBJECT,
         )
-        self.usecase.accounts.get_by_id.assert_not_called()
+        self.usecase.accounts.get_auth_state.assert_not_called()
 
     def test_rejects_missing_account(self):
-        self.usecase.accounts.get_by_id.return_value = None
+        self.usecase.accounts.get_auth_state.return_value = None
 
         self._assert_error(
             {"sub": "123", "token_version": 1},
@@ -49,9 +48,9 @@ class AuthorizeAccessTokenUsecaseTest(unittest.TestCase):
         )
 
     def test_rejects_disabled_account(self):
-        self.usecase.accounts.get_by_id.return_value = SimpleNamespace(
+        self.usecase.accounts.get_auth_state.return_value = AccountAuthState(
             id=123,
-            disabled_at=datetime.now(timezone.utc),
+            disabled=True,
             token_version=1,
         )
 
@@ -61,9 +60,9 @@ class AuthorizeAccessTokenUsecaseTest(unittest.TestCase):
         )
 
     def test_rejects_revoked_token(self):
-        self.usecase.accounts.get_by_id.return_value = SimpleNamespace(
+        self.usecase.accounts.get_auth_state.return_value = AccountAuthState(
             id=123,
-            disabled_at=None,
+            disabled=False,
             token_version=2,
         )
 
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+import unittest
+from unittest.mock import Mock, patch
+
+from app.core.cache import TTLCache
+from app.module.account import AccountModule
+from app.module.account.module import account_auth_state_cache
+
+
+class TTLCacheTest(unittest.TestCase):
+    def test_counts_hits_and_misses(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_expires_entries_after_ttl(self):
+        cache = TTLCache(maxsize=10, ttl=5)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.core.cache.time.monotonic", return_value=105.0):
+            self.assertIsNone(cache.get("a"))
+
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_skips_values_read_before_invalidation(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        generation = cache.generation
+        cache.invalidate("a")
+        cache.set("a", "stale", generation=generation)
+
+        self.assertIsNone(cache.get("a"))
+
+    def test_disabled_when_size_is_zero(self):
+        cache = TTLCache(maxsize=0, ttl=60)
+        cache.set("a", 1)
+
+        self.assertIsNone(cache.get("a"))
+
+
+class AccountAuthStateCacheTest(unittest.TestCase):
+    def setUp(self):
+        account_auth_state_cache.clear()
+        self.db = Mock()
+        self.db.info = {}
+        self.db.execute.return_value.first.return_value = (123, 4, False)
+        self.module = AccountModule(self.db)
+
+    def tearDown(self):
+        account_auth_state_cache.clear()
+
+    def test_reuses_cached_state(self):
+        first = self.module.get_auth_state(123)
+        second = self.module.get_auth_state(123)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first.token_version, 4)
+        self.db.execute.assert_called_once()
+
+    def test_update_invalidates_cached_state(self):
+        self.module.get_auth_state(123)
+        self.module.update(SimpleNamespace(id=123))
+        self.module.get_auth_state(123)
+
+        self.assertEqual(self.db.execute.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
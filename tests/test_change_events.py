@@ -0,0 +1,137 @@
+import json
+import os
+import queue
+import unittest
+from unittest.mock import Mock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.core.config import config
+from app.core.events import (
+    ChangeEvent,
+    ChangeEventListener,
+    build_payloads,
+    dispatch,
+    parse_payload,
+    publish_change,
+)
+from app.module.account.module import (
+    ACCOUNT_CHANGE_TOPIC,
+    AccountAuthState,
+    account_auth_state_cache,
+)
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+class ChangeEventPayloadTest(unittest.TestCase):
+    def test_payloads_round_trip(self):
+        payloads = build_payloads({"account": {1: None, 2: None}})
+
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(
+            parse_payload(payloads[0]),
+            ChangeEvent(topic="account", keys=(1, 2)),
+        )
+
+    def test_payloads_are_split_below_notify_limit(self):
+        keys = dict.fromkeys(range(10**12, 10**12 + 1000))
+
+        payloads = build_payloads({"account": keys})
+
+        self.assertGreater(len(payloads), 1)
+        self.assertTrue(all(len(payload.encode()) < 8000 for payload in payloads))
+        received = [key for p in payloads for key in json.loads(p)["keys"]]
+        self.assertEqual(received, list(keys))
+
+    def test_notifies_all_payloads_in_one_statement(self):
+        session = Mock(info={})
+        session.get_bind.return_value.dialect.name = "postgresql"
+        for key in range(1000):
+            publish_change(session, "account", key)
+
+        with patch.object(config, "CHANGE_EVENTS_ENABLED", True):
+            events._notify_pending_changes(session)
+
+        session.execute.assert_called_once()
+        params = session.execute.call_args.args[1]
+        self.assertEqual(len(params["payloads"]), 5)
+        self.assertEqual(session.info, {})
+
+    def test_rejects_malformed_payload(self):
+        self.assertIsNone(parse_payload("not-json"))
+        self.assertIsNone(parse_payload('{"topic": "account"}'))
+
+
+class ChangeEventDispatchTest(unittest.TestCase):
+    def setUp(self):
+        account_auth_state_cache.clear()
+
+    def tearDown(self):
+        account_auth_state_cache.clear()
+
+    def test_account_change_invalidates_cached_auth_state(self):
+        account_auth_state_cache.set(1, AccountAuthState(1, 1, False))
+        account_auth_state_cache.set(2, AccountAuthState(2, 1, False))
+
+        dispatch(ChangeEvent(topic=ACCOUNT_CHANGE_TOPIC, keys=(1,)))
+
+        self.assertIsNone(account_auth_state_cache.get(1))
+        self.assertIsNotNone(account_auth_state_cache.get(2))
+
+    def test_reset_clears_cached_auth_state(self):
+        account_auth_state_cache.set(1, AccountAuthState(1, 1, False))
+
+        dispatch(ChangeEvent(topic=ACCOUNT_CHANGE_TOPIC, keys=None))
+
+        self.assertIsNone(account_auth_state_cache.get(1))
+
+    def test_failing_subscriber_does_not_block_others(self):
+        received = []
+
+        def fail(change):
+            raise RuntimeError("boom")
+
+        with patch.dict(events._subscribers, {"test": [fail, received.append]}):
+            dispatch(ChangeEvent(topic="test", keys=(1,)))
+
+        self.assertEqual(received, [ChangeEvent(topic="test", keys=(1,))])
+
+
+@unittest.skipUnless(TEST_DATABASE_URL, "TEST_DATABASE_URL is not set")
+class ChangeEventListenerIntegrationTest(unittest.TestCase):
+    def test_committed_changes_reach_listener(self):
+        received = queue.Queue()
+        listener = ChangeEventListener(TEST_DATABASE_URL, "test_change_events")
+        engine = create_engine(TEST_DATABASE_URL)
+
+        with (
+            patch.dict(events._subscribers, {"test": [received.put]}),
+            patch.object(events.config, "CHANGE_EVENTS_CHANNEL", listener.channel),
+        ):
+            listener.start()
+            try:
+                self.addCleanup(engine.dispose)
+                # Give the listener time to issue LISTEN before publishing.
+                with self.assertRaises(queue.Empty):
+                    received.get(timeout=1.5)
+
+                with Session(engine) as db:
+                    publish_change(db, "test", 1)
+                    db.rollback()
+                with Session(engine) as db:
+                    publish_change(db, "test", 2)
+                    db.commit()
+
+                self.assertEqual(
+                    received.get(timeout=5),
+                    ChangeEvent(topic="test", keys=(2,)),
+                )
+            finally:
+                listener.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
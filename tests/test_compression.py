@@ -0,0 +1,98 @@
+import asyncio
+import gzip
+import unittest
+
+from starlette.responses import Response, StreamingResponse
+
+from app.core.compression import CompressionMiddleware, choose_encoding, zstandard
+
+BODY = b'{"accounts":[' + b",".join([b'{"id":1,"login_id":"user"}'] * 200) + b"]}"
+
+
+def _request(app, accept_encoding: str = "gzip") -> tuple[dict, bytes]:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    messages = []
+
+    async def run():
+        disconnected = asyncio.Event()
+
+        async def receive():
+            # Streaming responses wait for a disconnect until the body is sent.
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+
+        middleware = CompressionMiddleware(app, minimum_size=500)
+        await middleware(scope, receive, send)
+
+    asyncio.run(asyncio.wait_for(run(), timeout=5))
+    headers = {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return headers, body
+
+
+class ChooseEncodingTest(unittest.TestCase):
+    def test_follows_quality_values(self):
+        available = ("zstd", "gzip")
+
+        self.assertEqual(choose_encoding("gzip, zstd", available), "zstd")
+        self.assertEqual(choose_encoding("gzip, zstd;q=0.5", available), "gzip")
+        self.assertEqual(choose_encoding("gzip;q=0, br", available), None)
+        self.assertEqual(choose_encoding("*", ("gzip",)), "gzip")
+        self.assertEqual(choose_encoding("identity", available), None)
+
+
+class CompressionMiddlewareTest(unittest.TestCase):
+    def test_compresses_large_bodies(self):
+        headers, body = _request(Response(BODY, media_type="application/json"))
+
+        self.assertEqual(headers["content-encoding"], "gzip")
+        self.assertEqual(headers["vary"], "Accept-Encoding")
+        self.assertEqual(int(headers["content-length"]), len(body))
+        self.assertEqual(gzip.decompress(body), BODY)
+
+    def test_compresses_streams_chunk_by_chunk(self):
+        async def chunks():
+            for _ in range(3):
+                yield BODY
+
+        headers, body = _request(StreamingResponse(chunks(), media_type="text/csv"))
+
+        self.assertEqual(headers["content-encoding"], "gzip")
+        self.assertNotIn("content-length", headers)
+        self.assertEqual(gzip.decompress(body), BODY * 3)
+
+    def test_passes_through_small_encoded_and_unaccepted_bodies(self):
+        for app, accept_encoding in (
+            (Response(b'{"ok":true}', media_type="application/json"), "gzip"),
+            (Response(status_code=204), "gzip"),
+            (Response(BODY, headers={"Content-Encoding": "br"}), "gzip"),
+            (Response(BODY, media_type="application/json"), "identity"),
+        ):
+            with self.subTest(headers=app.headers, accept_encoding=accept_encoding):
+                headers, body = _request(app, accept_encoding)
+
+                self.assertNotEqual(headers.get("content-encoding"), "gzip")
+                self.assertEqual(body, app.body)
+
+    @unittest.skipUnless(zstandard, "zstandard is not installed")
+    def test_prefers_zstd_when_available(self):
+        headers, body = _request(
+            Response(BODY, media_type="application/json"), "gzip, zstd"
+        )
+
+        self.assertEqual(headers["content-encoding"], "zstd")
+        self.assertEqual(
+            zstandard.ZstdDecompressor().decompressobj().decompress(body), BODY
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
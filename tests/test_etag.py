@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.handler._etag import etag_for, etag_matches
+from app.module.account import Account
+from app.query.account_view import AccountFilter, AccountViewQuery
+from app.usecase.accounts.get import GetAccountInput, GetAccountUsecase
+from app.usecase.accounts.list import ListAccountsInput, ListAccountsUsecase
+
+
+class EtagMatchTest(unittest.TestCase):
+    def test_uses_weak_comparison(self):
+        self.assertEqual(etag_for("abc"), 'W/"abc"')
+        self.assertTrue(etag_matches('W/"abc"', "abc"))
+        self.assertTrue(etag_matches('"abc"', "abc"))
+        self.assertTrue(etag_matches('"x", W/"abc"', "abc"))
+        self.assertTrue(etag_matches("*", "abc"))
+        self.assertFalse(etag_matches('W/"abd"', "abc"))
+        self.assertFalse(etag_matches("*", None))
+
+
+class AccountVersionTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Account.__table__.create(self.engine)
+        self.db = Session(self.engine)
+        self.addCleanup(self.engine.dispose)
+        self.addCleanup(self.db.close)
+        for account_id in range(1, 5):
+            self.db.add(
+                Account(
+                    id=account_id,
+                    login_id=f"user{account_id}",
+                    password_hash="x",
+                    first_name="First",
+                    last_name="Last",
+                )
+            )
+        self.db.commit()
+
+    def test_version_query_agrees_with_loaded_rows(self):
+        get = GetAccountUsecase(self.db)
+        listing = ListAccountsUsecase(self.db)
+        page = ListAccountsInput(limit=2, after_id=1)
+
+        self.assertEqual(
+            get.version(GetAccountInput(account_id=2)),
+            get.execute(GetAccountInput(account_id=2)).version,
+        )
+        self.assertEqual(listing.version(page), listing.execute(page).version)
+        self.assertIsNone(get.version(GetAccountInput(account_id=99)))
+
+    def test_version_changes_when_rows_change(self):
+        query = AccountViewQuery(self.db)
+        account_filter = AccountFilter()
+        before = query.get_version(3)
+        page_before = query.get_page_version(account_filter, None, 3)
+        other_page = query.get_page_version(account_filter, 3, 3)
+
+        account = self.db.get(Account, 3)
+        account.updated_at = account.updated_at + timedelta(seconds=1)
+        self.db.commit()
+
+        self.assertNotEqual(query.get_version(3), before)
+        self.assertNotEqual(
+            query.get_page_version(account_filter, None, 3), page_before
+        )
+        self.assertEqual(query.get_page_version(account_filter, 3, 3), other_page)
+
+        account.deleted_at = datetime.now(timezone.utc)
+        self.db.commit()
+
+        self.assertIsNone(query.get_version(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+from sqlalchemy import BigInteger, create_engine, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.cli import import_accounts
+from app.cli.import_accounts import read_rows
+from app.core.config import config
+from app.core.error import ErrorCode
+from app.module.account import Account, AccountModule
+from app.usecase.accounts.create import CreateAccountInput
+from app.usecase.accounts.import_accounts import (
+    ImportAccountResult,
+    ImportAccountsUsecase,
+)
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(type_, compiler, **kw):
+    # SQLite only autoincrements INTEGER PRIMARY KEY columns.
+    return "INTEGER"
+
+
+def _input(login_id: str | None, email: str | None) -> CreateAccountInput:
+    return CreateAccountInput(
+        login_id=login_id,
+        email=email,
+        password="password123",
+        first_name="Hanako",
+        last_name="Yamada",
+    )
+
+
+class ImportAccountsUsecaseTest(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Account.__table__.create(engine)
+        self.addCleanup(engine.dispose)
+        self.db = Session(engine)
+        self.addCleanup(self.db.close)
+        executor = ThreadPoolExecutor(1)
+        self.addCleanup(executor.shutdown)
+        self.usecase = ImportAccountsUsecase(self.db, executor)
+
+        patcher = patch.object(config, "PASSWORD_HASH_ROUNDS", 4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.db.add(
+            Account(
+                login_id="taro",
+                email="taro@example.com",
+                password_hash="secret-hash",
+                first_name="Taro",
+                last_name="Yamada",
+            )
+        )
+        self.db.commit()
+
+    def _execute_racing(self, inputs: list[CreateAccountInput]):
+        # The existing account stays invisible to the first lookup, as if it
+        # had been inserted concurrently between find_taken and the insert.
+        find_taken = AccountModule.find_taken
+        calls = []
+
+        def racing_find_taken(module, login_ids, emails):
+            calls.append(login_ids)
+            if len(calls) == 1:
+                return set(), set()
+            return find_taken(module, login_ids, emails)
+
+        with patch.object(AccountModule, "find_taken", racing_find_taken):
+            return self.usecase.execute(inputs)
+
+    def test_reports_rows_skipped_by_a_concurrent_insert(self):
+        with patch.object(config, "AUTH_LOGIN_ID_MODE", "login_id"):
+            results = self._execute_racing(
+                [
+                    _input("taro", None),
+                    _input("jiro", "taro@example.com"),
+                    _input("saburo", None),
+                ]
+            )
+
+        self.assertEqual(
+            results[:2],
+            [
+                ImportAccountResult("conflict", error="LOGIN_ID_ALREADY_EXISTS"),
+                ImportAccountResult("conflict", error="EMAIL_ALREADY_EXISTS"),
+            ],
+        )
+        self.assertEqual(results[2].status, "created")
+
+    def test_reports_invalid_rows_with_the_error_code_value(self):
+        with patch.object(config, "AUTH_LOGIN_ID_MODE", "email"):
+            [result] = self.usecase.execute([_input("hanako", None)])
+
+        self.assertEqual(
+            result, ImportAccountResult("invalid", error=ErrorCode.EMAIL_REQUIRED.value)
+        )
+        self.assertIs(type(result.error), str)
+
+
+HEADER = "login_id,email,password,first_name,last_name\n"
+
+
+class ReadRowsTest(unittest.TestCase):
+    def test_blank_cells_are_not_provided(self):
+        [(_, row)] = read_rows(io.StringIO(HEADER + "hanako,,password123,,Yamada\n"))
+
+        self.assertEqual(
+            row,
+            {
+                "login_id": "hanako",
+                "email": None,
+                "password": "password123",
+                "first_name": None,
+                "last_name": "Yamada",
+            },
+        )
+
+    def test_strips_byte_order_mark_from_header(self):
+        [(_, row)] = read_rows(io.StringIO("\ufeff" + HEADER + "hanako,,pw,H,Y\n"))
+
+        self.assertEqual(row["login_id"], "hanako")
+
+    def test_reports_physical_line_numbers(self):
+        body = HEADER + 'a,,pw,A,Y\n\nb,,pw,"B\nB",Y\nc,,pw,C,Y\n'
+
+        lines = [line for line, _ in read_rows(io.StringIO(body))]
+
+        # Blank lines count; a quoted multi-line cell reports where it ends.
+        self.assertEqual(lines, [2, 5, 6])
+
+
+class ImportAccountsMainTest(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Account.__table__.create(engine)
+        self.addCleanup(engine.dispose)
+        self.session_factory = sessionmaker(engine, expire_on_commit=False)
+
+        for target, name, value in (
+            (config, "PASSWORD_HASH_ROUNDS", 4),
+            (config, "AUTH_LOGIN_ID_MODE", "email"),
+            (config, "CHANGE_EVENTS_ENABLED", False),
+            (import_accounts, "SessionLocal", self.session_factory),
+        ):
+            patcher = patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run(self, body: str, *args: str) -> tuple[list[dict], str]:
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", encoding="utf-8-sig", delete=False
+        ) as file:
+            file.write(body)
+        self.addCleanup(os.remove, file.name)
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        argv = ["import_accounts", file.name, "--workers", "1", *args]
+        with patch("sys.argv", argv), redirect_stdout(stdout), redirect_stderr(stderr):
+            import_accounts.main()
+        reports = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        return reports, stderr.getvalue().strip()
+
+    def test_writes_one_report_per_row_and_a_summary(self):
+        body = HEADER + (
+            ",hanako@example.com,password123,Hanako,Yamada\n"
+            ",hanako@example.com,password123,Hanako,Yamada\n"
+            ",jiro@example.com,short,Jiro,Yamada\n"
+            ",saburo@example.com,password123,Saburo,Yamada\n"
+        )
+
+        reports, summary = self._run(body, "--batch-size", "2")
+
+        self.assertEqual(
+            [(report["line"], report["status"]) for report in reports],
+            [(2, "created"), (3, "conflict"), (4, "invalid"), (5, "created")],
+        )
+        self.assertEqual(reports[1]["error"], "LOGIN_ID_ALREADY_EXISTS")
+        self.assertEqual(reports[2]["error"], "VALIDATION_ERROR: password")
+        self.assertEqual(summary, "conflict=1 created=2 invalid=1")
+        with self.session_factory() as db:
+            self.assertEqual(
+                db.scalars(select(Account.email).order_by(Account.id)).all(),
+                ["hanako@example.com", "saburo@example.com"],
+            )
+
+    def test_reports_empty_input(self):
+        reports, summary = self._run(HEADER)
+
+        self.assertEqual(reports, [])
+        self.assertEqual(summary, "no rows")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import time
+import unittest
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from app.core.jwt import (
+    AsymmetricCodec,
+    HS256Codec,
+    create_access_token,
+    decode_access_token,
+    verified_access_tokens,
+)
+
+SECRET = "test-secret-with-at-least-32-bytes!!"
+
+
+class HS256CodecTest(unittest.TestCase):
+    def setUp(self):
+        self.codec = HS256Codec(SECRET)
+        self.payload = {"sub": "1", "exp": int(time.time()) + 60}
+
+    def test_interoperates_with_pyjwt(self):
+        token = self.codec.encode(self.payload)
+        self.assertEqual(jwt.decode(token, SECRET, algorithms=["HS256"]), self.payload)
+
+        pyjwt_token = jwt.encode(self.payload, SECRET, algorithm="HS256")
+        self.assertEqual(self.codec.decode(pyjwt_token), self.payload)
+
+    def test_rejects_tampered_and_foreign_tokens(self):
+        token = self.codec.encode(self.payload)
+        header, body, signature = token.split(".")
+        forged_body = jwt.utils.base64url_encode(b'{"sub":"2"}').decode()
+
+        self.assertIsNone(self.codec.decode(f"{header}.{forged_body}.{signature}"))
+        self.assertIsNone(HS256Codec("x" * 32).decode(token))
+        self.assertIsNone(self.codec.decode("not-a-token"))
+        self.assertIsNone(self.codec.decode(f"{header}.{body}.%%%"))
+
+    def test_applies_registered_claim_checks(self):
+        now = int(time.time())
+        for payload in (
+            {"exp": now - 1},
+            {"exp": "soon"},
+            {"nbf": now + 60},
+            {"aud": "other"},
+        ):
+            with self.subTest(payload=payload):
+                self.assertIsNone(self.codec.decode(self.codec.encode(payload)))
+
+
+def _private_pem(key) -> str:
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def _public_pem(key) -> str:
+    return (
+        key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+
+class AsymmetricCodecTest(unittest.TestCase):
+    def setUp(self):
+        self.payload = {"sub": "1", "exp": int(time.time()) + 60}
+
+    def test_tokens_verify_with_published_jwks(self):
+        for algorithm, key in (
+            ("EdDSA", ed25519.Ed25519PrivateKey.generate()),
+            ("ES256", ec.generate_private_key(ec.SECP256R1())),
+        ):
+            with self.subTest(algorithm=algorithm):
+                codec = AsymmetricCodec(algorithm, _private_pem(key))
+                token = codec.encode(self.payload)
+
+                self.assertEqual(codec.decode(token), self.payload)
+                jwk_set = jwt.PyJWKSet.from_dict(codec.jwks())
+                signing_key = jwk_set[jwt.get_unverified_header(token)["kid"]]
+                self.assertEqual(
+                    jwt.decode(token, signing_key, algorithms=[algorithm]),
+                    self.payload,
+                )
+
+    def test_previous_key_still_verifies_during_rotation(self):
+        previous_key = ed25519.Ed25519PrivateKey.generate()
+        previous = AsymmetricCodec("EdDSA", _private_pem(previous_key), "old")
+        current = AsymmetricCodec(
+            "EdDSA",
+            _private_pem(ed25519.Ed25519PrivateKey.generate()),
+            "new",
+            previous_public_keys={"old": _public_pem(previous_key)},
+        )
+
+        self.assertEqual(current.decode(previous.encode(self.payload)), self.payload)
+        self.assertEqual(
+            [key["kid"] for key in current.jwks()["keys"]],
+            ["new", "old"],
+        )
+
+    def test_rejects_unknown_key_ids_and_symmetric_tokens(self):
+        codec = AsymmetricCodec(
+            "EdDSA", _private_pem(ed25519.Ed25519PrivateKey.generate())
+        )
+        other = AsymmetricCodec(
+            "EdDSA", _private_pem(ed25519.Ed25519PrivateKey.generate()), "other"
+        )
+
+        self.assertIsNone(codec.decode(other.encode(self.payload)))
+        self.assertIsNone(codec.decode(HS256Codec(SECRET).encode(self.payload)))
+
+    def test_rejects_key_for_another_algorithm(self):
+        with self.assertRaises(ValueError):
+            AsymmetricCodec("ES256", _private_pem(ed25519.Ed25519PrivateKey.generate()))
+
+
+class VerifiedAccessTokenMemoTest(unittest.TestCase):
+    def setUp(self):
+        verified_access_tokens.clear()
+        self.addCleanup(verified_access_tokens.clear)
+
+    def test_repeated_decodes_use_memo(self):
+        token = create_access_token({"sub": 7, "token_version": 1})
+
+        first = decode_access_token(token)
+        first["sub"] = "mutated"
+        second = decode_access_token(token)
+
+        self.assertEqual(second["sub"], "7")
+        self.assertEqual(verified_access_tokens.stats()["hits"], 1)
+
+    def test_invalid_tokens_are_not_memoized(self):
+        self.assertIsNone(decode_access_token("invalid.token.value"))
+        self.assertEqual(verified_access_tokens.stats()["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
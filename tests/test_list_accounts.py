@@ -0,0 +1,104 @@
+import unittest
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.core.error import AppError, ErrorCode
+from app.handler._cursor import decode_cursor, encode_cursor
+from app.module.account import Account
+from app.query.account_view import AccountFilter, AccountViewQuery, _page_select
+from app.usecase.accounts.list import ListAccountsInput, ListAccountsUsecase
+
+
+class CursorTest(unittest.TestCase):
+    def test_round_trips_opaque_cursor(self):
+        cursor = encode_cursor(12345)
+
+        self.assertNotIn("12345", cursor)
+        self.assertEqual(decode_cursor(cursor), 12345)
+        self.assertIsNone(encode_cursor(None))
+        self.assertIsNone(decode_cursor(None))
+
+    def test_rejects_malformed_cursor(self):
+        for cursor in (
+            "%%%",
+            "bm90LWpzb24",
+            encode_cursor(1)[:-2],
+            "eyJhZnRlcl9pZCI6IngifQ",
+        ):
+            with self.subTest(cursor=cursor), self.assertRaises(AppError) as context:
+                decode_cursor(cursor)
+            self.assertEqual(context.exception.code, ErrorCode.INVALID_CURSOR)
+
+
+class ListAccountsUsecaseTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Account.__table__.create(self.engine)
+        self.db = Session(self.engine)
+        self.addCleanup(self.engine.dispose)
+        self.addCleanup(self.db.close)
+        for account_id in range(1, 6):
+            self.db.add(
+                Account(
+                    id=account_id,
+                    login_id=f"user{account_id}",
+                    password_hash="x",
+                    first_name="First",
+                    last_name="Last",
+                    disabled_at=datetime.now(timezone.utc) if account_id % 2 else None,
+                    deleted_at=datetime.now(timezone.utc) if account_id == 5 else None,
+                )
+            )
+        self.db.commit()
+
+    def test_walks_pages_with_keyset_cursor(self):
+        usecase = ListAccountsUsecase(self.db)
+
+        first = usecase.execute(ListAccountsInput(limit=2))
+        second = usecase.execute(
+            ListAccountsInput(limit=2, after_id=first.next_after_id)
+        )
+
+        self.assertEqual([account["id"] for account in first.accounts], [1, 2])
+        self.assertEqual([account["id"] for account in second.accounts], [3, 4])
+        self.assertIsNone(second.next_after_id)
+
+    def test_filters_disabled_accounts(self):
+        result = ListAccountsUsecase(self.db).execute(
+            ListAccountsInput(limit=10, disabled=True)
+        )
+
+        self.assertEqual([account["id"] for account in result.accounts], [1, 3])
+
+    def test_view_rows_hold_response_columns_only(self):
+        query = AccountViewQuery(self.db)
+        self.db.expunge_all()
+
+        account = query.get(2)
+        self.assertEqual(account["login_id"], "user2")
+        self.assertNotIn("password_hash", account)
+        self.assertIsNone(query.get(5))
+        self.assertEqual(len(self.db.identity_map), 0)
+
+    def test_created_range_is_half_open(self):
+        stmt = _page_select(
+            AccountFilter(
+                created_from=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                created_to=datetime(2026, 2, 1, tzinfo=timezone.utc),
+            ),
+            after_id=10,
+            limit=51,
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        self.assertIn("account.id > %(id_1)s", sql)
+        self.assertIn("account.created_at >= %(created_at_1)s", sql)
+        self.assertIn("account.created_at < %(created_at_2)s", sql)
+        self.assertIn("ORDER BY account.id", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
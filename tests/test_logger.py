@@ -0,0 +1,81 @@
+import json
+import logging
+import sys
+import unittest
+from datetime import datetime, timezone
+
+from app.core.logger import BoundedQueueHandler, JsonFormatter
+
+
+def _record(msg: str = "access", args=None, exc_info=None, **extra):
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, msg, args, exc_info)
+    record.__dict__.update(extra)
+    return record
+
+
+class JsonFormatterTest(unittest.TestCase):
+    def test_formats_record_with_extras(self):
+        record = _record("user %s", ("a",), status_code=200, Bad=1, _private=2)
+
+        log = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(
+            log["timestamp"],
+            datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+        )
+        self.assertEqual(log["message"], "user a")
+        self.assertEqual(log["status_code"], 200)
+        self.assertEqual(log["_invalid_extra_keys"], ["Bad"])
+        self.assertNotIn("_private", log)
+        self.assertNotIn("lineno", log)
+
+    def test_falls_back_to_str_for_unknown_values(self):
+        log = json.loads(JsonFormatter().format(_record(value=object)))
+
+        self.assertEqual(log["value"], "<class 'object'>")
+
+    def test_truncates_long_extra_fields(self):
+        formatter = JsonFormatter(max_field_length=10)
+
+        log = json.loads(
+            formatter.format(
+                _record(text="x" * 25, rows=list(range(20)), small={"id": 1}, n=10**20)
+            )
+        )
+
+        self.assertEqual(log["text"], "x" * 10 + "...[truncated 15 chars]")
+        self.assertTrue(log["rows"].startswith("[0,1,2,3,4...[truncated"))
+        self.assertEqual(log["small"], {"id": 1})
+        self.assertEqual(log["n"], 10**20)
+
+
+class BoundedQueueHandlerTest(unittest.TestCase):
+    def test_drops_and_counts_records_when_full(self):
+        handler = BoundedQueueHandler(maxsize=1, policy="drop")
+
+        handler.handle(_record())
+        handler.handle(_record())
+
+        self.assertEqual(handler.stats()["queue_depth"], 1)
+        self.assertEqual(handler.stats()["dropped"], 1)
+
+    def test_resolves_message_and_traceback_before_queueing(self):
+        handler = BoundedQueueHandler(maxsize=1)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        args = ["before"]
+
+        handler.handle(_record("value %s", (args,), exc_info=exc_info))
+        args[0] = "after"
+        log = json.loads(JsonFormatter().format(handler.queue.get_nowait()))
+
+        self.assertEqual(log["message"], "value ['before']")
+        self.assertIn("ValueError: boom", log["exception"])
+
+
+if __name__ == "__main__":
+    unittest.main()
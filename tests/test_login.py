@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.core import crypto
+from app.core.config import config
+from app.core.crypto import password_hash_rounds
+from app.core.error import AppError, ErrorCode
+from app.module.account import Account
+from app.module.account import module as account_module
+from app.usecase.auth.login import LoginInput, LoginUsecase
+
+PASSWORD = "password123"
+
+
+class LoginRehashTest(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Account.__table__.create(engine)
+        self.addCleanup(engine.dispose)
+        self.db = Session(engine, expire_on_commit=False)
+        self.addCleanup(self.db.close)
+
+        # Stored with 4 rounds while the configured cost is 5.
+        self.db.add(
+            Account(
+                id=1,
+                login_id="taro",
+                password_hash=crypto._bcrypt_hash(PASSWORD.encode(), 4).decode(),
+                first_name="Taro",
+                last_name="Yamada",
+            )
+        )
+        self.db.commit()
+        self.db.expunge_all()
+
+        patcher = patch.object(config, "PASSWORD_HASH_ROUNDS", 5)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _login(self):
+        return LoginUsecase(self.db).execute(
+            LoginInput(login_id="taro", password=PASSWORD, remember_me=False)
+        )
+
+    def _stored_hash(self) -> str:
+        self.db.expunge_all()
+        return self.db.scalar(select(Account.password_hash))
+
+    def test_upgrades_outdated_hash_without_revoking_tokens(self):
+        with (
+            patch.object(account_module, "publish_change") as publish_change,
+            patch.object(
+                account_module.account_auth_state_cache, "invalidate"
+            ) as invalidate,
+        ):
+            result = self._login()
+
+        self.assertTrue(result.access_token)
+        stored = self._stored_hash()
+        self.assertEqual(password_hash_rounds(stored), 5)
+        self.assertTrue(crypto.verify_password(PASSWORD, stored))
+        self.assertEqual(self.db.scalar(select(Account.token_version)), 1)
+        publish_change.assert_not_called()
+        invalidate.assert_not_called()
+
+    def test_busy_hasher_still_logs_in(self):
+        busy = AppError(code=ErrorCode.PASSWORD_HASHER_BUSY)
+        with patch("app.usecase.auth.login.hash_password", side_effect=busy):
+            result = self._login()
+
+        self.assertTrue(result.access_token)
+        self.assertEqual(password_hash_rounds(self._stored_hash()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
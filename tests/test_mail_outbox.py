@@ -0,0 +1,141 @@
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from sqlalchemy import BigInteger, create_engine, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from app.core.config import config
+from app.core.mailer import MailDeliveryError, Mailer, mail_outbox_wakeup
+from app.module.mail_outbox import MailOutbox, MailOutboxModule
+from app.usecase.mail.dispatch_outbox import (
+    DispatchMailOutboxResult,
+    DispatchMailOutboxUsecase,
+    retry_delay,
+)
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(type_, compiler, **kw):
+    # SQLite only autoincrements INTEGER PRIMARY KEY columns.
+    return "INTEGER"
+
+
+class RecordingMailer(Mailer):
+    def __init__(self, fail_recipients=(), fail_connection=False):
+        self.sent: list[str] = []
+        self.bodies: list[str] = []
+        self.fail_recipients = set(fail_recipients)
+        self.fail_connection = fail_connection
+
+    def send(self, to, subject, body, cc=None):
+        if to in self.fail_recipients:
+            raise MailDeliveryError("SMTPRecipientsRefused")
+        self.sent.append(to)
+        self.bodies.append(body)
+
+    @contextmanager
+    def connection(self):
+        if self.fail_connection:
+            raise MailDeliveryError("ConnectionRefusedError")
+        yield
+
+
+class DispatchMailOutboxUsecaseTest(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        MailOutbox.__table__.create(engine)
+        self.addCleanup(engine.dispose)
+        self.db = Session(engine)
+        self.addCleanup(self.db.close)
+
+    def _enqueue(self, *recipients: str) -> None:
+        module = MailOutboxModule(self.db)
+        for recipient in recipients:
+            module.enqueue(recipient=recipient, subject="Hello", body="Body")
+        self.db.commit()
+
+    def _outbox(self) -> list[MailOutbox]:
+        self.db.expunge_all()
+        return self.db.scalars(select(MailOutbox).order_by(MailOutbox.id)).all()
+
+    def test_enqueue_wakes_dispatcher_after_commit(self):
+        mail_outbox_wakeup.clear()
+        self.addCleanup(mail_outbox_wakeup.clear)
+
+        MailOutboxModule(self.db).enqueue(
+            recipient="a@example.com", subject="Hello", body="Body"
+        )
+        self.assertFalse(mail_outbox_wakeup.is_set())
+        self.db.commit()
+
+        self.assertTrue(mail_outbox_wakeup.is_set())
+
+    def test_sends_due_mail_and_retries_failures(self):
+        self._enqueue("a@example.com", "b@example.com", "c@example.com")
+        mailer = RecordingMailer(fail_recipients={"b@example.com"})
+
+        result = DispatchMailOutboxUsecase(self.db, mailer).execute()
+
+        self.assertEqual(result, DispatchMailOutboxResult(sent=2, retried=1))
+        self.assertEqual(mailer.sent, ["a@example.com", "c@example.com"])
+        [retry] = self._outbox()
+        self.assertEqual(retry.recipient, "b@example.com")
+        self.assertEqual(retry.attempts, 1)
+        self.assertEqual(retry.last_error, "SMTPRecipientsRefused")
+
+        # Not due until the backoff has passed.
+        result = DispatchMailOutboxUsecase(self.db, mailer).execute()
+        self.assertEqual(result, DispatchMailOutboxResult())
+
+    def test_bodies_are_encrypted_at_rest(self):
+        MailOutboxModule(self.db).enqueue(
+            recipient="a@example.com", subject="Hello", body="reset?token=abc"
+        )
+        self.db.commit()
+        [stored] = self._outbox()
+        self.assertNotIn("token=abc", stored.body)
+
+        mailer = RecordingMailer()
+        DispatchMailOutboxUsecase(self.db, mailer).execute()
+
+        self.assertEqual(mailer.bodies, ["reset?token=abc"])
+
+    def test_fails_mail_encrypted_with_another_secret(self):
+        with patch.object(config, "MAIL_OUTBOX_SECRET", "previous-secret"):
+            self._enqueue("a@example.com")
+        mailer = RecordingMailer()
+
+        result = DispatchMailOutboxUsecase(self.db, mailer).execute()
+
+        self.assertEqual(result, DispatchMailOutboxResult(failed=1))
+        self.assertEqual(mailer.sent, [])
+        [failed] = self._outbox()
+        self.assertEqual(failed.last_error, "undecryptable body")
+        self.assertEqual(failed.body, "")
+
+    def test_gives_up_after_max_attempts(self):
+        self._enqueue("a@example.com", "b@example.com")
+        mailer = RecordingMailer(fail_connection=True)
+
+        with patch.object(config, "MAIL_OUTBOX_MAX_ATTEMPTS", 1):
+            result = DispatchMailOutboxUsecase(self.db, mailer).execute()
+
+        self.assertEqual(result, DispatchMailOutboxResult(failed=2))
+        outbox = self._outbox()
+        self.assertTrue(all(mail.failed_at is not None for mail in outbox))
+        self.assertEqual({mail.body for mail in outbox}, {""})
+
+    def test_retry_delay_backs_off_up_to_the_maximum(self):
+        with (
+            patch.object(config, "MAIL_OUTBOX_RETRY_BASE_SECONDS", 30.0),
+            patch.object(config, "MAIL_OUTBOX_RETRY_MAX_SECONDS", 100.0),
+        ):
+            delays = [retry_delay(attempts).total_seconds() for attempts in (1, 2, 3)]
+
+        self.assertEqual(delays, [30.0, 60.0, 100.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import smtplib
+import unittest
+from unittest.mock import patch
+
+from app.core.mailer import MailDeliveryError, SMTPMailer
+
+
+def smtp_mailer() -> SMTPMailer:
+    return SMTPMailer(
+        host="smtp.example.com",
+        port=587,
+        username="user",
+        password="secret",
+        use_tls=True,
+        from_address="no-reply@example.com",
+    )
+
+
+class SMTPMailerTest(unittest.TestCase):
+    def test_connection_is_reused_for_sends_in_block(self):
+        mailer = smtp_mailer()
+        with patch("app.core.mailer.smtplib.SMTP") as smtp:
+            with mailer.connection():
+                mailer.send(to="a@example.com", subject="Hello", body="Body")
+                mailer.send(to="b@example.com", subject="Hello", body="Body")
+
+        smtp.assert_called_once_with("smtp.example.com", 587, timeout=30.0)
+        server = smtp.return_value
+        server.starttls.assert_called_once_with()
+        server.login.assert_called_once_with("user", "secret")
+        self.assertEqual(server.send_message.call_count, 2)
+        server.quit.assert_called_once_with()
+
+    def test_send_outside_block_connects_per_message(self):
+        mailer = smtp_mailer()
+        with patch("app.core.mailer.smtplib.SMTP") as smtp:
+            mailer.send(to="a@example.com", subject="Hello", body="Body")
+
+        smtp.return_value.__enter__.return_value.send_message.assert_called_once()
+
+    def test_transport_errors_become_delivery_errors(self):
+        mailer = smtp_mailer()
+        with patch("app.core.mailer.smtplib.SMTP") as smtp:
+            smtp.return_value.starttls.side_effect = smtplib.SMTPNotSupportedError()
+            with self.assertRaises(MailDeliveryError), mailer.connection():
+                pass
+
+            smtp.side_effect = ConnectionRefusedError()
+            with self.assertRaises(MailDeliveryError):
+                mailer.send(to="a@example.com", subject="Hello", body="Body")
+
+
+if __name__ == "__main__":
+    unittest.main()
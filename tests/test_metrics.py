@@ -0,0 +1,113 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, exc, text
+
+from app.core import metrics
+from app.core.database import (
+    InstrumentedQueuePool,
+    QueryStats,
+    _instrument_pool,
+    pool_stats,
+    query_stats,
+)
+from app.core.error import AppError
+from app.core.metrics import Histogram, collect_metrics
+from app.handler.internal import _authorize_metrics
+
+
+class HistogramTest(unittest.TestCase):
+    def test_snapshot_reports_cumulative_buckets(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        self.assertEqual(snapshot["buckets"], {"0.1": 2, "1.0": 3, "+Inf": 4})
+        self.assertEqual(snapshot["count"], 4)
+        self.assertAlmostEqual(snapshot["sum"], 3.65)
+
+
+class PoolMetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.01,
+        )
+        self.addCleanup(self.engine.dispose)
+        patcher = patch.dict(metrics._collectors)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        _instrument_pool("test_pool", self.engine)
+
+    def test_records_checkouts_timeouts_and_invalidations(self):
+        connection = self.engine.connect()
+        with self.assertRaises(exc.TimeoutError):
+            self.engine.connect()
+
+        stats = collect_metrics()["test_pool"]
+        self.assertEqual(stats["checked_out"], 1)
+        self.assertEqual(stats["checkout_timeouts"], 1)
+        self.assertEqual(stats["checkout_wait_seconds"]["count"], 1)
+
+        connection.invalidate()
+        connection.close()
+        self.assertEqual(pool_stats(self.engine)["invalidations"], 1)
+
+    def test_metrics_survive_pool_recreation(self):
+        self.engine.connect().close()
+        self.engine.dispose()
+        self.engine.connect().close()
+
+        self.assertEqual(pool_stats(self.engine)["checkout_wait_seconds"]["count"], 2)
+
+
+class QueryStatsTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        self.addCleanup(self.engine.dispose)
+
+    def test_counts_statements_while_tracking(self):
+        stats = QueryStats()
+        token = query_stats.set(stats)
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                with self.assertRaises(exc.OperationalError):
+                    conn.execute(text("SELECT * FROM missing"))
+                conn.execute(text("SELECT 2"))
+        finally:
+            query_stats.reset(token)
+
+        self.assertEqual(stats.statements, 3)
+        self.assertGreater(stats.duration_ns, 0)
+
+    def test_ignores_statements_outside_requests(self):
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        self.assertIsNone(query_stats.get())
+
+
+class MetricsAuthorizationTest(unittest.TestCase):
+    def test_requires_matching_bearer_token_when_configured(self):
+        with patch("app.handler.internal.config.METRICS_TOKEN", "secret"):
+            _authorize_metrics("Bearer secret")
+            for header in (None, "Bearer wrong", "secret"):
+                with self.subTest(header=header), self.assertRaises(AppError):
+                    _authorize_metrics(header)
+
+    def test_open_outside_production_without_token(self):
+        with patch("app.handler.internal.config.METRICS_TOKEN", None):
+            _authorize_metrics(None)
+            with patch("app.handler.internal.config.APP_ENV", "production"):
+                with self.assertRaises(AppError):
+                    _authorize_metrics(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from starlette.responses import Response
+
+from app.core import middleware
+from app.core.middleware import (
+    AccessLogSampler,
+    SecurityMiddleware,
+    http_requests,
+    route_template,
+)
+
+
+def _request(app, method: str = "GET", is_prod: bool = False) -> dict:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": "/api/accounts",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+        "state": {"account_id": 7},
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(SecurityMiddleware(app, is_prod=is_prod)(scope, receive, send))
+    return messages[0]
+
+
+class SecurityMiddlewareTest(unittest.TestCase):
+    def test_appends_security_headers(self):
+        start = _request(Response(b"ok"), is_prod=True)
+        headers = dict(start["headers"])
+
+        self.assertEqual(headers[b"x-content-type-options"], b"nosniff")
+        self.assertEqual(headers[b"x-frame-options"], b"DENY")
+        self.assertIn(b"strict-transport-security", headers)
+        self.assertNotIn(
+            b"strict-transport-security", dict(_request(Response())["headers"])
+        )
+
+    def test_reports_database_time_outside_production(self):
+        async def querying(scope, receive, send):
+            stats = middleware.query_stats.get()
+            stats.statements += 4
+            stats.duration_ns += 3_000_000
+            await Response(status_code=201)(scope, receive, send)
+
+        with patch.object(middleware.logger, "info") as info:
+            start = _request(querying, method="POST")
+
+        timing = dict(start["headers"])[b"server-timing"].decode()
+        self.assertTrue(timing.startswith('db;dur=3.00;desc="4 statements", app;dur='))
+        extra = info.call_args.kwargs["extra"]
+        self.assertEqual(extra["db_statements"], 4)
+        self.assertEqual(extra["db_duration_ms"], 3.0)
+        self.assertNotIn(
+            b"server-timing", dict(_request(Response(), is_prod=True)["headers"])
+        )
+        self.assertIsNone(middleware.query_stats.get())
+
+    def test_pins_successful_writes_to_primary(self):
+        with patch.object(middleware, "primary_pin_cookie", return_value="pin=1"):
+            written = _request(Response(status_code=201), method="POST")
+            rejected = _request(Response(status_code=400), method="POST")
+            read = _request(Response(), method="GET")
+
+        self.assertIn((b"set-cookie", b"pin=1"), written["headers"])
+        self.assertNotIn(b"set-cookie", dict(rejected["headers"]))
+        self.assertNotIn(b"set-cookie", dict(read["headers"]))
+
+    def test_logs_access_with_account(self):
+        with patch.object(middleware.logger, "info") as info:
+            _request(Response(status_code=204))
+
+        extra = info.call_args.kwargs["extra"]
+        self.assertEqual(extra["status_code"], 204)
+        self.assertEqual(extra["path"], "/api/accounts")
+        self.assertEqual(extra["client"], "127.0.0.1")
+        self.assertEqual(extra["account"], {"id": 7})
+
+    def test_logs_failed_requests_as_server_errors(self):
+        async def failing(scope, receive, send):
+            raise RuntimeError("boom")
+
+        with (
+            patch.object(middleware.logger, "info") as info,
+            self.assertRaises(RuntimeError),
+        ):
+            _request(failing)
+
+        self.assertEqual(info.call_args.kwargs["extra"]["status_code"], 500)
+
+    def test_counts_requests_by_status(self):
+        labels = ("GET", "unmatched", "204")
+        before = http_requests.snapshot()["series"]
+        before = dict((tuple(key), value) for key, value in before).get(labels, 0)
+
+        _request(Response(status_code=204))
+
+        after = dict(
+            (tuple(key), value) for key, value in http_requests.snapshot()["series"]
+        )
+        self.assertEqual(after[labels], before + 1)
+
+
+class RouteTemplateTest(unittest.TestCase):
+    def test_restores_included_router_prefix(self):
+        route = SimpleNamespace(path="/accounts/{target_account_id}")
+
+        self.assertEqual(
+            route_template({"path": "/api/accounts/12", "route": route}),
+            "/api/accounts/{target_account_id}",
+        )
+        self.assertEqual(
+            route_template(
+                {"path": "/health", "route": SimpleNamespace(path="/health")}
+            ),
+            "/health",
+        )
+        self.assertEqual(route_template({"path": "/wp-login.php"}), "unmatched")
+
+
+class AccessLogSamplerTest(unittest.TestCase):
+    def setUp(self):
+        self.sampler = AccessLogSampler(
+            default_rate=1.0,
+            path_rates={"/health": 0.0, "/api/accounts": 0.25, "/api/accounts/me": 1},
+            slow_ms=500,
+        )
+
+    def test_uses_longest_matching_prefix(self):
+        self.assertEqual(self.sampler.rate_for("/api/accounts/me"), 1)
+        self.assertEqual(self.sampler.rate_for("/api/accounts/12"), 0.25)
+        self.assertEqual(self.sampler.rate_for("/health"), 0.0)
+        self.assertEqual(self.sampler.rate_for("/api/auth/login"), 1.0)
+
+    def test_always_keeps_errors_and_slow_requests(self):
+        self.assertIsNone(self.sampler.sample("/health", 200, 1_000_000))
+        self.assertEqual(self.sampler.sample("/health", 503, 1_000_000), 1.0)
+        self.assertEqual(self.sampler.sample("/health", 200, 500_000_000), 1.0)
+
+    def test_samples_successes_at_path_rate(self):
+        with patch.object(middleware.random, "random", side_effect=[0.1, 0.9]):
+            kept = self.sampler.sample("/api/accounts", 200, 0)
+            skipped = self.sampler.sample("/api/accounts", 200, 0)
+
+        self.assertEqual(kept, 0.25)
+        self.assertIsNone(skipped)
+
+
+if __name__ == "__main__":
+    unittest.main()
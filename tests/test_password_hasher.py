@@ -0,0 +1,58 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.crypto import PasswordHasher
+from app.core.error import AppError, ErrorCode
+
+
+class PasswordHasherTest(unittest.TestCase):
+    def setUp(self):
+        self.hasher = PasswordHasher(mode="thread", workers=1, queue_size=1)
+        self.addCleanup(self.hasher.shutdown)
+
+    def test_runs_work_and_records_stats(self):
+        self.assertEqual(self.hasher.run(lambda value: value * 2, 21), 42)
+
+        stats = self.hasher.stats()
+        self.assertEqual(stats["completed"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["rejected"], 0)
+
+    def test_rejects_work_when_queue_is_full(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocked():
+            started.set()
+            release.wait(5)
+
+        with ThreadPoolExecutor(max_workers=2) as callers:
+            running = callers.submit(self.hasher.run, blocked)
+            started.wait(5)
+            queued = callers.submit(self.hasher.run, blocked)
+            self._wait_for_in_flight(2)
+
+            with self.assertRaises(AppError) as context:
+                self.hasher.run(blocked)
+
+            self.assertEqual(context.exception.code, ErrorCode.PASSWORD_HASHER_BUSY)
+            self.assertEqual(context.exception.status_code, 503)
+            self.assertEqual(self.hasher.stats()["queue_depth"], 1)
+
+            release.set()
+            running.result(5)
+            queued.result(5)
+
+        self.assertEqual(self.hasher.stats()["rejected"], 1)
+
+    def _wait_for_in_flight(self, count: int):
+        for _ in range(500):
+            if self.hasher.stats()["in_flight"] == count:
+                return
+            threading.Event().wait(0.01)
+        self.fail(f"in_flight did not reach {count}")
+
+
+if __name__ == "__main__":
+    unittest.main()
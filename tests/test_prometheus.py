@@ -0,0 +1,79 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pydantic_core import to_json
+
+from app.core.metrics import MetricFamily
+from app.core.prometheus import (
+    DEAD_WORKERS_FILE,
+    aggregate,
+    mark_process_dead,
+    read_snapshots,
+    render,
+)
+
+
+def _families(requests: int, in_flight: int, latency: float) -> dict:
+    counter = MetricFamily("requests_total", "counter", "Requests.", ("route",))
+    counter.inc("/a", amount=requests)
+    gauge = MetricFamily("in_flight", "gauge", "In flight.")
+    gauge.inc(amount=in_flight)
+    histogram = MetricFamily("latency_seconds", "histogram", "", ("route",), (0.1, 1))
+    histogram.observe("/a", value=latency)
+    return {family.name: family.snapshot() for family in (counter, gauge, histogram)}
+
+
+class AggregateTest(unittest.TestCase):
+    def test_sums_workers_and_drops_gauges_of_dead_ones(self):
+        merged = aggregate(
+            [
+                (_families(2, 1, 0.05), True),
+                (_families(3, 4, 0.5), True),
+                (_families(5, 7, 5.0), False),
+            ]
+        )
+
+        self.assertEqual(merged["requests_total"]["series"][("/a",)], 10)
+        self.assertEqual(merged["in_flight"]["series"][()], 5)
+        latency = merged["latency_seconds"]["series"][("/a",)]
+        self.assertEqual(latency["buckets"], {"0.1": 1, "1": 2, "+Inf": 3})
+        self.assertEqual(latency["count"], 3)
+
+    def test_renders_text_exposition_format(self):
+        text = render(aggregate([(_families(2, 1, 0.05), True)]))
+
+        self.assertIn("# HELP requests_total Requests.\n", text)
+        self.assertIn("# TYPE requests_total counter\n", text)
+        self.assertIn('requests_total{route="/a"} 2\n', text)
+        self.assertIn("in_flight 1\n", text)
+        self.assertIn('latency_seconds_bucket{route="/a",le="+Inf"} 1\n', text)
+        self.assertIn('latency_seconds_sum{route="/a"} 0.05\n', text)
+        self.assertIn('latency_seconds_count{route="/a"} 1\n', text)
+
+
+class MultiprocessDirectoryTest(unittest.TestCase):
+    def setUp(self):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.directory = temporary.name
+
+    def test_exited_workers_are_folded_into_one_file(self):
+        for pid, requests in ((101, 2), (102, 3), (103, 4)):
+            path = Path(self.directory) / f"{pid}.json"
+            path.write_bytes(to_json(_families(requests, 1, 0.05)))
+
+        mark_process_dead(self.directory, 101)
+        mark_process_dead(self.directory, 102)
+        merged = aggregate(read_snapshots(self.directory))
+
+        self.assertEqual(
+            sorted(path.name for path in Path(self.directory).iterdir()),
+            ["103.json", DEAD_WORKERS_FILE],
+        )
+        self.assertEqual(merged["requests_total"]["series"][("/a",)], 9)
+        self.assertEqual(merged["in_flight"]["series"][()], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
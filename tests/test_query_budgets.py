@@ -0,0 +1,453 @@
+"""Statement budgets per usecase.
+
+Each test runs one usecase against a real database and fails when it issues
+more statements than its budget or repeats an identical SELECT. Set
+TEST_DATABASE_URL to run against Postgres (everything is rolled back);
+otherwise an in-memory SQLite database is used and Postgres-only scenarios
+are skipped. When a change legitimately adds a round trip, raise the budget
+in the same commit so reviewers see it.
+"""
+
+import os
+import unittest
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import BigInteger, create_engine, event
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from app.cli.import_accounts import import_batch
+from app.core.config import config
+from app.core.crypto import generate_token, hash_password, hash_token
+from app.core.database import Base
+from app.core.error import AppError, ErrorCode
+from app.module.account import Account
+from app.module.account.module import account_auth_state_cache
+from app.module.mail_outbox import MailOutboxModule
+from app.module.password_reset_token import PasswordResetToken
+from app.usecase.accounts.bulk_disable import (
+    BulkDisableAccountsInput,
+    BulkDisableAccountsUsecase,
+)
+from app.usecase.accounts.bulk_enable import (
+    BulkEnableAccountsInput,
+    BulkEnableAccountsUsecase,
+)
+from app.usecase.accounts.create import CreateAccountInput, CreateAccountUsecase
+from app.usecase.accounts.disable import DisableAccountInput, DisableAccountUsecase
+from app.usecase.accounts.enable import EnableAccountInput, EnableAccountUsecase
+from app.usecase.accounts.export import ExportAccountsUsecase
+from app.usecase.accounts.get import GetAccountInput, GetAccountUsecase
+from app.usecase.accounts.import_accounts import ImportAccountsUsecase
+from app.usecase.accounts.list import ListAccountsInput, ListAccountsUsecase
+from app.usecase.accounts.update import UpdateAccountInput, UpdateAccountUsecase
+from app.usecase.accounts.update_password import (
+    UpdatePasswordInput,
+    UpdatePasswordUsecase,
+)
+from app.usecase.auth.authorize import AuthorizeAccessTokenUsecase
+from app.usecase.auth.forgot_password import (
+    ForgotPasswordInput,
+    ForgotPasswordUsecase,
+)
+from app.usecase.auth.login import LoginInput, LoginUsecase
+from app.usecase.auth.refresh import RefreshInput, RefreshUsecase
+from app.usecase.auth.reset_password import ResetPasswordInput, ResetPasswordUsecase
+from app.usecase.auth.signup import SignupInput, SignupUsecase
+from app.usecase.auth.verify_reset_password_token import (
+    VerifyResetPasswordTokenInput,
+    VerifyResetPasswordTokenUsecase,
+)
+from app.usecase.mail.dispatch_outbox import DispatchMailOutboxUsecase
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+PASSWORD = "password123"
+
+# Not counted: transaction plumbing whose number depends on the dialect or on
+# this harness (savepoints), not on the usecase.
+_IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(type_, compiler, **kw):
+    # SQLite only autoincrements INTEGER PRIMARY KEY columns.
+    return "INTEGER"
+
+
+def postgres_only(test):
+    return unittest.skipUnless(TEST_DATABASE_URL, "needs TEST_DATABASE_URL")(test)
+
+
+class StatementRecorder:
+    def __init__(self):
+        self.statements: list[tuple[str, str]] = []
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_IGNORED_PREFIXES):
+            self.statements.append((statement, repr(parameters)))
+
+    def duplicate_selects(self) -> list[str]:
+        counts = Counter(
+            entry
+            for entry in self.statements
+            if entry[0].lstrip().upper().startswith("SELECT")
+        )
+        return [statement for (statement, _), count in counts.items() if count > 1]
+
+
+class QueryBudgetTest(unittest.TestCase):
+    def setUp(self):
+        if TEST_DATABASE_URL:
+            self.engine = create_engine(TEST_DATABASE_URL)
+            connection = self.engine.connect()
+            transaction = connection.begin()
+            Base.metadata.create_all(connection)
+            self.db = Session(connection, join_transaction_mode="create_savepoint")
+            self.addCleanup(connection.close)
+            self.addCleanup(transaction.rollback)
+        else:
+            self.engine = create_engine("sqlite://")
+            Base.metadata.create_all(self.engine)
+            self.db = Session(self.engine)
+        self.addCleanup(self.engine.dispose)
+        self.addCleanup(self.db.close)
+
+        for target, name, value in (
+            (config, "PASSWORD_HASH_ROUNDS", 4),
+            (config, "CHANGE_EVENTS_ENABLED", False),
+        ):
+            patcher = patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        account_auth_state_cache.clear()
+        self.addCleanup(account_auth_state_cache.clear)
+
+        self.account = Account(
+            login_id="taro@example.com",
+            email="taro@example.com",
+            password_hash=hash_password(PASSWORD),
+            first_name="Taro",
+            last_name="Yamada",
+        )
+        self.db.add(self.account)
+        self.db.commit()
+        self.account_id = self.account.id
+        # Start every usecase from a cold session, as a request would.
+        self.db.expunge_all()
+
+    @contextmanager
+    def budget(self, statements: int):
+        recorder = StatementRecorder()
+        event.listen(self.engine, "before_cursor_execute", recorder.record)
+        try:
+            yield
+        finally:
+            event.remove(self.engine, "before_cursor_execute", recorder.record)
+
+        issued = [statement for statement, _ in recorder.statements]
+        self.assertLessEqual(
+            len(issued),
+            statements,
+            "statement budget exceeded:\n" + "\n".join(issued),
+        )
+        self.assertEqual(recorder.duplicate_selects(), [], "duplicate SELECTs")
+
+    def _create_reset_token(self, expires_in: timedelta) -> str:
+        raw_token = generate_token()
+        self.db.add(
+            PasswordResetToken(
+                account_id=self.account_id,
+                token_hash=hash_token(raw_token),
+                expires_at=datetime.now(timezone.utc) + expires_in,
+            )
+        )
+        self.db.commit()
+        self.db.expunge_all()
+        return raw_token
+
+    # === accounts ===
+
+    def _create_account(self, email: str):
+        return CreateAccountUsecase(self.db).execute(
+            CreateAccountInput(
+                login_id=None,
+                email=email,
+                password=PASSWORD,
+                first_name="Hanako",
+                last_name="Yamada",
+            )
+        )
+
+    def test_create_account(self):
+        with self.budget(1):
+            account = self._create_account("hanako@example.com")
+
+        self.assertIsNotNone(account.id)
+        self.assertEqual(account.token_version, 1)
+        self.assertIsNotNone(account.created_at)
+
+    def test_create_account_conflict(self):
+        with self.budget(1), self.assertRaises(AppError) as context:
+            self._create_account("taro@example.com")
+
+        self.assertEqual(context.exception.code, ErrorCode.LOGIN_ID_ALREADY_EXISTS)
+
+    def test_get_account(self):
+        with self.budget(1):
+            GetAccountUsecase(self.db).execute(
+                GetAccountInput(account_id=self.account_id)
+            )
+
+    def test_list_accounts(self):
+        with self.budget(1):
+            ListAccountsUsecase(self.db).execute(ListAccountsInput(limit=50))
+
+    def test_export_accounts(self):
+        with self.budget(1):
+            for _ in ExportAccountsUsecase(self.db).execute():
+                pass
+
+    def _update_account(self, account_id: int, email: str, password: str | None = None):
+        return UpdateAccountUsecase(self.db).execute(
+            UpdateAccountInput(
+                account_id=account_id,
+                login_id=None,
+                email=email,
+                first_name="Taro",
+                last_name="Suzuki",
+                password=password,
+            )
+        )
+
+    def test_update_account(self):
+        with self.budget(1):
+            account = self._update_account(self.account_id, "taro@example.com")
+
+        self.assertEqual(account.last_name, "Suzuki")
+
+    def test_update_account_conflict(self):
+        other_id = self._create_account("hanako@example.com").id
+        self.db.expunge_all()
+
+        with self.budget(1), self.assertRaises(AppError) as context:
+            self._update_account(other_id, "taro@example.com")
+
+        self.assertEqual(context.exception.code, ErrorCode.LOGIN_ID_ALREADY_EXISTS)
+
+    def test_update_account_not_found(self):
+        with self.budget(1), self.assertRaises(AppError) as context:
+            self._update_account(self.account_id + 1, "jiro@example.com")
+
+        self.assertEqual(context.exception.code, ErrorCode.ACCOUNT_NOT_FOUND)
+
+    def test_update_account_password(self):
+        # An existence check before hashing, then the UPDATE.
+        with self.budget(2):
+            account = self._update_account(
+                self.account_id, "taro@example.com", password="new-password123"
+            )
+
+        self.assertEqual(account.token_version, 2)
+
+    def test_update_account_password_not_found_skips_hashing(self):
+        with (
+            patch("app.usecase.accounts.update.hash_password") as hash_password,
+            self.budget(1),
+            self.assertRaises(AppError) as context,
+        ):
+            self._update_account(
+                self.account_id + 1, "jiro@example.com", password="new-password123"
+            )
+
+        self.assertEqual(context.exception.code, ErrorCode.ACCOUNT_NOT_FOUND)
+        hash_password.assert_not_called()
+
+    def test_update_password(self):
+        with self.budget(2):
+            UpdatePasswordUsecase(self.db).execute(
+                UpdatePasswordInput(
+                    account_id=self.account_id,
+                    old_password=PASSWORD,
+                    new_password="new-password123",
+                )
+            )
+
+    def test_update_password_rejects_concurrent_change(self):
+        usecase = UpdatePasswordUsecase(self.db)
+        current_hash = usecase.module.get_by_id(self.account_id).password_hash
+        usecase.module.change_password(self.account_id, current_hash, "changed")
+        self.db.commit()
+        self.db.expunge_all()
+
+        with patch.object(usecase.module, "get_by_id") as get_by_id:
+            # Simulate a read that happened before the concurrent change.
+            get_by_id.return_value = Account(
+                id=self.account_id, password_hash=current_hash
+            )
+            with self.assertRaises(AppError) as context:
+                usecase.execute(
+                    UpdatePasswordInput(
+                        account_id=self.account_id,
+                        old_password=PASSWORD,
+                        new_password="new-password123",
+                    )
+                )
+
+        self.assertEqual(context.exception.code, ErrorCode.OPTIMISTIC_LOCK_CONFLICT)
+
+    def test_disable_account(self):
+        with self.budget(1):
+            account = DisableAccountUsecase(self.db).execute(
+                DisableAccountInput(account_id=self.account_id)
+            )
+
+        self.assertIsNotNone(account.disabled_at)
+        self.assertEqual(account.token_version, 2)
+
+    def test_enable_account(self):
+        with self.budget(1):
+            account = EnableAccountUsecase(self.db).execute(
+                EnableAccountInput(account_id=self.account_id)
+            )
+
+        self.assertIsNone(account.disabled_at)
+
+    def test_bulk_disable_and_enable_accounts(self):
+        other_id = self._create_account("hanako@example.com").id
+        self.db.commit()
+        self.db.expunge_all()
+        account_ids = [other_id, self.account_id, other_id, self.account_id + 100]
+
+        with (
+            patch("app.module.account.module.BULK_UPDATE_CHUNK_SIZE", 1),
+            self.budget(3),
+        ):
+            disabled_ids = BulkDisableAccountsUsecase(self.db).execute(
+                BulkDisableAccountsInput(account_ids=account_ids)
+            )
+        self.assertEqual(disabled_ids, [self.account_id, other_id])
+        self.assertEqual(self.db.get(Account, self.account_id).token_version, 2)
+
+        with self.budget(1):
+            self.assertEqual(
+                BulkDisableAccountsUsecase(self.db).execute(
+                    BulkDisableAccountsInput(account_ids=[self.account_id])
+                ),
+                [],
+            )
+        with self.budget(1):
+            enabled_ids = BulkEnableAccountsUsecase(self.db).execute(
+                BulkEnableAccountsInput(account_ids=account_ids)
+            )
+        self.assertEqual(enabled_ids, [self.account_id, other_id])
+
+    def test_import_accounts_batch(self):
+        def row(email, password=PASSWORD):
+            return {
+                "login_id": None,
+                "email": email,
+                "password": password,
+                "first_name": "Hanako",
+                "last_name": "Yamada",
+            }
+
+        rows = [
+            (2, row("hanako@example.com")),
+            (3, row("taro@example.com")),
+            (4, row("hanako@example.com")),
+            (5, row("jiro@example.com", password="short")),
+            (6, row("saburo@example.com")),
+        ]
+        with ThreadPoolExecutor(2) as executor:
+            usecase = ImportAccountsUsecase(self.db, executor)
+            with self.budget(2):
+                results = dict(import_batch(usecase, rows))
+
+        self.assertEqual(
+            {line: result.status for line, result in results.items()},
+            {2: "created", 3: "conflict", 4: "conflict", 5: "invalid", 6: "created"},
+        )
+        self.assertEqual(results[3].error, ErrorCode.LOGIN_ID_ALREADY_EXISTS)
+        self.assertEqual(results[5].error, "VALIDATION_ERROR: password")
+        self.assertIsNotNone(results[6].account_id)
+
+    # === auth ===
+
+    def test_signup(self):
+        with self.budget(1):
+            SignupUsecase(self.db).execute(
+                SignupInput(
+                    login_id=None,
+                    email="hanako@example.com",
+                    password=PASSWORD,
+                    first_name="Hanako",
+                    last_name="Yamada",
+                )
+            )
+
+    def test_login(self):
+        with self.budget(1):
+            LoginUsecase(self.db).execute(
+                LoginInput(
+                    login_id="taro@example.com",
+                    password=PASSWORD,
+                    remember_me=False,
+                )
+            )
+
+    def test_refresh(self):
+        with self.budget(1):
+            RefreshUsecase(self.db).execute(
+                RefreshInput(sub=str(self.account_id), token_version=1)
+            )
+
+    def test_authorize_access_token_uses_cache(self):
+        payload = {"sub": str(self.account_id), "token_version": 1}
+        with self.budget(1):
+            AuthorizeAccessTokenUsecase(self.db).execute(payload)
+            AuthorizeAccessTokenUsecase(self.db).execute(payload)
+
+    def test_forgot_password(self):
+        with self.budget(6):
+            ForgotPasswordUsecase(self.db).execute(
+                ForgotPasswordInput(email="taro@example.com")
+            )
+
+    @postgres_only
+    def test_verify_reset_password_token(self):
+        raw_token = self._create_reset_token(timedelta(minutes=30))
+
+        with self.budget(1):
+            VerifyResetPasswordTokenUsecase(self.db).execute(
+                VerifyResetPasswordTokenInput(token=raw_token)
+            )
+
+    @postgres_only
+    def test_reset_password(self):
+        raw_token = self._create_reset_token(timedelta(minutes=30))
+
+        with self.budget(4):
+            ResetPasswordUsecase(self.db).execute(
+                ResetPasswordInput(token=raw_token, new_password="new-password123")
+            )
+
+    # === mail ===
+
+    def test_dispatch_mail_outbox(self):
+        module = MailOutboxModule(self.db)
+        for recipient in ("a@example.com", "b@example.com", "c@example.com"):
+            module.enqueue(recipient=recipient, subject="Hello", body="Body")
+        self.db.commit()
+        self.db.expunge_all()
+
+        # One claim, then one write per message.
+        with self.budget(4):
+            DispatchMailOutboxUsecase(self.db, MagicMock()).execute()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from fastapi import Depends, FastAPI, Request
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.core import database
+from app.core.database import (
+    PRIMARY_PIN_COOKIE,
+    get_async_db,
+    get_db,
+    get_read_db,
+    is_pinned_to_primary,
+    primary_pin_cookie,
+)
+from app.core.jwt import verify_access_token
+from app.handler._dependency import async_db_for, db_for, get_account_id
+from app.module.account import Account
+from app.module.account.module import account_auth_state_cache
+from app.usecase.accounts.list import ListAccountsUsecase
+from app.usecase.accounts.update import UpdateAccountUsecase
+from app.usecase.auth.authorize import (
+    AsyncAuthorizeAccessTokenUsecase,
+    AuthorizeAccessTokenUsecase,
+)
+
+
+def _request(cookie: str | None = None) -> Request:
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "headers": headers})
+
+
+class ReadReplicaRoutingTest(unittest.TestCase):
+    def setUp(self):
+        self.replica = create_engine("sqlite://")
+        self.addCleanup(self.replica.dispose)
+        patcher = patch.object(database, "replica_engines", [self.replica])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_read_only_usecases_use_read_sessions(self):
+        self.assertIs(db_for(ListAccountsUsecase), get_read_db)
+        self.assertIs(db_for(UpdateAccountUsecase), get_db)
+
+    def test_auth_state_is_read_from_primary(self):
+        # Cached auth state must never come from a lagging replica.
+        self.assertIs(db_for(AuthorizeAccessTokenUsecase), get_db)
+        self.assertIs(async_db_for(AsyncAuthorizeAccessTokenUsecase), get_async_db)
+
+    def test_read_sessions_use_replica_in_read_only_mode(self):
+        primary = database.SessionLocal()
+        db = next(get_read_db(_request(), primary))
+
+        self.assertIsNot(db, primary)
+        self.assertIs(db.get_bind(), self.replica)
+        self.assertTrue(db.info["read_only"])
+
+    def test_pinned_clients_read_from_primary(self):
+        cookie = primary_pin_cookie().split(";")[0]
+
+        primary = database.SessionLocal()
+        db = next(get_read_db(_request(cookie), primary))
+
+        self.assertIs(db, primary)
+        self.assertNotIn("read_only", db.info)
+
+    def test_without_replicas_the_request_session_is_reused(self):
+        primary = database.SessionLocal()
+        with patch.object(database, "replica_engines", []):
+            db = next(get_read_db(_request(), primary))
+
+        self.assertIs(db, primary)
+        self.assertNotIn("read_only", db.info)
+
+    def test_expired_or_malformed_pins_are_ignored(self):
+        expired = f"{PRIMARY_PIN_COOKIE}={int(time.time()) - 1}"
+
+        self.assertFalse(is_pinned_to_primary(_request(expired)))
+        self.assertFalse(is_pinned_to_primary(_request(f"{PRIMARY_PIN_COOKIE}=x")))
+
+
+class PrimaryReadConnectionTest(unittest.TestCase):
+    def setUp(self):
+        # One connection and no overflow: a second checkout in the same request
+        # would time out instead of passing silently.
+        self.engine = create_engine(
+            "sqlite://",
+            poolclass=QueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.5,
+            connect_args={"check_same_thread": False},
+        )
+        self.addCleanup(self.engine.dispose)
+        Account.__table__.create(self.engine)
+        with Session(self.engine) as db:
+            db.add(
+                Account(
+                    id=1,
+                    login_id="taro",
+                    password_hash="secret-hash",
+                    first_name="Taro",
+                    last_name="Yamada",
+                )
+            )
+            db.commit()
+
+        self.checkouts = 0
+        event.listen(self.engine, "checkout", self._count_checkout)
+        for target, name, value in (
+            (database, "engine", self.engine),
+            (database, "SessionLocal", sessionmaker(self.engine)),
+            (database, "replica_engines", []),
+        ):
+            patcher = patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        account_auth_state_cache.clear()
+        self.addCleanup(account_auth_state_cache.clear)
+
+    def _count_checkout(self, *args):
+        self.checkouts += 1
+
+    def test_authenticated_read_uses_one_connection(self):
+        app = FastAPI()
+        app.dependency_overrides[verify_access_token] = lambda: {
+            "sub": "1",
+            "token_version": 1,
+        }
+
+        @app.get("/accounts")
+        def read_accounts(
+            account_id: int = Depends(get_account_id),
+            db: Session = Depends(db_for(ListAccountsUsecase)),
+        ):
+            return {"count": db.scalar(select(func.count(Account.id)))}
+
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/accounts",
+            "raw_path": b"/accounts",
+            "query_string": b"",
+            "headers": [],
+        }
+        asyncio.run(app(scope, receive, send))
+
+        self.assertEqual(messages[0]["status"], 200)
+        self.assertEqual(self.checkouts, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import unittest
+from datetime import datetime, timezone
+
+from fastapi import Response
+
+from app.core.response import ApiResponse
+from app.handler.dto.accounts import AccountResponse, GetAccountsResponse
+
+
+class ApiResponseTest(unittest.TestCase):
+    def setUp(self):
+        self.data = GetAccountsResponse(
+            accounts=[
+                AccountResponse(
+                    id=1,
+                    email=None,
+                    login_id="user",
+                    first_name="First",
+                    last_name="Last",
+                    created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                    updated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                )
+            ],
+            next_cursor=None,
+        )
+
+    def test_serializes_dto_in_one_pass(self):
+        response = ApiResponse.created(data=self.data)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertEqual(json.loads(response.body), self.data.model_dump(mode="json"))
+        self.assertEqual(
+            int(response.headers["content-length"]),
+            len(response.body),
+        )
+
+    def test_serializes_plain_error_payloads(self):
+        response = ApiResponse.error(
+            data={"code": "BAD_REQUEST", "details": {}},
+            status_code=400,
+        )
+
+        self.assertEqual(json.loads(response.body)["code"], "BAD_REQUEST")
+
+    def test_keeps_repeated_headers_from_handler_response(self):
+        handler_response = Response()
+        handler_response.set_cookie("a", "1")
+        handler_response.set_cookie("b", "2")
+        handler_response.headers["Cache-Control"] = "no-store"
+
+        for response in (
+            ApiResponse.ok(data={"ok": True}, response=handler_response),
+            ApiResponse.no_content(response=handler_response),
+        ):
+            with self.subTest(status_code=response.status_code):
+                cookies = response.headers.getlist("set-cookie")
+                self.assertEqual([cookie[:3] for cookie in cookies], ["a=1", "b=2"])
+                self.assertEqual(response.headers["cache-control"], "no-store")
+                self.assertLessEqual(len(response.headers.getlist("content-length")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,15 @@
 import unittest
+from unittest.mock import patch
 
 from pydantic import ValidationError
 
 from app.core.config import Config
-from app.core.crypto import hash_password, verify_password
+from app.core.crypto import (
+    hash_password,
+    needs_rehash,
+    password_hash_rounds,
+    verify_password,
+)
 from app.core.jwt import create_token_pair, decode_access_token, decode_refresh_token
 
 
@@ -15,6 +21,17 @@ class SecurityTest(unittest.TestCase):
         self.assertTrue(verify_password("Password123!", password_hash))
         self.assertFalse(verify_password("WrongPassword", password_hash))
 
+    def test_password_hash_uses_configured_rounds(self):
+        with patch("app.core.crypto.config.PASSWORD_HASH_ROUNDS", 5):
+            password_hash = hash_password("Password123!")
+            self.assertEqual(password_hash_rounds(password_hash), 5)
+            self.assertFalse(needs_rehash(password_hash))
+
+        with patch("app.core.crypto.config.PASSWORD_HASH_ROUNDS", 6):
+            self.assertTrue(needs_rehash(password_hash))
+
+        self.assertFalse(needs_rehash("not-a-bcrypt-hash"))
+
     def test_token_pair_round_trip(self):
         access_token, refresh_token = create_token_pair(42, 3)
 